@@ -1,23 +1,44 @@
 from __future__ import annotations
 
-import requests
+#requests, bs4, lxml and dateutil are imported on first use to keep imports cheap
+import io
+import re
+import time
+import random
+import threading
 import urllib.parse
-from bs4 import BeautifulSoup
+from array import array
+from collections import deque
+from functools import lru_cache
+from collections.abc import Sequence
+from types import MappingProxyType, SimpleNamespace
 
 from enum import Enum, Flag, auto
 from dataclasses import dataclass, asdict, is_dataclass
-from json import dumps as jsonDumps, JSONEncoder
+from json import dumps as jsonDumps, loads as jsonLoads, JSONEncoder
+from json.encoder import encode_basestring_ascii as _jsonString
+
+import SerbiaTrainStationData
 
 class DataclassJSONEncoder(JSONEncoder):
     def default(self, obj):
         if is_dataclass(obj):
             return asdict(obj)  # handles nested dataclasses
-        if isinstance(obj, (Enum, Flag)):
+        if isinstance(obj, (Enum, Flag, Station)):
             return str(obj)      # or use obj.value if you prefer numbers
+        if isinstance(obj, ColumnarArrivals):
+            return list(obj)
         return super().default(obj)
 
 import datetime
-from dateutil.parser import parse as parse_date
+
+from typing import TYPE_CHECKING, Iterable, Iterator, TextIO
+
+if TYPE_CHECKING:
+    import requests
+    import concurrent.futures
+    from SerbiaTrainCache import TimeTableCache
+    from SerbiaTrainStore import TimeTableStore
 
 API_BASE_URL="https://w3.srbvoz.rs/redvoznje//api"
 WEB_BASE_URL="https://w3.srbvoz.rs/redvoznje"
@@ -28,6 +49,9 @@ class TrainException(Exception):
             
         self.errors = errors
 
+class CircuitOpenError(TrainException):
+    pass
+
 class TrainType(Enum):
     COMMUTER_TRAIN=1,
     INTER_CITY=2,
@@ -51,497 +75,1241 @@ class TrainType(Enum):
             case _:
                 TrainException("Unknown train type")
 
-class Station(Enum):
-    KEMENDIN_ST = {'name': 'Kemendin st', 'id': '01016', 'safe name': 'KEMENDIN_ST'}
-    ALTINA_ST = {'name': 'Altina st', 'id': '01017', 'safe name': 'ALTINA_ST'}
-    DOLJEVAC = {'name': 'DOLJEVAC', 'id': '11001', 'safe name': 'DOLJEVAC'}
-    KOCANE = {'name': 'KOCANE', 'id': '11002', 'safe name': 'KOCANE'}
-    PUKOVAC = {'name': 'PUKOVAC', 'id': '11003', 'safe name': 'PUKOVAC'}
-    BRESTOVAC = {'name': 'BRESTOVAC', 'id': '11004', 'safe name': 'BRESTOVAC'}
-    LIPOVICA = {'name': 'LIPOVICA', 'id': '11005', 'safe name': 'LIPOVICA'}
-    PECENJEVCE = {'name': 'PEČENJEVCE', 'id': '11006', 'safe name': 'PECENJEVCE'}
-    ZIVKOVO = {'name': 'ŽIVKOVO', 'id': '11007', 'safe name': 'ZIVKOVO'}
-    LESKOVAC = {'name': 'LESKOVAC', 'id': '11050', 'safe name': 'LESKOVAC'}
-    SAJINOVAC = {'name': 'ŠAJINOVAC', 'id': '11101', 'safe name': 'SAJINOVAC'}
-    JASENICA = {'name': 'JASENICA', 'id': '11102', 'safe name': 'JASENICA'}
-    RECICA = {'name': 'REČICA', 'id': '11104', 'safe name': 'RECICA'}
-    PODINA = {'name': 'PODINA', 'id': '11105', 'safe name': 'PODINA'}
-    PROKUPLJE = {'name': 'PROKUPLJE', 'id': '11106', 'safe name': 'PROKUPLJE'}
-    LUKOMIR = {'name': 'LUKOMIR', 'id': '11119', 'safe name': 'LUKOMIR'}
-    TOPLICKI_BADNJEVAC = {'name': 'TOPLIČKI BADNJEVAC', 'id': '11121', 'safe name': 'TOPLICKI_BADNJEVAC'}
-    ZITORADJA_CENTAR = {'name': 'ŽITORADJA CENTAR', 'id': '11129', 'safe name': 'ZITORADJA_CENTAR'}
-    LESAK = {'name': 'LEŠAK', 'id': '12001', 'safe name': 'LESAK'}
-    DREN = {'name': 'DREN', 'id': '12002', 'safe name': 'DREN'}
-    LEPOSAVIC = {'name': 'LEPOSAVIĆ', 'id': '12003', 'safe name': 'LEPOSAVIC'}
-    SOCANICA = {'name': 'SOČANICA', 'id': '12004', 'safe name': 'SOCANICA'}
-    IBARSKA_SLATINA = {'name': 'IBARSKA SLATINA', 'id': '12005', 'safe name': 'IBARSKA_SLATINA'}
-    BANJSKA = {'name': 'BANJSKA', 'id': '12006', 'safe name': 'BANJSKA'}
-    VALAC = {'name': 'VALAČ', 'id': '12007', 'safe name': 'VALAC'}
-    ZVECAN = {'name': 'ZVEČAN', 'id': '12008', 'safe name': 'ZVECAN'}
-    PLANDISTE = {'name': 'PLANDIŠTE', 'id': '12019', 'safe name': 'PLANDISTE'}
-    PRIDVORICA = {'name': 'PRIDVORICA', 'id': '12021', 'safe name': 'PRIDVORICA'}
-    KOSOVSKA_MITROVICA_SEVER = {'name': 'KOSOVSKA MITROVICA SEVER', 'id': '12022', 'safe name': 'KOSOVSKA_MITROVICA_SEVER'}
-    MATARUSKA_BANJA = {'name': 'MATARUŠKA BANJA', 'id': '12101', 'safe name': 'MATARUSKA_BANJA'}
-    PROGORELICA = {'name': 'PROGORELICA', 'id': '12102', 'safe name': 'PROGORELICA'}
-    BOGUTOVACKA_BANJA = {'name': 'BOGUTOVAČKA BANJA', 'id': '12103', 'safe name': 'BOGUTOVACKA_BANJA'}
-    POLUMIR = {'name': 'POLUMIR', 'id': '12105', 'safe name': 'POLUMIR'}
-    USCE = {'name': 'UŠĆE', 'id': '12106', 'safe name': 'USCE'}
-    JOSANICKA_BANJA = {'name': 'JOŠANIČKA BANJA', 'id': '12107', 'safe name': 'JOSANICKA_BANJA'}
-    PISKANJA = {'name': 'PISKANJA', 'id': '12108', 'safe name': 'PISKANJA'}
-    BRVENIK = {'name': 'BRVENIK', 'id': '12109', 'safe name': 'BRVENIK'}
-    RVATI = {'name': 'RVATI', 'id': '12110', 'safe name': 'RVATI'}
-    RASKA = {'name': 'RAŠKA', 'id': '12111', 'safe name': 'RASKA'}
-    KAZNOVICI = {'name': 'KAZNOVIĆI', 'id': '12112', 'safe name': 'KAZNOVICI'}
-    RUDNICA = {'name': 'RUDNICA', 'id': '12113', 'safe name': 'RUDNICA'}
-    JERINA_STAJ = {'name': 'JERINA STAJ', 'id': '12114', 'safe name': 'JERINA_STAJ'}
-    LOZNO = {'name': 'LOZNO', 'id': '12115', 'safe name': 'LOZNO'}
-    PUSTO_POLJE = {'name': 'PUSTO POLJE', 'id': '12116', 'safe name': 'PUSTO_POLJE'}
-    MRZENICA = {'name': 'MRZENICA', 'id': '12201', 'safe name': 'MRZENICA'}
-    DEDINA = {'name': 'DEDINA', 'id': '12203', 'safe name': 'DEDINA'}
-    KRUSEVAC = {'name': 'KRUŠEVAC', 'id': '12204', 'safe name': 'KRUSEVAC'}
-    KOSEVI = {'name': 'KOŠEVI', 'id': '12205', 'safe name': 'KOSEVI'}
-    STOPANJA = {'name': 'STOPANJA', 'id': '12207', 'safe name': 'STOPANJA'}
-    POCEKOVINA = {'name': 'POCEKOVINA', 'id': '12208', 'safe name': 'POCEKOVINA'}
-    TRSTENIK = {'name': 'TRSTENIK', 'id': '12210', 'safe name': 'TRSTENIK'}
-    VRNJACKA_BANJA = {'name': 'VRNJAČKA BANJA', 'id': '12211', 'safe name': 'VRNJACKA_BANJA'}
-    LIPOVA_STA = {'name': 'LIPOVA STA', 'id': '12212', 'safe name': 'LIPOVA_STA'}
-    PODUNAVCI = {'name': 'PODUNAVCI', 'id': '12213', 'safe name': 'PODUNAVCI'}
-    VRBA_STAJ = {'name': 'VRBA STAJ', 'id': '12214', 'safe name': 'VRBA_STAJ'}
-    RATINA = {'name': 'RATINA', 'id': '12215', 'safe name': 'RATINA'}
-    TOMINAC_STA = {'name': 'TOMINAC STA', 'id': '12216', 'safe name': 'TOMINAC_STA'}
-    VRANESI_STAJ = {'name': 'VRANEŠI STAJ', 'id': '12217', 'safe name': 'VRANESI_STAJ'}
-    CITLUK = {'name': 'ČITLUK', 'id': '12218', 'safe name': 'CITLUK'}
-    GRAD_STALAC_STA = {'name': 'GRAD STALAĆ STA', 'id': '12219', 'safe name': 'GRAD_STALAC_STA'}
-    BELOTINCE = {'name': 'BELOTINCE', 'id': '12302', 'safe name': 'BELOTINCE'}
-    MALOSISTE = {'name': 'MALOŠIŠTE', 'id': '12303', 'safe name': 'MALOSISTE'}
-    CAPLJINAC = {'name': 'ČAPLJINAC', 'id': '12304', 'safe name': 'CAPLJINAC'}
-    BRALJINA = {'name': 'BRALJINA', 'id': '12502', 'safe name': 'BRALJINA'}
-    STARO_TRUBAREVO = {'name': 'STARO TRUBAREVO', 'id': '12503', 'safe name': 'STARO_TRUBAREVO'}
-    DJUNIS = {'name': 'ĐUNIS', 'id': '12504', 'safe name': 'DJUNIS'}
-    VITKOVAC_STAJ = {'name': 'VITKOVAC STAJ.', 'id': '12505', 'safe name': 'VITKOVAC_STAJ.'}
-    DONJI_LJUBES = {'name': 'DONJI LJUBEŠ', 'id': '12506', 'safe name': 'DONJI_LJUBES'}
-    KORMAN = {'name': 'KORMAN', 'id': '12507', 'safe name': 'KORMAN'}
-    TRNJANI = {'name': 'TRNJANI', 'id': '12508', 'safe name': 'TRNJANI'}
-    ADROVAC = {'name': 'ADROVAC', 'id': '12509', 'safe name': 'ADROVAC'}
-    ALEKSINAC = {'name': 'ALEKSINAC', 'id': '12510', 'safe name': 'ALEKSINAC'}
-    LUZANE = {'name': 'LUŽANE', 'id': '12511', 'safe name': 'LUZANE'}
-    TESICA = {'name': 'TEŠICA', 'id': '12512', 'safe name': 'TESICA'}
-    GREJAC = {'name': 'GREJAČ', 'id': '12513', 'safe name': 'GREJAC'}
-    SUPOVACKI_MOST = {'name': 'SUPOVAČKI MOST', 'id': '12514', 'safe name': 'SUPOVACKI_MOST'}
-    MEZGRAJA = {'name': 'MEZGRAJA', 'id': '12515', 'safe name': 'MEZGRAJA'}
-    TRUPALE = {'name': 'TRUPALE', 'id': '12516', 'safe name': 'TRUPALE'}
-    CEROVO_RAZANJ = {'name': 'CEROVO RAŽANJ', 'id': '12517', 'safe name': 'CEROVO_RAZANJ'}
-    VRTISTE = {'name': 'VRTIŠTE', 'id': '12518', 'safe name': 'VRTISTE'}
-    GORNJI_LJUBES = {'name': 'GORNJI LJUBEŠ', 'id': '12519', 'safe name': 'GORNJI_LJUBES'}
-    NOZRINA = {'name': 'NOZRINA', 'id': '12520', 'safe name': 'NOZRINA'}
-    CRVENI_KRST = {'name': 'CRVENI KRST', 'id': '12550', 'safe name': 'CRVENI_KRST'}
-    NIS = {'name': 'NIŠ', 'id': '12551', 'safe name': 'NIS'}
-    ADRANI = {'name': 'ADRANI', 'id': '13001', 'safe name': 'ADRANI'}
-    MRSAC = {'name': 'MRSAĆ', 'id': '13002', 'safe name': 'MRSAC'}
-    SAMAILA = {'name': 'SAMAILA', 'id': '13003', 'safe name': 'SAMAILA'}
-    GORICANI = {'name': 'GORIČANI', 'id': '13004', 'safe name': 'GORICANI'}
-    MRSINCI = {'name': 'MRSINCI', 'id': '13005', 'safe name': 'MRSINCI'}
-    ZABLACE = {'name': 'ZABLAĆE', 'id': '13006', 'safe name': 'ZABLACE'}
-    PRIJEVOR = {'name': 'PRIJEVOR', 'id': '13007', 'safe name': 'PRIJEVOR'}
-    OVCAR_BANJA = {'name': 'OVČAR BANJA', 'id': '13008', 'safe name': 'OVCAR_BANJA'}
-    DRAGACEVO = {'name': 'DRAGAČEVO', 'id': '13009', 'safe name': 'DRAGACEVO'}
-    TRBUSANI = {'name': 'TRBUŠANI', 'id': '13010', 'safe name': 'TRBUSANI'}
-    BORACKO = {'name': 'BORAČKO', 'id': '13011', 'safe name': 'BORACKO'}
-    BALUGA = {'name': 'BALUGA', 'id': '13012', 'safe name': 'BALUGA'}
-    JELEN_DO = {'name': 'JELEN DO', 'id': '13013', 'safe name': 'JELEN_DO'}
-    KUKICI = {'name': 'KUKIĆI', 'id': '13014', 'safe name': 'KUKICI'}
-    GUGALJ_STA = {'name': 'GUGALJ STA', 'id': '13015', 'safe name': 'GUGALJ_STA'}
-    CACAK = {'name': 'ČAČAK', 'id': '13060', 'safe name': 'CACAK'}
-    BATOCINA = {'name': 'BATOČINA', 'id': '13201', 'safe name': 'BATOCINA'}
-    GRADAC = {'name': 'GRADAC', 'id': '13202', 'safe name': 'GRADAC'}
-    BADNJEVAC = {'name': 'BADNJEVAC', 'id': '13203', 'safe name': 'BADNJEVAC'}
-    RESNIK_KRAGUJEVACKI = {'name': 'RESNIK KRAGUJEVAČKI', 'id': '13204', 'safe name': 'RESNIK_KRAGUJEVACKI'}
-    MILATOVAC = {'name': 'MILATOVAC', 'id': '13205', 'safe name': 'MILATOVAC'}
-    JOVANOVAC = {'name': 'JOVANOVAC', 'id': '13207', 'safe name': 'JOVANOVAC'}
-    ZAVOD = {'name': 'ZAVOD', 'id': '13209', 'safe name': 'ZAVOD'}
-    GROSNICA = {'name': 'GROŠNICA', 'id': '13210', 'safe name': 'GROSNICA'}
-    DRAGOBRACA = {'name': 'DRAGOBRAĆA', 'id': '13211', 'safe name': 'DRAGOBRACA'}
-    KNIC = {'name': 'KNIĆ', 'id': '13213', 'safe name': 'KNIC'}
-    GRUZA = {'name': 'GRUŽA', 'id': '13214', 'safe name': 'GRUZA'}
-    GUBEREVAC = {'name': 'GUBEREVAC', 'id': '13215', 'safe name': 'GUBEREVAC'}
-    VITKOVAC = {'name': 'VITKOVAC', 'id': '13216', 'safe name': 'VITKOVAC'}
-    MILAVCICI = {'name': 'MILAVČIĆI', 'id': '13217', 'safe name': 'MILAVCICI'}
-    VITANOVAC = {'name': 'VITANOVAC', 'id': '13218', 'safe name': 'VITANOVAC'}
-    SUMARICE = {'name': 'ŠUMARICE', 'id': '13219', 'safe name': 'SUMARICE'}
-    SIRCA = {'name': 'SIRČA', 'id': '13220', 'safe name': 'SIRCA'}
-    TOMICA_BRDO = {'name': 'TOMIĆA BRDO', 'id': '13221', 'safe name': 'TOMICA_BRDO'}
-    KRAGUJEVAC = {'name': 'KRAGUJEVAC', 'id': '13250', 'safe name': 'KRAGUJEVAC'}
-    KRALJEVO = {'name': 'KRALJEVO', 'id': '13251', 'safe name': 'KRALJEVO'}
-    BRZAN = {'name': 'BRZAN', 'id': '13301', 'safe name': 'BRZAN'}
-    MILOSEVO = {'name': 'MILOŠEVO', 'id': '13302', 'safe name': 'MILOSEVO'}
-    BAGRDAN = {'name': 'BAGRDAN', 'id': '13303', 'safe name': 'BAGRDAN'}
-    LANISTE = {'name': 'LANIŠTE', 'id': '13304', 'safe name': 'LANISTE'}
-    BUKOVCE = {'name': 'BUKOVČE', 'id': '13305', 'safe name': 'BUKOVCE'}
-    GILJE = {'name': 'GILJE', 'id': '13307', 'safe name': 'GILJE'}
-    PARACIN = {'name': 'PARAĆIN', 'id': '13310', 'safe name': 'PARACIN'}
-    SIKIRICA_RATARI = {'name': 'SIKIRICA-RATARI', 'id': '13311', 'safe name': 'SIKIRICA-RATARI'}
-    DRENOVAC = {'name': 'DRENOVAC', 'id': '13312', 'safe name': 'DRENOVAC'}
-    CICEVAC = {'name': 'ĆIĆEVAC', 'id': '13313', 'safe name': 'CICEVAC'}
-    LUCINA = {'name': 'LUČINA', 'id': '13314', 'safe name': 'LUCINA'}
-    JAGODINA = {'name': 'JAGODINA', 'id': '13350', 'safe name': 'JAGODINA'}
-    CUPRIJA = {'name': 'ĆUPRIJA', 'id': '13351', 'safe name': 'CUPRIJA'}
-    STALAC = {'name': 'STALAĆ', 'id': '13352', 'safe name': 'STALAC'}
-    VELIKA_PLANA = {'name': 'VELIKA PLANA', 'id': '13401', 'safe name': 'VELIKA_PLANA'}
-    STARO_SELO = {'name': 'STARO SELO', 'id': '13402', 'safe name': 'STARO_SELO'}
-    NOVO_SELO = {'name': 'NOVO SELO', 'id': '13403', 'safe name': 'NOVO_SELO'}
-    MARKOVAC = {'name': 'MARKOVAC', 'id': '13404', 'safe name': 'MARKOVAC'}
-    LAPOVO_VAROS = {'name': 'LAPOVO VAROŠ', 'id': '13405', 'safe name': 'LAPOVO_VAROS'}
-    LAPOVO_RANZ_STAJ = {'name': 'LAPOVO RANŽ.STAJ.', 'id': '13406', 'safe name': 'LAPOVO_RANZ.STAJ.'}
-    LAPOVO = {'name': 'LAPOVO', 'id': '13450', 'safe name': 'LAPOVO'}
-    MALA_KRSNA = {'name': 'MALA KRSNA', 'id': '13551', 'safe name': 'MALA_KRSNA'}
-    GODOMIN = {'name': 'GODOMIN', 'id': '13602', 'safe name': 'GODOMIN'}
-    RADINAC = {'name': 'RADINAC', 'id': '13603', 'safe name': 'RADINAC'}
-    VRANOVO = {'name': 'VRANOVO', 'id': '13604', 'safe name': 'VRANOVO'}
-    SMEDEREVO = {'name': 'SMEDEREVO', 'id': '13670', 'safe name': 'SMEDEREVO'}
-    KOVACEVAC = {'name': 'KOVAČEVAC', 'id': '13701', 'safe name': 'KOVACEVAC'}
-    RABROVAC = {'name': 'RABROVAC', 'id': '13702', 'safe name': 'RABROVAC'}
-    KUSADAK = {'name': 'KUSADAK', 'id': '13703', 'safe name': 'KUSADAK'}
-    RATARE = {'name': 'RATARE', 'id': '13704', 'safe name': 'RATARE'}
-    GLIBOVAC = {'name': 'GLIBOVAC', 'id': '13705', 'safe name': 'GLIBOVAC'}
-    PALANKA = {'name': 'PALANKA', 'id': '13706', 'safe name': 'PALANKA'}
-    MALA_PLANA = {'name': 'MALA PLANA', 'id': '13707', 'safe name': 'MALA_PLANA'}
-    MATEJEVAC = {'name': 'MATEJEVAC', 'id': '14001', 'safe name': 'MATEJEVAC'}
-    PANTELEJ = {'name': 'PANTELEJ', 'id': '14003', 'safe name': 'PANTELEJ'}
-    JASENOVIK = {'name': 'JASENOVIK', 'id': '14004', 'safe name': 'JASENOVIK'}
-    GRAMADA = {'name': 'GRAMADA', 'id': '14005', 'safe name': 'GRAMADA'}
-    HADZICEVO = {'name': 'HADŽIĆEVO', 'id': '14006', 'safe name': 'HADZICEVO'}
-    SVRLJIG = {'name': 'SVRLJIG', 'id': '14007', 'safe name': 'SVRLJIG'}
-    NISEVAC = {'name': 'NIŠEVAC', 'id': '14008', 'safe name': 'NISEVAC'}
-    PALILULA = {'name': 'PALILULA', 'id': '14009', 'safe name': 'PALILULA'}
-    SVRLJISKI_MILJKOVAC = {'name': 'SVRLJIŠKI MILJKOVAC', 'id': '14010', 'safe name': 'SVRLJISKI_MILJKOVAC'}
-    PODVIS = {'name': 'PODVIS', 'id': '14011', 'safe name': 'PODVIS'}
-    RGOSTE = {'name': 'RGOŠTE', 'id': '14012', 'safe name': 'RGOSTE'}
-    KNJAZEVAC = {'name': 'KNJAŽEVAC', 'id': '14013', 'safe name': 'KNJAZEVAC'}
-    GORNJE_ZUNICE = {'name': 'GORNJE ZUNIĆE', 'id': '14014', 'safe name': 'GORNJE_ZUNICE'}
-    DONJE_ZUNICE = {'name': 'DONJE ZUNIĆE', 'id': '14015', 'safe name': 'DONJE_ZUNICE'}
-    MINICEVO = {'name': 'MINIĆEVO', 'id': '14016', 'safe name': 'MINICEVO'}
-    SELACKA_REKA = {'name': 'SELAČKA REKA', 'id': '14017', 'safe name': 'SELACKA_REKA'}
-    MALI_IZVOR = {'name': 'MALI IZVOR', 'id': '14018', 'safe name': 'MALI_IZVOR'}
-    VRATARNICA = {'name': 'VRATARNICA', 'id': '14019', 'safe name': 'VRATARNICA'}
-    GRLJAN = {'name': 'GRLJAN', 'id': '14021', 'safe name': 'GRLJAN'}
-    TIMOK = {'name': 'TIMOK', 'id': '14022', 'safe name': 'TIMOK'}
-    ZAJECAR = {'name': 'ZAJEČAR', 'id': '14060', 'safe name': 'ZAJECAR'}
-    TRNAVAC = {'name': 'TRNAVAC', 'id': '14101', 'safe name': 'TRNAVAC'}
-    COKONJAR = {'name': 'ČOKONJAR', 'id': '14102', 'safe name': 'COKONJAR'}
-    TABAKOVAC = {'name': 'TABAKOVAC', 'id': '14104', 'safe name': 'TABAKOVAC'}
-    TABAKOVACKA_REKA = {'name': 'TABAKOVAČKA REKA', 'id': '14105', 'safe name': 'TABAKOVACKA_REKA'}
-    BRUSNIK = {'name': 'BRUSNIK', 'id': '14106', 'safe name': 'BRUSNIK'}
-    TAMNIC = {'name': 'TAMNIĆ', 'id': '14107', 'safe name': 'TAMNIC'}
-    CRNOMASNICA = {'name': 'CRNOMASNICA', 'id': '14108', 'safe name': 'CRNOMASNICA'}
-    RAJAC = {'name': 'RAJAC', 'id': '14109', 'safe name': 'RAJAC'}
-    ROGLJEVO = {'name': 'ROGLJEVO', 'id': '14110', 'safe name': 'ROGLJEVO'}
-    VELJKOVO = {'name': 'VELJKOVO', 'id': '14111', 'safe name': 'VELJKOVO'}
-    KOBISNICA = {'name': 'KOBIŠNICA', 'id': '14113', 'safe name': 'KOBISNICA'}
-    NEGOTIN = {'name': 'NEGOTIN', 'id': '14114', 'safe name': 'NEGOTIN'}
-    PRAHOVO = {'name': 'PRAHOVO', 'id': '14115', 'safe name': 'PRAHOVO'}
-    PRAHOVO_PRISTANISTE = {'name': 'PRAHOVO PRISTANIŠTE', 'id': '14170', 'safe name': 'PRAHOVO_PRISTANISTE'}
-    VRAZOGRNAC = {'name': 'VRAŽOGRNAC', 'id': '14301', 'safe name': 'VRAZOGRNAC'}
-    RGOTINA = {'name': 'RGOTINA', 'id': '14302', 'safe name': 'RGOTINA'}
-    ZAGRADJE = {'name': 'ZAGRAĐE', 'id': '14303', 'safe name': 'ZAGRADJE'}
-    BOR_TERETNA = {'name': 'BOR TERETNA', 'id': '14305', 'safe name': 'BOR_TERETNA'}
-    MAJDANPEK = {'name': 'MAJDANPEK', 'id': '14401', 'safe name': 'MAJDANPEK'}
-    LESKOVO = {'name': 'LESKOVO', 'id': '14402', 'safe name': 'LESKOVO'}
-    JASIKOVO = {'name': 'JASIKOVO', 'id': '14403', 'safe name': 'JASIKOVO'}
-    VLAOLE = {'name': 'VLAOLE', 'id': '14404', 'safe name': 'VLAOLE'}
-    CEROVO = {'name': 'CEROVO', 'id': '14405', 'safe name': 'CEROVO'}
-    KRIVELJSKI_POTOK = {'name': 'KRIVELJSKI POTOK', 'id': '14406', 'safe name': 'KRIVELJSKI_POTOK'}
-    MALI_KRIVELJ = {'name': 'MALI KRIVELJ', 'id': '14407', 'safe name': 'MALI_KRIVELJ'}
-    GORNJANE = {'name': 'GORNJANE', 'id': '14408', 'safe name': 'GORNJANE'}
-    KRIVELJSKI_MOST = {'name': 'KRIVELJSKI MOST', 'id': '14409', 'safe name': 'KRIVELJSKI_MOST'}
-    DEBELI_LUG = {'name': 'DEBELI LUG', 'id': '14410', 'safe name': 'DEBELI_LUG'}
-    VLAOLE_SELO = {'name': 'VLAOLE SELO', 'id': '14411', 'safe name': 'VLAOLE_SELO'}
-    SUSULAJKA = {'name': 'ŠUŠULAJKA', 'id': '14412', 'safe name': 'SUSULAJKA'}
-    BREZONIK = {'name': 'BREZONIK', 'id': '14413', 'safe name': 'BREZONIK'}
-    POZAREVAC = {'name': 'POŽAREVAC', 'id': '14550', 'safe name': 'POZAREVAC'}
-    LJUBICEVSKI_MOST = {'name': 'LJUBIČEVSKI MOST', 'id': '14551', 'safe name': 'LJUBICEVSKI_MOST'}
-    LASTRA = {'name': 'LASTRA', 'id': '15102', 'safe name': 'LASTRA'}
-    SAMARI = {'name': 'SAMARI', 'id': '15103', 'safe name': 'SAMARI'}
-    DRENOVACKI_KIK = {'name': 'DRENOVAČKI KIK', 'id': '15104', 'safe name': 'DRENOVACKI_KIK'}
-    RAZANA = {'name': 'RAŽANA', 'id': '15105', 'safe name': 'RAZANA'}
-    KOSJERIC = {'name': 'KOSJERIĆ', 'id': '15106', 'safe name': 'KOSJERIC'}
-    KALENIC = {'name': 'KALENIĆ', 'id': '15107', 'safe name': 'KALENIC'}
-    SEVOJNO = {'name': 'SEVOJNO', 'id': '15108', 'safe name': 'SEVOJNO'}
-    TUBICI = {'name': 'TUBIĆI', 'id': '15109', 'safe name': 'TUBICI'}
-    UZICI = {'name': 'UZIĆI', 'id': '15110', 'safe name': 'UZICI'}
-    RASNA = {'name': 'RASNA', 'id': '15111', 'safe name': 'RASNA'}
-    LESKOVICE = {'name': 'LESKOVICE', 'id': '15112', 'safe name': 'LESKOVICE'}
-    GLUMAC = {'name': 'GLUMAC', 'id': '15113', 'safe name': 'GLUMAC'}
-    ZLAKUSA = {'name': 'ZLAKUSA', 'id': '15114', 'safe name': 'ZLAKUSA'}
-    OTANJ = {'name': 'OTANJ', 'id': '15116', 'safe name': 'OTANJ'}
-    RACA = {'name': 'RAČA', 'id': '15118', 'safe name': 'RACA'}
-    POZEGA = {'name': 'POŽEGA', 'id': '15150', 'safe name': 'POZEGA'}
-    UZICE_TERETNA = {'name': 'UŽICE TERETNA', 'id': '15151', 'safe name': 'UZICE_TERETNA'}
-    UZICE = {'name': 'UŽICE', 'id': '15153', 'safe name': 'UZICE'}
-    BELA_REKA = {'name': 'BELA REKA', 'id': '15201', 'safe name': 'BELA_REKA'}
-    BARAJEVO = {'name': 'BARAJEVO', 'id': '15203', 'safe name': 'BARAJEVO'}
-    BARAJEVO_CENTAR = {'name': 'BARAJEVO CENTAR', 'id': '15204', 'safe name': 'BARAJEVO_CENTAR'}
-    VELIKI_BORAK = {'name': 'VELIKI BORAK', 'id': '15205', 'safe name': 'VELIKI_BORAK'}
-    LESKOVAC_KOLUBARSKI = {'name': 'LESKOVAC KOLUBARSKI', 'id': '15206', 'safe name': 'LESKOVAC_KOLUBARSKI'}
-    STEPOJEVAC = {'name': 'STEPOJEVAC', 'id': '15207', 'safe name': 'STEPOJEVAC'}
-    LAZAREVAC = {'name': 'LAZAREVAC', 'id': '15209', 'safe name': 'LAZAREVAC'}
-    SLOVAC = {'name': 'SLOVAC', 'id': '15211', 'safe name': 'SLOVAC'}
-    MLADJEVO = {'name': 'MLAĐEVO', 'id': '15212', 'safe name': 'MLADJEVO'}
-    DIVCI = {'name': 'DIVCI', 'id': '15213', 'safe name': 'DIVCI'}
-    IVERAK = {'name': 'IVERAK', 'id': '15215', 'safe name': 'IVERAK'}
-    VREOCI = {'name': 'VREOCI', 'id': '15250', 'safe name': 'VREOCI'}
-    VALJEVO = {'name': 'VALJEVO', 'id': '15251', 'safe name': 'VALJEVO'}
-    LAJKOVAC = {'name': 'LAJKOVAC', 'id': '15260', 'safe name': 'LAJKOVAC'}
-    RIPANJ = {'name': 'RIPANJ', 'id': '15402', 'safe name': 'RIPANJ'}
-    KLENJE = {'name': 'KLENJE', 'id': '15403', 'safe name': 'KLENJE'}
-    RIPANJ_TUNEL = {'name': 'RIPANJ TUNEL', 'id': '15404', 'safe name': 'RIPANJ_TUNEL'}
-    RALJA = {'name': 'RALJA', 'id': '15405', 'safe name': 'RALJA'}
-    SOPOT_KOSMAJSKI = {'name': 'SOPOT KOSMAJSKI', 'id': '15406', 'safe name': 'SOPOT_KOSMAJSKI'}
-    VLASKO_POLJE = {'name': 'VLAŠKO POLJE', 'id': '15407', 'safe name': 'VLASKO_POLJE'}
-    RIPANJ_KOLONIJA = {'name': 'RIPANJ KOLONIJA', 'id': '15408', 'safe name': 'RIPANJ_KOLONIJA'}
-    MLADENOVAC = {'name': 'MLADENOVAC', 'id': '15460', 'safe name': 'MLADENOVAC'}
-    RESNIK = {'name': 'RESNIK', 'id': '15501', 'safe name': 'RESNIK'}
-    STAPARI = {'name': 'STAPARI', 'id': '15701', 'safe name': 'STAPARI'}
-    SUSICA = {'name': 'SUŠICA', 'id': '15702', 'safe name': 'SUSICA'}
-    BRANESCI = {'name': 'BRANEŠCI', 'id': '15703', 'safe name': 'BRANESCI'}
-    ZLATIBOR = {'name': 'ZLATIBOR', 'id': '15704', 'safe name': 'ZLATIBOR'}
-    RIBNICA_ZLATIBORSKA = {'name': 'RIBNICA ZLATIBORSKA', 'id': '15705', 'safe name': 'RIBNICA_ZLATIBORSKA'}
-    JABLANICA = {'name': 'JABLANICA', 'id': '15706', 'safe name': 'JABLANICA'}
-    STRPCI = {'name': 'ŠTRPCI', 'id': '15707', 'safe name': 'STRPCI'}
-    PRIBOJ = {'name': 'PRIBOJ', 'id': '15708', 'safe name': 'PRIBOJ'}
-    PRIBOJSKA_BANJA = {'name': 'PRIBOJSKA BANJA', 'id': '15709', 'safe name': 'PRIBOJSKA_BANJA'}
-    BISTRICA_NA_LIMU = {'name': 'BISTRICA NA LIMU', 'id': '15710', 'safe name': 'BISTRICA_NA_LIMU'}
-    PRIJEPOLJE = {'name': 'PRIJEPOLJE', 'id': '15711', 'safe name': 'PRIJEPOLJE'}
-    PRIJEPOLJE_TERETNA = {'name': 'PRIJEPOLJE TERETNA', 'id': '15712', 'safe name': 'PRIJEPOLJE_TERETNA'}
-    BRODAREVO = {'name': 'BRODAREVO', 'id': '15714', 'safe name': 'BRODAREVO'}
-    RISTANOVICA_POLJE = {'name': 'RISTANOVIĆA POLJE', 'id': '15716', 'safe name': 'RISTANOVICA_POLJE'}
-    TRIPKOVA = {'name': 'TRIPKOVA', 'id': '15717', 'safe name': 'TRIPKOVA'}
-    DZUROVO = {'name': 'DŽUROVO', 'id': '15718', 'safe name': 'DZUROVO'}
-    POLJICE = {'name': 'POLJICE', 'id': '15722', 'safe name': 'POLJICE'}
-    ZEMUN_POLJE = {'name': 'ZEMUN POLJE', 'id': '16001', 'safe name': 'ZEMUN_POLJE'}
-    ZEMUN = {'name': 'ZEMUN', 'id': '16002', 'safe name': 'ZEMUN'}
-    NOVI_BEOGRAD = {'name': 'NOVI BEOGRAD', 'id': '16003', 'safe name': 'NOVI_BEOGRAD'}
-    SEBES = {'name': 'SEBEŠ', 'id': '16006', 'safe name': 'SEBES'}
-    OVCA = {'name': 'OVČA', 'id': '16007', 'safe name': 'OVCA'}
-    TOSIN_BUNAR = {'name': 'TOŠIN BUNAR', 'id': '16012', 'safe name': 'TOSIN_BUNAR'}
-    PANCEVACKI_MOST = {'name': 'PANČEVAČKI MOST', 'id': '16013', 'safe name': 'PANCEVACKI_MOST'}
-    PANCEVO_STRELISTE = {'name': 'PANČEVO STRELIŠTE', 'id': '16014', 'safe name': 'PANCEVO_STRELISTE'}
-    KRNJACA = {'name': 'KRNJAČA', 'id': '16015', 'safe name': 'KRNJACA'}
-    KRNJACA_MOST_STA = {'name': 'KRNJAČA MOST STA', 'id': '16016', 'safe name': 'KRNJACA_MOST_STA'}
-    BEOGRAD_CENTAR = {'name': 'BEOGRAD CENTAR', 'id': '16052', 'safe name': 'BEOGRAD_CENTAR'}
-    KARADJORDJEV_PARK = {'name': 'KARAĐORĐEV PARK', 'id': '16053', 'safe name': 'KARADJORDJEV_PARK'}
-    VUKOV_SPOMENIK = {'name': 'VUKOV SPOMENIK', 'id': '16054', 'safe name': 'VUKOV_SPOMENIK'}
-    KIJEVO = {'name': 'KIJEVO', 'id': '16101', 'safe name': 'KIJEVO'}
-    KNEZEVAC = {'name': 'KNEZEVAC', 'id': '16102', 'safe name': 'KNEZEVAC'}
-    RAKOVICA = {'name': 'RAKOVICA', 'id': '16103', 'safe name': 'RAKOVICA'}
-    BATAJNICA = {'name': 'BATAJNICA', 'id': '16204', 'safe name': 'BATAJNICA'}
-    MAJUR_STAJ = {'name': 'MAJUR STAJ', 'id': '16300', 'safe name': 'MAJUR_STAJ'}
-    PRNJAVOR_MACVANSKI = {'name': 'PRNJAVOR MAČVANSKI', 'id': '16305', 'safe name': 'PRNJAVOR_MACVANSKI'}
-    LESNICA = {'name': 'LEŠNICA', 'id': '16307', 'safe name': 'LESNICA'}
-    LOZNICA = {'name': 'LOZNICA', 'id': '16310', 'safe name': 'LOZNICA'}
-    KOVILJACA = {'name': 'KOVILJAČA', 'id': '16312', 'safe name': 'KOVILJACA'}
-    BRASINA = {'name': 'BRASINA', 'id': '16314', 'safe name': 'BRASINA'}
-    DONJA_BORINA_STAJ = {'name': 'DONJA BORINA STAJ', 'id': '16315', 'safe name': 'DONJA_BORINA_STAJ'}
-    ZVORNIK = {'name': 'ZVORNIK', 'id': '16317', 'safe name': 'ZVORNIK'}
-    SABAC = {'name': 'ŠABAC', 'id': '16350', 'safe name': 'SABAC'}
-    NOVA_PAZOVA = {'name': 'NOVA PAZOVA', 'id': '16501', 'safe name': 'NOVA_PAZOVA'}
-    STARA_PAZOVA = {'name': 'STARA PAZOVA', 'id': '16503', 'safe name': 'STARA_PAZOVA'}
-    GOLUBINCI = {'name': 'GOLUBINCI', 'id': '16505', 'safe name': 'GOLUBINCI'}
-    PUTINCI = {'name': 'PUTINCI', 'id': '16506', 'safe name': 'PUTINCI'}
-    KRALJEVCI_STAJ = {'name': 'KRALJEVCI STAJ', 'id': '16507', 'safe name': 'KRALJEVCI_STAJ'}
-    SREMSKA_MITROVICA = {'name': 'SREMSKA MITROVICA', 'id': '16509', 'safe name': 'SREMSKA_MITROVICA'}
-    MARTINCI = {'name': 'MARTINCI', 'id': '16511', 'safe name': 'MARTINCI'}
-    KUKUJEVCI_ERDEVIK = {'name': 'KUKUJEVCI-ERDEVIK', 'id': '16513', 'safe name': 'KUKUJEVCI-ERDEVIK'}
-    SID = {'name': 'ŠID', 'id': '16516', 'safe name': 'SID'}
-    RUMA = {'name': 'RUMA', 'id': '16550', 'safe name': 'RUMA'}
-    BUDJANOVCI = {'name': 'BUĐANOVCI', 'id': '16601', 'safe name': 'BUDJANOVCI'}
-    NIKINCI = {'name': 'NIKINCI', 'id': '16602', 'safe name': 'NIKINCI'}
-    PLATICEVO = {'name': 'PLATIĆEVO', 'id': '16603', 'safe name': 'PLATICEVO'}
-    KLENAK = {'name': 'KLENAK', 'id': '16604', 'safe name': 'KLENAK'}
-    INDJIJA = {'name': 'INĐIJA', 'id': '16801', 'safe name': 'INDJIJA'}
-    BESKA = {'name': 'BEŠKA', 'id': '16802', 'safe name': 'BESKA'}
-    SREMSKI_KARLOVCI = {'name': 'SREMSKI KARLOVCI', 'id': '16806', 'safe name': 'SREMSKI_KARLOVCI'}
-    PETROVARADIN = {'name': 'PETROVARADIN', 'id': '16807', 'safe name': 'PETROVARADIN'}
-    NOVI_SAD = {'name': 'NOVI SAD', 'id': '16808', 'safe name': 'NOVI_SAD'}
-    NOVI_SAD_RANZIRNA = {'name': 'NOVI SAD RANŽIRNA', 'id': '16870', 'safe name': 'NOVI_SAD_RANZIRNA'}
-    SZEGED = {'name': 'SZEGED', 'id': '17228', 'safe name': 'SZEGED'}
-    SZENTMIHALYTELEK = {'name': 'SZENTMIHALYTELEK', 'id': '17665', 'safe name': 'SZENTMIHALYTELEK'}
-    ROESZKE = {'name': 'ROESZKE', 'id': '17673', 'safe name': 'ROESZKE'}
-    PANCEVO_VAROS = {'name': 'PANČEVO VAROŠ', 'id': '21001', 'safe name': 'PANCEVO_VAROS'}
-    BANATSKO_NOVO_SELO = {'name': 'BANATSKO NOVO SELO', 'id': '21002', 'safe name': 'BANATSKO_NOVO_SELO'}
-    VLADIMIROVAC = {'name': 'VLADIMIROVAC', 'id': '21003', 'safe name': 'VLADIMIROVAC'}
-    ALIBUNAR = {'name': 'ALIBUNAR', 'id': '21004', 'safe name': 'ALIBUNAR'}
-    BANATSKI_KARLOVAC = {'name': 'BANATSKI KARLOVAC', 'id': '21005', 'safe name': 'BANATSKI_KARLOVAC'}
-    NIKOLINCI = {'name': 'NIKOLINCI', 'id': '21006', 'safe name': 'NIKOLINCI'}
-    ULJMA = {'name': 'ULJMA', 'id': '21007', 'safe name': 'ULJMA'}
-    VLAJKOVAC = {'name': 'VLAJKOVAC', 'id': '21008', 'safe name': 'VLAJKOVAC'}
-    VRSAC = {'name': 'VRŠAC', 'id': '21009', 'safe name': 'VRSAC'}
-    PANCEVO_VOJLOVICA = {'name': 'PANČEVO VOJLOVICA', 'id': '21101', 'safe name': 'PANCEVO_VOJLOVICA'}
-    PANCEVO_GLAVNA = {'name': 'PANČEVO GLAVNA', 'id': '22001', 'safe name': 'PANCEVO_GLAVNA'}
-    KACAREVO = {'name': 'KAČAREVO', 'id': '22003', 'safe name': 'KACAREVO'}
-    CREPAJA = {'name': 'CREPAJA', 'id': '22004', 'safe name': 'CREPAJA'}
-    DEBELJACA = {'name': 'DEBELJAČA', 'id': '22005', 'safe name': 'DEBELJACA'}
-    KOVACICA = {'name': 'KOVAČICA', 'id': '22006', 'safe name': 'KOVACICA'}
-    UZDIN = {'name': 'UZDIN', 'id': '22201', 'safe name': 'UZDIN'}
-    TOMASEVAC = {'name': 'TOMAŠEVAC', 'id': '22202', 'safe name': 'TOMASEVAC'}
-    ORLOVAT_STAJALISTE = {'name': 'ORLOVAT STAJALIŠTE', 'id': '22203', 'safe name': 'ORLOVAT_STAJALISTE'}
-    LUKICEVO = {'name': 'LUKIĆEVO', 'id': '22204', 'safe name': 'LUKICEVO'}
-    ZRENJANIN_FABRIKA = {'name': 'ZRENJANIN FABRIKA', 'id': '22501', 'safe name': 'ZRENJANIN_FABRIKA'}
-    ELEMIR = {'name': 'ELEMIR', 'id': '22503', 'safe name': 'ELEMIR'}
-    MELENCI = {'name': 'MELENCI', 'id': '22504', 'safe name': 'MELENCI'}
-    KUMANE = {'name': 'KUMANE', 'id': '22505', 'safe name': 'KUMANE'}
-    NOVI_BECEJ = {'name': 'NOVI BEČEJ', 'id': '22506', 'safe name': 'NOVI_BECEJ'}
-    BANAT_MILOSEVO_POLJE = {'name': 'BANAT.MILOŠEVO POLJE', 'id': '22508', 'safe name': 'BANAT.MILOSEVO_POLJE'}
-    BANATSKO_MILOSEVO = {'name': 'BANATSKO MILOŠEVO', 'id': '22509', 'safe name': 'BANATSKO_MILOSEVO'}
-    ZRENJANIN = {'name': 'ZRENJANIN', 'id': '22550', 'safe name': 'ZRENJANIN'}
-    BOCAR = {'name': 'BOČAR', 'id': '22601', 'safe name': 'BOCAR'}
-    PADEJ = {'name': 'PADEJ', 'id': '22603', 'safe name': 'PADEJ'}
-    OSTOJICEVO = {'name': 'OSTOJIĆEVO', 'id': '22604', 'safe name': 'OSTOJICEVO'}
-    COKA = {'name': 'ČOKA', 'id': '22605', 'safe name': 'COKA'}
-    KIKINDA = {'name': 'KIKINDA', 'id': '22850', 'safe name': 'KIKINDA'}
-    KISAC = {'name': 'KISAČ', 'id': '23302', 'safe name': 'KISAC'}
-    STEPANOVICEVO = {'name': 'STEPANOVIĆEVO', 'id': '23303', 'safe name': 'STEPANOVICEVO'}
-    ZMAJEVO = {'name': 'ZMAJEVO', 'id': '23304', 'safe name': 'ZMAJEVO'}
-    VRBAS_NOVA = {'name': 'VRBAS NOVA', 'id': '23305', 'safe name': 'VRBAS_NOVA'}
-    LOVCENAC_MALI_IDJOS = {'name': 'Lovcenac Mali Idjos', 'id': '23307', 'safe name': 'LOVCENAC_MALI_IDJOS'}
-    MALI_IDJOS_POLJE = {'name': 'MALI IĐOŠ POLJE', 'id': '23403', 'safe name': 'MALI_IDJOS_POLJE'}
-    BACKA_TOPOLA = {'name': 'BAČKA TOPOLA', 'id': '23404', 'safe name': 'BACKA_TOPOLA'}
-    ZEDNIK = {'name': 'ŽEDNIK', 'id': '23407', 'safe name': 'ZEDNIK'}
-    NAUMOVICEVO = {'name': 'NAUMOVIĆEVO', 'id': '23409', 'safe name': 'NAUMOVICEVO'}
-    SUBOTICA = {'name': 'SUBOTICA', 'id': '23450', 'safe name': 'SUBOTICA'}
-    HORGOS = {'name': 'HORGOŠ', 'id': '23701', 'safe name': 'HORGOS'}
-    BACKI_VINOGRADI = {'name': 'BAČKI VINOGRADI', 'id': '23702', 'safe name': 'BACKI_VINOGRADI'}
-    HAJDUKOVO = {'name': 'HAJDUKOVO', 'id': '23703', 'safe name': 'HAJDUKOVO'}
-    PALIC = {'name': 'PALIĆ', 'id': '23704', 'safe name': 'PALIC'}
-    SUBOTICA_JAV_SKLADISTA = {'name': 'SUBOTICA JAV.SKLADIŠTA', 'id': '23706', 'safe name': 'SUBOTICA_JAV.SKLADISTA'}
-    SENTA = {'name': 'SENTA', 'id': '23801', 'safe name': 'SENTA'}
-    GORNJI_BREG = {'name': 'GORNJI BREG', 'id': '23802', 'safe name': 'GORNJI_BREG'}
-    BOGARAS = {'name': 'BOGARAŠ', 'id': '23803', 'safe name': 'BOGARAS'}
-    DOLINE = {'name': 'DOLINE', 'id': '23804', 'safe name': 'DOLINE'}
-    OROM = {'name': 'OROM', 'id': '23805', 'safe name': 'OROM'}
-    GABRIC = {'name': 'GABRIĆ', 'id': '23806', 'safe name': 'GABRIC'}
-    GAJDOBRA = {'name': 'GAJDOBRA', 'id': '24001', 'safe name': 'GAJDOBRA'}
-    FUTOG = {'name': 'FUTOG', 'id': '24003', 'safe name': 'FUTOG'}
-    PETROVAC_GLOZAN = {'name': 'PETROVAC-GLOŽAN', 'id': '24004', 'safe name': 'PETROVAC-GLOZAN'}
-    BACKI_MAGLIC = {'name': 'BAČKI MAGLIĆ', 'id': '24005', 'safe name': 'BACKI_MAGLIC'}
-    SVETOZAR_MILETIC = {'name': 'SVETOZAR MILETIĆ', 'id': '24401', 'safe name': 'SVETOZAR_MILETIC'}
-    ALEKSA_SANTIC = {'name': 'ALEKSA ŠANTIĆ', 'id': '24403', 'safe name': 'ALEKSA_SANTIC'}
-    BAJMOK = {'name': 'BAJMOK', 'id': '24404', 'safe name': 'BAJMOK'}
-    TAVANKUT = {'name': 'TAVANKUT', 'id': '24406', 'safe name': 'TAVANKUT'}
-    LJUTOVO = {'name': 'LJUTOVO', 'id': '24407', 'safe name': 'LJUTOVO'}
-    SEBESIC = {'name': 'ŠEBEŠIĆ', 'id': '24408', 'safe name': 'SEBESIC'}
-    SUBOTICA_PREDGRADJE = {'name': 'SUBOTICA PREDGRAĐE', 'id': '24409', 'safe name': 'SUBOTICA_PREDGRADJE'}
-    PARAGE = {'name': 'PARAGE', 'id': '25001', 'safe name': 'PARAGE'}
-    RATKOVO = {'name': 'RATKOVO', 'id': '25002', 'safe name': 'RATKOVO'}
-    ODZACI = {'name': 'ODŽACI', 'id': '25003', 'safe name': 'ODZACI'}
-    ODZACI_KALVARIJA = {'name': 'ODŽACI KALVARIJA', 'id': '25401', 'safe name': 'ODZACI_KALVARIJA'}
-    KARAVUKOVO = {'name': 'KARAVUKOVO', 'id': '25402', 'safe name': 'KARAVUKOVO'}
-    BOGOJEVO_SELO = {'name': 'BOGOJEVO SELO', 'id': '25403', 'safe name': 'BOGOJEVO_SELO'}
-    BOGOJEVO = {'name': 'BOGOJEVO', 'id': '25470', 'safe name': 'BOGOJEVO'}
-    SONTA = {'name': 'SONTA', 'id': '25501', 'safe name': 'SONTA'}
-    PRIGREVICA = {'name': 'PRIGREVICA', 'id': '25502', 'safe name': 'PRIGREVICA'}
-    BUKOVACKI_SALASI = {'name': 'BUKOVAČKI SALAŠI', 'id': '25503', 'safe name': 'BUKOVACKI_SALASI'}
-    SOMBOR = {'name': 'SOMBOR', 'id': '25550', 'safe name': 'SOMBOR'}
-    PODGORICA = {'name': 'PODGORICA', 'id': '31001', 'safe name': 'PODGORICA'}
-    GOLUBOVCI = {'name': 'GOLUBOVCI', 'id': '31002', 'safe name': 'GOLUBOVCI'}
-    SUTOMORE = {'name': 'SUTOMORE', 'id': '31008', 'safe name': 'SUTOMORE'}
-    BAR = {'name': 'BAR', 'id': '31080', 'safe name': 'BAR'}
-    BIJELO_POLJE = {'name': 'BIJELO POLJE', 'id': '31302', 'safe name': 'BIJELO_POLJE'}
-    MOJKOVAC = {'name': 'MOJKOVAC', 'id': '31305', 'safe name': 'MOJKOVAC'}
-    KOLASIN = {'name': 'KOLAŠIN', 'id': '31307', 'safe name': 'KOLASIN'}
+class _StationType(type):
+    #just enough of the Enum class API for a catalogue that is cheap to build
+    def __iter__(cls) -> Iterator[Station]:
+        return iter(cls._members)
+
+    def __len__(cls) -> int:
+        return len(cls._members)
+
+    def __contains__(cls, member) -> bool:
+        return isinstance(member, cls)
+
+    def __getitem__(cls, name: str) -> Station:
+        return cls._by_name[name]
+
+    def __call__(cls, value: dict | str) -> Station:
+        #lookup by value like Enum, a station id is accepted as well
+        station = cls._by_id.get(value.get("id") if isinstance(value, dict) else value)
+
+        if station is None or (isinstance(value, dict) and station.value != value):
+            raise ValueError(f"{value!r} is not a valid Station")
+
+        return station
+
+    @property
+    def __members__(cls) -> MappingProxyType:
+        return MappingProxyType(cls._by_name)
+
+class Station(SerbiaTrainStationData.StationMembers, metaclass=_StationType):
+    __slots__ = ("name", "value")
+
+    def __repr__(self) -> str:
+        return f"<Station.{self.name}: {self.value!r}>"
+
+    def __str__(self) -> str:
+        return f"Station.{self.name}"
+
+    def __reduce__(self):
+        if Station._by_name.get(self.name) is self:
+            return getattr, (Station, self.name)
+
+        #stations outside the catalogue, see SerbiaTrainCatalogue.StationCatalogue.lookup
+        return _newStation, (self.name, self.value)
+
+    def __copy__(self) -> Station:
+        return self
+
+    def __deepcopy__(self, memo) -> Station:
+        return self
 
     def asJSON():
         return jsonDumps({member.name: member.value for member in Station})
 
+def _newStation(member_name: str, value: dict) -> Station:
+    #a Station that is not registered in the catalogue unless _buildStations adds it
+    member = object.__new__(Station)
+    member.name = member_name
+    member.value = value
+
+    return member
+
+def _buildStations():
+    members = list()
+
+    for member_name, name, id_, safe_name in zip(SerbiaTrainStationData.MEMBERS, SerbiaTrainStationData.NAMES, SerbiaTrainStationData.IDS, SerbiaTrainStationData.SAFE_NAMES):
+        member = _newStation(member_name, {'name': name, 'id': id_, 'safe name': safe_name})
+
+        setattr(Station, member_name, member)
+        members.append(member)
+
+    Station._members = tuple(members)
+    Station._by_name = {member.name: member for member in members}
+    Station._by_id = {member.value["id"]: member for member in members}
+
+_buildStations()
+
 class TrainDirection(Flag):
     INBOUND = auto()
     OUTBOUND = auto()
 
-@dataclass
+def parseTime(text: str) -> int | None:
+    #"HH:MM" to minutes since midnight
+    hours, sep, minutes = text.strip().partition(":")
+
+    if sep == "" or not hours.isdigit() or not minutes[:2].isdigit():
+        return None
+
+    return int(hours) * 60 + int(minutes[:2])
+
+def formatTime(minutes: int | None) -> str:
+    return "" if minutes is None or minutes < 0 else f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+def parseTrainNumber(text: str) -> int | None:
+    digits = text.strip()
+    end = 0
+
+    while end < len(digits) and digits[end].isdigit():
+        end += 1
+
+    return int(digits[:end]) if end > 0 else None
+
+@dataclass(slots=True)
 class Arrival:
-    TrainNumber: int
-    ArrivalTime: str
-    DepartureTime: str
+    TrainNumber: int | None
+    ArrivalTime: int | None #minutes since midnight
+    DepartureTime: int | None #minutes since midnight
     Direction: TrainDirection
     Note: str
     IsLate: bool
     TrainType: TrainType
 
+#column codes, 0 is an unknown train type
+_TRAIN_TYPES = (None, *TrainType)
+_TRAIN_TYPE_CODES = {train_type: code for code, train_type in enumerate(_TRAIN_TYPES)}
+
+def arrivalToRow(arrival: Arrival) -> tuple:
+    #plain tuple of builtins, cheap to pickle between processes
+    return (arrival.TrainNumber, arrival.ArrivalTime, arrival.DepartureTime, arrival.Direction.value, arrival.Note, arrival.IsLate, _TRAIN_TYPE_CODES[arrival.TrainType])
+
+def arrivalFromRow(row: tuple) -> Arrival:
+    return Arrival(
+        TrainNumber=row[0],
+        ArrivalTime=row[1],
+        DepartureTime=row[2],
+        Direction=TrainDirection(row[3]),
+        Note=row[4],
+        IsLate=row[5],
+        TrainType=_TRAIN_TYPES[row[6]]
+    )
+
+class ColumnarArrivals(Sequence):
+    #array backed columns, rows are only built when indexed, -1 marks a missing number or time
+    def __init__(self):
+        self.train_numbers = array("l")
+        self.arrival_times = array("h")
+        self.departure_times = array("h")
+        self.directions = array("b")
+        self.train_types = array("b")
+        self.is_late = array("b")
+        self.notes = list()
+
+    @staticmethod
+    def fromArrivals(arrivals: Iterable[Arrival]) -> ColumnarArrivals:
+        columns = ColumnarArrivals()
+        columns.extend(arrivals)
+
+        return columns
+
+    def append(self, arrival: Arrival):
+        self.train_numbers.append(-1 if arrival.TrainNumber is None else arrival.TrainNumber)
+        self.arrival_times.append(-1 if arrival.ArrivalTime is None else arrival.ArrivalTime)
+        self.departure_times.append(-1 if arrival.DepartureTime is None else arrival.DepartureTime)
+        self.directions.append(arrival.Direction.value)
+        self.train_types.append(_TRAIN_TYPE_CODES[arrival.TrainType])
+        self.is_late.append(arrival.IsLate)
+        self.notes.append(arrival.Note)
+
+    def extend(self, arrivals: Iterable[Arrival]):
+        for arrival in arrivals:
+            self.append(arrival)
+
+    def __len__(self) -> int:
+        return len(self.notes)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return self.take(range(*i.indices(len(self))))
+
+        return Arrival(
+            TrainNumber=None if self.train_numbers[i] < 0 else self.train_numbers[i],
+            ArrivalTime=None if self.arrival_times[i] < 0 else self.arrival_times[i],
+            DepartureTime=None if self.departure_times[i] < 0 else self.departure_times[i],
+            Direction=TrainDirection(self.directions[i]),
+            Note=self.notes[i],
+            IsLate=bool(self.is_late[i]),
+            TrainType=_TRAIN_TYPES[self.train_types[i]]
+        )
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ColumnarArrivals):
+            return list(self) == list(other)
+
+        return isinstance(other, list) and list(self) == other
+
+    def select(self, direction: TrainDirection | None = None, train_type: TrainType | None = None, is_late: bool | None = None, departs_between: tuple[int | str, int | str] | None = None, arrives_between: tuple[int | str, int | str] | None = None) -> list[int]:
+        #row indices matching every given filter, times are minutes or "HH:MM", bounds are inclusive
+        indices = range(len(self))
+
+        if direction is not None:
+            column = self.directions
+            indices = [i for i in indices if column[i] & direction.value]
+
+        if train_type is not None:
+            code = _TRAIN_TYPE_CODES[train_type]
+            column = self.train_types
+            indices = [i for i in indices if column[i] == code]
+
+        if is_late is not None:
+            column = self.is_late
+            indices = [i for i in indices if column[i] == is_late]
+
+        for column, between in ((self.departure_times, departs_between), (self.arrival_times, arrives_between)):
+            if between is None:
+                continue
+
+            start, end = (parseTime(t) if isinstance(t, str) else t for t in between)
+            indices = [i for i in indices if start <= column[i] <= end]
+
+        return list(indices)
+
+    def take(self, indices: Iterable[int]) -> ColumnarArrivals:
+        columns = ColumnarArrivals()
+
+        for i in indices:
+            columns.train_numbers.append(self.train_numbers[i])
+            columns.arrival_times.append(self.arrival_times[i])
+            columns.departure_times.append(self.departure_times[i])
+            columns.directions.append(self.directions[i])
+            columns.train_types.append(self.train_types[i])
+            columns.is_late.append(self.is_late[i])
+            columns.notes.append(self.notes[i])
+
+        return columns
+
+    def filter(self, **filters) -> ColumnarArrivals:
+        return self.take(self.select(**filters))
+
 @dataclass
 class TimeTable:
     LastUpdated: str
-    Arrivals: list[Arrival]
+    Arrivals: list[Arrival] | ColumnarArrivals
     Station: Station
+    Date: str | None = None #dd.mm.yyyy
+
+    def toJSON(self, compact: bool = False) -> str:
+        out = io.StringIO()
+        self.writeJSON(out, compact)
+
+        return out.getvalue()
+
+    def writeJSON(self, fp: TextIO, compact: bool = False):
+        writeJSON(self, fp, compact)
+
+#streaming JSON, writes fields directly instead of going through asdict
+#compact uses tight separators and encodes Station as its id, TrainDirection as its value and TrainType as its name
+_JSON_CHUNK_ROWS = 256
+
+def _jsonEnum(value, compact: bool) -> str:
+    if value is None:
+        return "null"
+
+    if not compact:
+        return _jsonString(str(value))
+
+    if isinstance(value, Station):
+        return _jsonString(value.value["id"])
+
+    if isinstance(value, TrainDirection):
+        return str(value.value)
+
+    return _jsonString(value.name)
+
+def _jsonStation(station: Station, compact: bool) -> str:
+    #stations outside the catalogue are written as their id plus name and safe name so readNDJSON can rebuild them
+    sep = ":" if compact else ": "
+    comma = "," if compact else ", "
+
+    if Station._by_id.get(station.value["id"]) is station:
+        return f'"Station"{sep}{_jsonEnum(station, compact)}'
+
+    return comma.join((
+        f'"Station"{sep}{_jsonString(station.value["id"])}',
+        f'"StationName"{sep}{_jsonString(station.value["name"])}',
+        f'"SafeName"{sep}{_jsonString(station.value["safe name"])}'
+    ))
+
+def _jsonOptionalString(value: str | None) -> str:
+    return "null" if value is None else _jsonString(value)
+
+def _jsonInt(value: int | None) -> str:
+    return "null" if value is None else str(value)
+
+def _jsonArrivalFields(arrival: Arrival, compact: bool) -> str:
+    sep = ":" if compact else ": "
+    comma = "," if compact else ", "
+
+    return comma.join((
+        f'"TrainNumber"{sep}{_jsonInt(arrival.TrainNumber)}',
+        f'"ArrivalTime"{sep}{_jsonInt(arrival.ArrivalTime)}',
+        f'"DepartureTime"{sep}{_jsonInt(arrival.DepartureTime)}',
+        f'"Direction"{sep}{_jsonEnum(arrival.Direction, compact)}',
+        f'"Note"{sep}{_jsonString(arrival.Note)}',
+        f'"IsLate"{sep}{"true" if arrival.IsLate else "false"}',
+        f'"TrainType"{sep}{_jsonEnum(arrival.TrainType, compact)}'
+    ))
+
+def writeJSON(timetable: TimeTable, fp: TextIO, compact: bool = False):
+    #same document as jsonDumps(timetable, cls=DataclassJSONEncoder) when not compact
+    sep = ":" if compact else ": "
+    comma = "," if compact else ", "
+
+    fp.write(f'{{"LastUpdated"{sep}{_jsonString(timetable.LastUpdated)}{comma}"Arrivals"{sep}[')
+
+    chunk = list()
+    first = True
+
+    for arrival in timetable.Arrivals:
+        chunk.append("{" + _jsonArrivalFields(arrival, compact) + "}")
+
+        if len(chunk) >= _JSON_CHUNK_ROWS:
+            fp.write(("" if first else comma) + comma.join(chunk))
+            chunk.clear()
+            first = False
+
+    if len(chunk) > 0:
+        fp.write(("" if first else comma) + comma.join(chunk))
+
+    fp.write(f']{comma}"Station"{sep}{_jsonEnum(timetable.Station, compact)}{comma}"Date"{sep}{_jsonOptionalString(timetable.Date)}}}')
+
+def writeNDJSON(timetables: Iterable[TimeTable], fp: TextIO, compact: bool = True) -> int:
+    #one arrival per line, each tagged with its station, date and update time, returns the number of lines
+    sep = ":" if compact else ": "
+    comma = "," if compact else ", "
+    lines = 0
+
+    for timetable in timetables:
+        prefix = f'{{{_jsonStation(timetable.Station, compact)}{comma}"Date"{sep}{_jsonOptionalString(timetable.Date)}{comma}"LastUpdated"{sep}{_jsonString(timetable.LastUpdated)}{comma}'
+        chunk = list()
+
+        for arrival in timetable.Arrivals:
+            chunk.append(prefix + _jsonArrivalFields(arrival, compact) + "}\n")
+
+            if len(chunk) >= _JSON_CHUNK_ROWS:
+                fp.write("".join(chunk))
+                lines += len(chunk)
+                chunk.clear()
+
+        fp.write("".join(chunk))
+        lines += len(chunk)
+
+    return lines
+
+def _enumFromJSON(cls, value):
+    #accepts both the compact and the str() encodings of writeNDJSON
+    if value is None:
+        return None
+
+    if isinstance(value, str) and value.startswith(f"{cls.__name__}."):
+        return cls[value[len(cls.__name__) + 1:]]
+
+    if cls is TrainType:
+        return cls[value]
+
+    return cls(value)
+
+def _stationFromJSON(row: dict, unregistered: dict[str, Station]) -> Station:
+    if "StationName" not in row:
+        return _enumFromJSON(Station, row["Station"])
+
+    value = {"name": row["StationName"], "id": row["Station"], "safe name": row["SafeName"]}
+    station = Station._by_id.get(value["id"])
+
+    if station is not None and station.value == value:
+        return station
+
+    station = unregistered.get(value["id"])
+
+    if station is None or station.value != value:
+        from SerbiaTrainCatalogue import memberName
+        station = unregistered[value["id"]] = _newStation(memberName(value["name"]), value)
+
+    return station
+
+def readNDJSON(fp: TextIO) -> Iterator[TimeTable]:
+    #inverse of writeNDJSON, consecutive lines of the same station and date become one timetable
+    timetable = None
+    #stations outside the catalogue, one object per id so lines of the same timetable stay together
+    unregistered: dict[str, Station] = {}
+
+    for line in fp:
+        if line.isspace():
+            continue
+
+        row = jsonLoads(line)
+        station = _stationFromJSON(row, unregistered)
+
+        if timetable is None or timetable.Station is not station or timetable.Date != row["Date"]:
+            if timetable is not None:
+                yield timetable
+
+            timetable = TimeTable(LastUpdated=row["LastUpdated"], Arrivals=[], Station=station, Date=row["Date"])
+
+        timetable.Arrivals.append(Arrival(
+            TrainNumber=row["TrainNumber"],
+            ArrivalTime=row["ArrivalTime"],
+            DepartureTime=row["DepartureTime"],
+            Direction=_enumFromJSON(TrainDirection, row["Direction"]),
+            Note=row["Note"],
+            IsLate=row["IsLate"],
+            TrainType=_enumFromJSON(TrainType, row["TrainType"])
+        ))
+
+    if timetable is not None:
+        yield timetable
+
+_DATE_PATTERN = re.compile(r"(\d{1,2})\.(\d{1,2})\.(\d{4})\.?")
+
+def parseDate(date: str | datetime.date) -> datetime.date:
+    if isinstance(date, datetime.datetime):
+        return date.date()
+
+    if isinstance(date, datetime.date):
+        return date
+
+    #dd.mm.yyyy is what the site uses, everything else goes through dateutil
+    match = _DATE_PATTERN.fullmatch(date.strip())
+
+    if match is not None:
+        day, month, year = match.groups()
+        return datetime.date(int(year), int(month), int(day))
+
+    from dateutil.parser import parse as parse_date
+
+    return parse_date(date).date()
+
+def formatDate(date: str | datetime.date) -> str:
+    return parseDate(date).strftime("%d.%m.%Y")
+
+def dateRange(start: str | datetime.date, end: str | datetime.date) -> list[datetime.date]:
+    #both ends included, empty when end is before start
+    start = parseDate(start)
+    days = (parseDate(end) - start).days
+
+    return [start + datetime.timedelta(days=i) for i in range(days + 1)]
+
+@lru_cache(maxsize=1024)
+def stationUrl(web_base_url: str, station: Station) -> str:
+    return f"{web_base_url}//stanicni/{urllib.parse.quote(station.value.get('safe name'))}/{station.value.get('id')}"
+
+def directionUrl(station_url: str, date: str, dir_: TrainDirection) -> str:
+    return f"{station_url}/{date}/0000/{'dolazak' if dir_ == TrainDirection.INBOUND else 'polazak'}/999/sr"
+
+def safeName(name: str) -> str:
+    return name.upper().replace(" ", "_").replace("Č", "C").replace("Ć", "C").replace("Š", "S").replace("Đ", "DJ").replace("Ž", "Z")
+
+def parseStations(stations_: list[dict]) -> list[dict]:
+    return list(map(lambda s: { \
+        "name": s["naziv"], 
+        "id": s["sifra"], 
+        "safe name": safeName(s["naziv"])
+    }, stations_))
+
+class TrainObserver:
+    #hooks for TrainApi(observer=...), every phase reports its duration in seconds.
+    #timetable phases: "date", "url", "request", "dom", "rows", "direction"
+    #station phases: "stations.url", "stations.request", "stations.parse"
+    #counts: "rows", "unknown_rang", "unknown_train_type", "stations"
+    #without an observer TrainApi does not read the clock at all
+    def onPhase(self, phase: str, seconds: float, **info):
+        pass
+
+    def onCount(self, name: str, value: int = 1, **info):
+        pass
+
+def _reportRows(observer: TrainObserver, started: float, arrivals: list[Arrival], unknown_rang: int, dir_: TrainDirection):
+    observer.onPhase("rows", time.perf_counter() - started, direction=dir_)
+    observer.onCount("rows", len(arrivals), direction=dir_)
+
+    if unknown_rang > 0:
+        observer.onCount("unknown_rang", unknown_rang, direction=dir_)
+
+    unknown_types = sum(1 for arrival in arrivals if arrival.TrainType is None)
+
+    if unknown_types > 0:
+        observer.onCount("unknown_train_type", unknown_types, direction=dir_)
+
+def nowTimestamp() -> str:
+    return datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%d %H:%M:%S %Z%z")
+
+def parseArrivalsSoup(text: str, dir_: TrainDirection, observer: TrainObserver | None = None) -> list[Arrival]:
+    from bs4 import BeautifulSoup
+
+    arrivals = list()
+    unknown_rang = 0
+    started = time.perf_counter() if observer is not None else 0
+
+    #parse html
+    html = BeautifulSoup(text, 'lxml')
+
+    #get table from html
+    table_rows = html.select("#rezultati > table > tr.tsmall")
+
+    if observer is not None:
+        observer.onPhase("dom", time.perf_counter() - started, direction=dir_)
+        started = time.perf_counter()
+
+    #get headers
+    table_headers = list(map(lambda h: h.get_text(strip=True), table_rows[0].find_all("th")))[:-1]
+    table_headers.append("Details")
+
+    for row in table_rows[1:]:
+        #get data from row
+        data = list(map(lambda d: d.get_text(strip=True), row.select("td")))
+
+        timetable_row = {}
+
+        #go throught the headers
+        for i in range(0, len(table_headers)):
+            if i >= len(data): #handle if no data for header
+                continue
+
+            if table_headers[i] == "Rang": #for rang, we get from image
+                try:
+                    data[i] = row.select_one("td > img").attrs["title"]
+                except:
+                    data[i] = "???"
+                    unknown_rang += 1
+
+            timetable_row[table_headers[i]] = data[i]
+
+        arrivals.append(Arrival(
+            TrainNumber=parseTrainNumber(timetable_row["Broj voza"]),
+            ArrivalTime=parseTime(timetable_row["Vreme dolaska"]),
+            DepartureTime=parseTime(timetable_row["Vreme polaska"]),
+            IsLate=len(timetable_row["Kasni"]) > 0,
+            Direction=dir_,
+            TrainType=TrainType.parse(timetable_row["Rang"]),
+            Note=timetable_row["Napomena"]
+        ))
+
+    if observer is not None:
+        _reportRows(observer, started, arrivals, unknown_rang, dir_)
+
+    return arrivals
+
+@lru_cache(maxsize=1)
+def _lxml() -> SimpleNamespace:
+    #imported and compiled once on first parse, evaluated per page/row
+    import lxml.html
+    from lxml import etree
+
+    return SimpleNamespace(
+        html=lxml.html,
+        etree=etree,
+        rows=etree.XPath('//*[@id="rezultati"]/table/tr[contains(concat(" ", normalize-space(@class), " "), " tsmall ")]'),
+        headers=etree.XPath(".//th"),
+        cells=etree.XPath(".//td"),
+        rang=etree.XPath(".//td/img"),
+        #same strings BeautifulSoup get_text sees, no comments or script/style content
+        text=etree.XPath(".//text()[not(parent::script) and not(parent::style) and not(parent::template)]")
+    )
+
+_ARRIVAL_COLUMNS = ("Broj voza", "Vreme dolaska", "Vreme polaska", "Kasni", "Rang", "Napomena")
+
+def _cellText(cell, xpath=None) -> str:
+    xpath = _lxml().text if xpath is None else xpath
+    return "".join([s.strip() for s in xpath(cell)])
+
+class _RowParser:
+    def __init__(self, header_row, dir_: TrainDirection):
+        self.dir_ = dir_
+        self.xp = _lxml()
+
+        #map each header to its columns once per page, last one wins like the dict in parseArrivalsSoup
+        table_headers = [_cellText(h, self.xp.text) for h in self.xp.headers(header_row)][:-1]
+        table_headers.append("Details")
+
+        self.columns = {name: [i for i, header in enumerate(table_headers) if header == name][::-1] for name in _ARRIVAL_COLUMNS}
+        #rows whose Rang image had no title
+        self.unknown_rang = 0
+
+    def _column(self, name: str, data: list[str]) -> str:
+        for i in self.columns[name]:
+            if i < len(data):
+                return data[i]
+
+        raise KeyError(name)
+
+    def parse(self, row) -> Arrival:
+        data = [_cellText(d, self.xp.text) for d in self.xp.cells(row)]
+
+        if any(i < len(data) for i in self.columns["Rang"]): #for rang, we get from image
+            img = self.xp.rang(row)
+            rang = img[0].get("title") if len(img) > 0 else None
+
+            if rang is None:
+                rang = "???"
+                self.unknown_rang += 1
+        else:
+            rang = self._column("Rang", data)
+
+        return Arrival(
+            TrainNumber=parseTrainNumber(self._column("Broj voza", data)),
+            ArrivalTime=parseTime(self._column("Vreme dolaska", data)),
+            DepartureTime=parseTime(self._column("Vreme polaska", data)),
+            IsLate=len(self._column("Kasni", data)) > 0,
+            Direction=self.dir_,
+            TrainType=TrainType.parse(rang),
+            Note=self._column("Napomena", data)
+        )
+
+def parseArrivalsLxml(text: str | bytes, dir_: TrainDirection, observer: TrainObserver | None = None) -> list[Arrival]:
+    xp = _lxml()
+    started = time.perf_counter() if observer is not None else 0
+
+    try:
+        html = xp.html.document_fromstring(text)
+    except xp.etree.ParserError as e:
+        raise TrainException(f"Could not parse timetable page: {e}")
+
+    table_rows = xp.rows(html)
+
+    if len(table_rows) == 0:
+        raise TrainException("Could not find timetable in page")
+
+    if observer is not None:
+        observer.onPhase("dom", time.perf_counter() - started, direction=dir_)
+        started = time.perf_counter()
+
+    row_parser = _RowParser(table_rows[0], dir_)
+    arrivals = [row_parser.parse(row) for row in table_rows[1:]]
+
+    if observer is not None:
+        _reportRows(observer, started, arrivals, row_parser.unknown_rang, dir_)
+
+    return arrivals
+
+def _isTimeTableRow(row) -> bool:
+    table = row.getparent()
+
+    if table is None or table.tag != "table" or "tsmall" not in (row.get("class") or "").split():
+        return False
 
-    def toJSON(self) -> str:
-        return jsonDumps(self, cls=DataclassJSONEncoder)
+    container = table.getparent()
+
+    return container is not None and container.get("id") == "rezultati"
+
+def iterArrivals(chunks: Iterable[bytes], dir_: TrainDirection, encoding: str | None = None) -> Iterator[Arrival]:
+    parser = _lxml().etree.HTMLPullParser(events=("end",), tag="tr", encoding=encoding)
+    row_parser = None
+
+    for chunk in chunks:
+        parser.feed(chunk)
+
+        for _, row in parser.read_events():
+            if not _isTimeTableRow(row):
+                continue
+
+            if row_parser is None:
+                row_parser = _RowParser(row, dir_)
+            else:
+                yield row_parser.parse(row)
+
+            #only the current row is kept in memory
+            row.clear()
+
+            table = row.getparent()
+
+            while row.getprevious() is not None:
+                del table[0]
+
+    parser.close()
+
+    if row_parser is None:
+        raise TrainException("Could not find timetable in page")
+
+PARSERS = {
+    "lxml": parseArrivalsLxml,
+    "bs4": parseArrivalsSoup
+}
+
+def parseArrivals(text: str | bytes, dir_: TrainDirection, parser: str = "lxml", observer: TrainObserver | None = None) -> list[Arrival]:
+    if parser not in PARSERS:
+        raise TrainException(f"Unknown parser: {parser}, expected one of {', '.join(PARSERS)}")
+
+    return PARSERS[parser](text, dir_, observer)
+
+#worth another try, anything else is returned to the caller as is
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+class CircuitBreaker:
+    #closed: requests pass, open: requests fail fast until reset_timeout passed,
+    #half-open: a single probe decides whether to close again. failure_threshold 0 never opens
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+
+        self._state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+        self.opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def retryAfter(self) -> float:
+        with self._lock:
+            return max(0.0, self._opened_at + self.reset_timeout - self.clock()) if self._state == "open" else 0.0
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._state == "open" and self.clock() >= self._opened_at + self.reset_timeout:
+                self._state = "half-open"
+                self._probing = False
+
+            if self._state == "closed":
+                return True
+
+            if self._state == "half-open" and not self._probing:
+                self._probing = True
+                return True
+
+            self.rejected += 1
+            return False
+
+    def success(self):
+        with self._lock:
+            self._state = "closed"
+            self._failures = 0
+            self._probing = False
+
+    def failure(self):
+        with self._lock:
+            self._failures += 1
+
+            if self._state == "half-open" or (self.failure_threshold > 0 and self._failures >= self.failure_threshold and self._state == "closed"):
+                self._state = "open"
+                self._opened_at = self.clock()
+                self._probing = False
+                self.opened += 1
+
+class TrainTransport:
+    def __init__(self, pool_size: int = 10, timeout: float | tuple[float, float] | None = (5, 30), adapter: requests.adapters.BaseAdapter | None = None, compress: bool = True, retries: int = 2, backoff: float = 0.2, max_backoff: float = 5, breaker: CircuitBreaker | None = None, hedge: bool = False, hedge_delay: float = 1, hedge_percentile: float = 95, hedge_samples: int = 200):
+        import requests
+        import requests.adapters
+
+        self.timeout = timeout
+
+        #one pooled keep-alive session shared by every call
+        self.session = requests.Session()
+        self.session.headers["Accept-Encoding"] = "gzip, deflate" if compress else "identity"
+
+        if adapter is None:
+            adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+
+        self.adapter = adapter
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        #GETs are idempotent, failed ones are retried with exponential backoff and full jitter
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.breaker = breaker if breaker is not None else CircuitBreaker()
+
+        #hedged requests fire a duplicate once the first one takes longer than the recent
+        #hedge_percentile latency (hedge_delay until enough samples), the first answer wins
+        self.hedge = hedge
+        self.hedge_delay = hedge_delay
+        self.hedge_percentile = hedge_percentile
+        self._latencies = deque(maxlen=hedge_samples)
+        self._hedge_executor = None
+        self.pool_size = pool_size
+
+        self._lock = threading.Lock()
+        self._requests_sent = 0
+        self._retried = 0
+        self._hedged = 0
+        self._hedge_wins = 0
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        #returns the last response even when its status is still an error, a request that never got an
+        #answer raises TrainException with the last requests exception in errors
+        import requests
+
+        kwargs.setdefault("timeout", self.timeout)
+        #streamed bodies are read by the caller, a hedge could not be abandoned cleanly
+        hedge = self.hedge and not kwargs.get("stream", False)
+
+        for attempt in range(self.retries + 1):
+            if not self.breaker.allow():
+                raise CircuitOpenError(f"Upstream is failing, not sending requests for {self.breaker.retryAfter():.1f}s, url: {url}")
+
+            try:
+                res = self._getHedged(url, kwargs) if hedge else self._send(url, kwargs)
+            except requests.RequestException as e:
+                self.breaker.failure()
+
+                if attempt >= self.retries:
+                    raise TrainException(f"Request failed: {e}, url: {url}", [e]) from e
+
+                res = None
+            else:
+                if res.status_code not in RETRY_STATUSES:
+                    self.breaker.success()
+                    return res
+
+                self.breaker.failure()
+
+                if attempt >= self.retries:
+                    return res
+
+            with self._lock:
+                self._retried += 1
+
+            time.sleep(self._retryDelay(attempt, res))
+
+    def _retryDelay(self, attempt: int, res: requests.Response | None) -> float:
+        delay = random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+        retry_after = res.headers.get("Retry-After", "") if res is not None else ""
+
+        if retry_after.isdigit():
+            delay = max(delay, min(float(retry_after), self.max_backoff))
+
+        if res is not None:
+            res.close()
+
+        return delay
+
+    def _send(self, url: str, kwargs: dict) -> requests.Response:
+        with self._lock:
+            self._requests_sent += 1
+
+        started = time.perf_counter()
+
+        res = self.session.get(url, **kwargs)
+
+        with self._lock:
+            if res.status_code not in RETRY_STATUSES:
+                self._latencies.append(time.perf_counter() - started)
+
+        return res
+
+    def hedgeDelay(self) -> float:
+        with self._lock:
+            latencies = sorted(self._latencies)
+
+        if len(latencies) < 20:
+            return self.hedge_delay
+
+        return latencies[min(len(latencies) - 1, int(self.hedge_percentile / 100 * len(latencies)))]
+
+    def _getHedgeExecutor(self) -> concurrent.futures.Executor:
+        import concurrent.futures
+
+        with self._lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = concurrent.futures.ThreadPoolExecutor(max_workers=2 * self.pool_size, thread_name_prefix="TrainTransport")
+
+            return self._hedge_executor
+
+    def _getHedged(self, url: str, kwargs: dict) -> requests.Response:
+        import concurrent.futures
+
+        executor = self._getHedgeExecutor()
+        pending = {executor.submit(self._send, url, kwargs)}
+        done, pending = concurrent.futures.wait(pending, timeout=self.hedgeDelay())
+
+        if len(pending) > 0:
+            hedge = executor.submit(self._send, url, kwargs)
+            pending.add(hedge)
+
+            with self._lock:
+                self._hedged += 1
+        else:
+            hedge = None
+
+        fallback = None
+
+        while True:
+            for future in done:
+                try:
+                    res = future.result()
+                except Exception as e:
+                    fallback = e if fallback is None else fallback
+                    continue
+
+                if res.status_code in RETRY_STATUSES and len(pending) > 0:
+                    fallback = res
+                    continue
+
+                #the slower copy is closed whenever it finishes
+                for other in pending:
+                    other.add_done_callback(_closeResponse)
+
+                if future is hedge:
+                    with self._lock:
+                        self._hedge_wins += 1
+
+                return res
+
+            if len(pending) == 0:
+                break
+
+            done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+
+        if isinstance(fallback, Exception):
+            raise fallback
+
+        return fallback
+
+    def stats(self) -> dict:
+        connections = 0
+
+        #custom adapters may not be backed by urllib3 pools
+        pools = getattr(getattr(self.adapter, "poolmanager", None), "pools", None)
+
+        if pools is not None:
+            for key in pools.keys():
+                pool = pools.get(key)
+
+                if pool is not None:
+                    connections += pool.num_connections
+
+        with self._lock:
+            requests_sent = self._requests_sent
+            retried = self._retried
+            hedged = self._hedged
+            hedge_wins = self._hedge_wins
+
+        return {
+            "requests": requests_sent,
+            "connections": connections,
+            "reused": max(requests_sent - connections, 0),
+            "retried": retried,
+            "hedged": hedged,
+            "hedge_wins": hedge_wins,
+            "breaker": self.breaker.state,
+            "breaker_opened": self.breaker.opened,
+            "breaker_rejected": self.breaker.rejected
+        }
+
+    def close(self):
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False)
+
+        self.session.close()
+
+def _closeResponse(future: concurrent.futures.Future):
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
 
 class TrainApi:
+    def __init__(self, transport: TrainTransport | None = None, api_base_url: str = API_BASE_URL, web_base_url: str = WEB_BASE_URL, executor: concurrent.futures.Executor | None = None, max_workers: int = 4, cache: TimeTableCache | None = None, store: TimeTableStore | None = None, parser: str = "lxml", columnar: bool = False, observer: TrainObserver | None = None):
+        if parser not in PARSERS:
+            raise TrainException(f"Unknown parser: {parser}, expected one of {', '.join(PARSERS)}")
+
+        self.transport = transport if transport is not None else TrainTransport()
+        self.parser = parser
+        #return TimeTable.Arrivals as ColumnarArrivals instead of a list
+        self.columnar = columnar
+        self.api_base_url = api_base_url
+        self.web_base_url = web_base_url
+
+        #optional TrainObserver, e.g. SerbiaTrainMetrics.PhaseTimings
+        self.observer = observer
+
+        #optional SerbiaTrainCache.TimeTableCache, keyed on (station id, date, direction)
+        self.cache = cache
+
+        #optional SerbiaTrainStore.TimeTableStore, stored rows are served first and refreshed in the background when stale
+        self.store = store
+        self._refreshing = set()
+
+        #caller supplied executors are never shut down by us
+        self.executor = executor
+        self.max_workers = max_workers
+        self._owns_executor = False
+        self._executor_lock = threading.Lock()
+
+    def __enter__(self) -> TrainApi:
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._owns_executor and self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+            self._owns_executor = False
+
+        self.transport.close()
+
     def getStations(self, search=""):
-        res = requests.get(f"{API_BASE_URL}/stanica/?term={urllib.parse.quote(search)}")
+        observer = self.observer
+        started = time.perf_counter() if observer is not None else 0
+
+        url = f"{self.api_base_url}/stanica/?term={urllib.parse.quote(search)}"
+
+        if observer is not None:
+            observer.onPhase("stations.url", time.perf_counter() - started)
+            started = time.perf_counter()
+
+        res = self.transport.get(url)
+
+        if observer is not None:
+            observer.onPhase("stations.request", time.perf_counter() - started, status=res.status_code, bytes=len(res.content))
 
         if res.status_code != 200:
             raise TrainException(f"Api error occured: {res.status_code}, {res.text}")
 
-        stations_ = res.json()
+        if observer is None:
+            return parseStations(res.json())
 
-        return list(map(lambda s: { \
-            "name": s["naziv"], 
-            "id": s["sifra"], 
-            "safe name": s["naziv"].upper().replace(" ", "_").replace("Č", "C").replace("Ć", "C").replace("Š", "S").replace("Đ", "DJ").replace("Ž", "Z") 
-        }, stations_))
-    
-    def getTimeTable(self, station: Station, date: str, directions: TrainDirection = TrainDirection.INBOUND | TrainDirection.OUTBOUND) -> TimeTable:
-        arrivals = list()
+        started = time.perf_counter()
+        stations = parseStations(res.json())
+
+        observer.onPhase("stations.parse", time.perf_counter() - started)
+        observer.onCount("stations", len(stations))
+
+        return stations
+
+    def findStations(self, search="", limit: int = 10) -> list[dict]:
+        #offline variant of getStations, searches the local station index
+        from SerbiaTrainStations import stationIndex
+
+        return [dict(station.value) for station in stationIndex().search(search, limit)]
     
-        date = datetime.datetime.strftime(parse_date(date), "%d.%m.%Y")
-        station_url = f"{WEB_BASE_URL}//stanicni/{urllib.parse.quote(station.value.get("safe name"))}/{station.value.get("id")}"
+    def getTimeTable(self, station: Station, date: str | datetime.date, directions: TrainDirection = TrainDirection.INBOUND | TrainDirection.OUTBOUND) -> TimeTable:
+        if self.observer is None:
+            date = formatDate(date)
+        else:
+            started = time.perf_counter()
+            date = formatDate(date)
+            self.observer.onPhase("date", time.perf_counter() - started, station=station)
+
+        dirs = list(directions)
+
+        #fetch and parse every direction at the same time
+        results = self._getDirections([(station, date, dir_) for dir_ in dirs], f"Could not get timetable for {station.name} on {date}")
+
+        #keep arrivals in direction order
+        arrivals = [arrival for result in results for arrival in result]
+
+        if self.columnar:
+            arrivals = ColumnarArrivals.fromArrivals(arrivals)
+
+        return TimeTable(LastUpdated=nowTimestamp(), Station=station, Arrivals=arrivals, Date=date)
+
+    def getTimeTableRange(self, station: Station, start: str | datetime.date, end: str | datetime.date, directions: TrainDirection = TrainDirection.INBOUND | TrainDirection.OUTBOUND, dedupe: bool = False) -> dict[datetime.date, TimeTable]:
+        return self.getTimeTablesRange([station], start, end, directions, dedupe)[station]
+
+    def getTimeTablesRange(self, stations: Iterable[Station], start: str | datetime.date, end: str | datetime.date, directions: TrainDirection = TrainDirection.INBOUND | TrainDirection.OUTBOUND, dedupe: bool = False) -> dict[Station, dict[datetime.date, TimeTable]]:
+        #every (station, day, direction) page is fetched at the same time, start and end days included.
+        #with dedupe, days of a station with identical arrivals share one Arrivals object
+        stations = list(stations)
+        days = dateRange(start, end)
+        dirs = list(directions)
+
+        jobs = [(station, formatDate(day), dir_) for station in stations for day in days for dir_ in dirs]
+        results = iter(self._getDirections(jobs, f"Could not get timetables from {formatDate(start)} to {formatDate(end)}"))
+        timetables = {}
+
+        for station in stations:
+            by_day = timetables[station] = {}
+            seen = {}
+
+            for day in days:
+                arrivals = [arrival for _ in dirs for arrival in next(results)]
+
+                if dedupe:
+                    key = tuple(map(arrivalToRow, arrivals))
+
+                    if key not in seen:
+                        seen[key] = ColumnarArrivals.fromArrivals(arrivals) if self.columnar else arrivals
+
+                    arrivals = seen[key]
+                elif self.columnar:
+                    arrivals = ColumnarArrivals.fromArrivals(arrivals)
+
+                by_day[day] = TimeTable(LastUpdated=nowTimestamp(), Station=station, Arrivals=arrivals, Date=formatDate(day))
+
+        return timetables
+
+    def iterTimeTable(self, station: Station, date: str, directions: TrainDirection = TrainDirection.INBOUND | TrainDirection.OUTBOUND, chunk_size: int = 16 * 1024) -> Iterator[Arrival]:
+        #streams straight from the network, cache and store are not consulted
+        date = formatDate(date)
+        station_url = stationUrl(self.web_base_url, station)
 
         for dir_ in directions:
-            url = f"{station_url}/{date}/0000/{"dolazak" if dir_ == TrainDirection.INBOUND else "polazak"}/999/sr"
+            url = directionUrl(station_url, date, dir_)
 
-            res = requests.get(url)
+            with self.transport.get(url, stream=True) as res:
+                if res.status_code != 200:
+                    raise TrainException(f"Could not get timetable: {res.status_code}, {res.text}, url: {url}")
 
-            if res.status_code != 200:
-                raise TrainException(f"Could not get timetable: {res.status_code}, {res.text}, url: {url}")
+                yield from iterArrivals(res.iter_content(chunk_size), dir_, res.encoding)
 
-            #parse html
-            html = BeautifulSoup(res.text, 'lxml')
-            
-            #get table from html
-            table_rows = html.select("#rezultati > table > tr.tsmall")
+    def _getExecutor(self) -> concurrent.futures.Executor:
+        import concurrent.futures
 
-            #get headers
-            table_headers = list(map(lambda h: h.get_text(strip=True), table_rows[0].find_all("th")))[:-1]
-            table_headers.append("Details")
+        with self._executor_lock:
+            if self.executor is None:
+                self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="TrainApi")
+                self._owns_executor = True
 
-            for row in table_rows[1:]:
-                #get data from row
-                data = list(map(lambda d: d.get_text(strip=True), row.select("td")))
-            
-                timetable_row = {}
-
-                #go throught the headers
-                for i in range(0, len(table_headers)):
-                    if i >= len(data): #handle if no data for header
-                        continue
-
-                    if table_headers[i] == "Rang": #for rang, we get from image
-                        try:
-                            data[i] = row.select_one("td > img").attrs["title"]
-                        except:
-                            data[i] = "???"
-
-                    timetable_row[table_headers[i]] = data[i]
-
-                arrivals.append(Arrival(
-                    TrainNumber=timetable_row["Broj voza"],
-                    ArrivalTime=timetable_row["Vreme dolaska"],
-                    DepartureTime=timetable_row["Vreme polaska"],
-                    IsLate=len(timetable_row["Kasni"]) > 0,
-                    Direction=dir_,
-                    TrainType=TrainType.parse(timetable_row["Rang"]),
-                    Note=timetable_row["Napomena"]
-                ))
-
-        return TimeTable(LastUpdated=datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%d %H:%M:%S %Z%z"), Station=station, Arrivals=arrivals)
-        
\ No newline at end of file
+            return self.executor
+
+    def _getDirections(self, jobs: list[tuple[Station, str, TrainDirection]], message: str) -> list[list[Arrival]]:
+        #the first job runs on the calling thread, the rest in the executor. jobs the executor has not
+        #started yet are taken back and run here, so a caller running inside that executor can never hang.
+        #a single error is raised as is, several are wrapped together
+        futures = [self._getExecutor().submit(self._getDirection, *job) for job in jobs[1:]]
+        results = list()
+        errors = list()
+
+        for job, future in zip(jobs, [None, *futures]):
+            try:
+                if future is None or future.cancel():
+                    results.append(self._getDirection(*job))
+                else:
+                    results.append(future.result())
+            except Exception as e:
+                errors.append(e)
+
+        if len(errors) == 1:
+            raise errors[0]
+
+        if len(errors) > 1:
+            raise TrainException(f"{message}: {'; '.join(map(str, errors))}", errors)
+
+        return results
+
+    def _getDirection(self, station: Station, date: str, dir_: TrainDirection) -> list[Arrival]:
+        if self.observer is None:
+            return self._getCachedDirection(station, date, dir_)
+
+        #total for the direction, cache and store hits included
+        started = time.perf_counter()
+        arrivals = self._getCachedDirection(station, date, dir_)
+        self.observer.onPhase("direction", time.perf_counter() - started, station=station, direction=dir_)
+
+        return arrivals
+
+    def _getCachedDirection(self, station: Station, date: str, dir_: TrainDirection) -> list[Arrival]:
+        if self.cache is None:
+            return self._loadDirection(station, date, dir_)
+
+        return self.cache.getOrLoad((station.value.get("id"), date, dir_), lambda: self._loadDirection(station, date, dir_))
+
+    def _loadDirection(self, station: Station, date: str, dir_: TrainDirection) -> list[Arrival]:
+        if self.store is None:
+            return self._fetchDirection(station, date, dir_)
+
+        stored = self.store.get(station.value.get("id"), date, dir_)
+
+        if stored is None:
+            return self._refreshDirection(station, date, dir_)
+
+        arrivals, fetched_at = stored
+
+        if self.store.isStale(date, fetched_at):
+            self._refreshInBackground(station, date, dir_)
+
+        return arrivals
+
+    def _refreshDirection(self, station: Station, date: str, dir_: TrainDirection) -> list[Arrival]:
+        arrivals = self._fetchDirection(station, date, dir_)
+
+        self.store.put(station.value.get("id"), date, dir_, arrivals)
+
+        if self.cache is not None:
+            self.cache.put((station.value.get("id"), date, dir_), arrivals)
+
+        return arrivals
+
+    def _refreshInBackground(self, station: Station, date: str, dir_: TrainDirection) -> concurrent.futures.Future | None:
+        key = (station.value.get("id"), date, dir_)
+
+        with self._executor_lock:
+            if key in self._refreshing:
+                return None
+
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                return self._refreshDirection(station, date, dir_)
+            finally:
+                with self._executor_lock:
+                    self._refreshing.discard(key)
+
+        return self._getExecutor().submit(refresh)
+
+    def refreshStale(self) -> list[concurrent.futures.Future]:
+        #warm start, queue a background refresh for every stale stored timetable
+        if self.store is None:
+            return []
+
+        stations = {station.value.get("id"): station for station in Station}
+        futures = list()
+
+        for station_id, date, dir_ in self.store.staleEntries():
+            if station_id not in stations:
+                continue
+
+            future = self._refreshInBackground(stations[station_id], date, dir_)
+
+            if future is not None:
+                futures.append(future)
+
+        return futures
+
+    def getTimeTablePage(self, station: Station, date: str | datetime.date, dir_: TrainDirection) -> tuple[bytes, str | None]:
+        #raw page body and its encoding, for callers that parse elsewhere or not at all
+        res = self._fetchPage(station, formatDate(date), dir_)
+
+        return res.content, res.encoding
+
+    def _fetchPage(self, station: Station, date: str, dir_: TrainDirection) -> requests.Response:
+        observer = self.observer
+        started = time.perf_counter() if observer is not None else 0
+
+        url = directionUrl(stationUrl(self.web_base_url, station), date, dir_)
+
+        if observer is not None:
+            observer.onPhase("url", time.perf_counter() - started, station=station, direction=dir_)
+            started = time.perf_counter()
+
+        res = self.transport.get(url)
+
+        if observer is not None:
+            observer.onPhase("request", time.perf_counter() - started, station=station, direction=dir_, status=res.status_code, bytes=len(res.content))
+
+        if res.status_code != 200:
+            raise TrainException(f"Could not get timetable: {res.status_code}, {res.text}, url: {url}")
+
+        return res
+
+    def _fetchDirection(self, station: Station, date: str, dir_: TrainDirection) -> list[Arrival]:
+        return parseArrivals(self._fetchPage(station, date, dir_).text, dir_, self.parser, self.observer)
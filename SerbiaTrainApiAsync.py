@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import urllib.parse
+import concurrent.futures
+from json import loads as jsonLoads
+from typing import AsyncIterator, Iterable
+
+import aiohttp
+
+from SerbiaTrainApi import API_BASE_URL, WEB_BASE_URL, TrainException, TrainDirection, Station, TimeTable, Arrival, \
+    formatDate, stationUrl, directionUrl, parseStations, parseArrivals, nowTimestamp, PARSERS
+
+class AsyncTrainApi:
+    def __init__(self, session: aiohttp.ClientSession | None = None, pool_size: int = 10, concurrency: int = 8, timeout: float = 30, api_base_url: str = API_BASE_URL, web_base_url: str = WEB_BASE_URL, executor: concurrent.futures.Executor | None = None, parser: str = "lxml"):
+        if parser not in PARSERS:
+            raise TrainException(f"Unknown parser: {parser}, expected one of {', '.join(PARSERS)}")
+
+        self.parser = parser
+        self.api_base_url = api_base_url
+        self.web_base_url = web_base_url
+        self.pool_size = pool_size
+        self.timeout = timeout
+
+        #parsing runs here so it does not block the event loop, None is the loop default executor
+        self.executor = executor
+
+        self._session = session
+        self._owns_session = session is None
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    async def __aenter__(self) -> AsyncTrainApi:
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def close(self):
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _getSession(self) -> aiohttp.ClientSession:
+        #session has to be created inside a running loop
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                auto_decompress=True
+            )
+
+        return self._session
+
+    async def _get(self, url: str) -> tuple[int, str]:
+        async with self._semaphore:
+            async with self._getSession().get(url) as res:
+                return res.status, await res.text()
+
+    async def getStations(self, search="") -> list[dict]:
+        status, text = await self._get(f"{self.api_base_url}/stanica/?term={urllib.parse.quote(search)}")
+
+        if status != 200:
+            raise TrainException(f"Api error occured: {status}, {text}")
+
+        return parseStations(jsonLoads(text))
+
+    async def getTimeTable(self, station: Station, date: str | datetime.date, directions: TrainDirection = TrainDirection.INBOUND | TrainDirection.OUTBOUND) -> TimeTable:
+        date = formatDate(date)
+        station_url = stationUrl(self.web_base_url, station)
+
+        results = await asyncio.gather(*[self._getDirection(station_url, date, dir_) for dir_ in directions], return_exceptions=True)
+        errors = [r for r in results if isinstance(r, BaseException)]
+
+        if len(errors) == 1:
+            raise errors[0]
+
+        if len(errors) > 1:
+            raise TrainException(f"Could not get timetable for {station.name} on {date}: {'; '.join(map(str, errors))}", errors)
+
+        #keep arrivals in direction order
+        arrivals = [arrival for result in results for arrival in result]
+
+        return TimeTable(LastUpdated=nowTimestamp(), Station=station, Arrivals=arrivals, Date=date)
+
+    async def getTimeTables(self, stations: Iterable[Station], dates: Iterable[str | datetime.date], directions: TrainDirection = TrainDirection.INBOUND | TrainDirection.OUTBOUND) -> AsyncIterator[TimeTable]:
+        dates = list(dates)
+
+        #every request shares one session, the semaphore keeps the fan out bounded
+        tasks = [asyncio.ensure_future(self.getTimeTable(station, date, directions)) for station in stations for date in dates]
+
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def getTimeTablePage(self, station: Station, date: str | datetime.date, dir_: TrainDirection) -> tuple[bytes, str | None]:
+        #raw page body and its charset, for callers that parse elsewhere
+        url = directionUrl(stationUrl(self.web_base_url, station), formatDate(date), dir_)
+
+        async with self._semaphore:
+            async with self._getSession().get(url) as res:
+                body = await res.read()
+
+                if res.status != 200:
+                    raise TrainException(f"Could not get timetable: {res.status}, {body.decode(res.charset or 'utf-8', errors='replace')}, url: {url}")
+
+                return body, res.charset
+
+    async def _getDirection(self, station_url: str, date: str, dir_: TrainDirection) -> list[Arrival]:
+        url = directionUrl(station_url, date, dir_)
+
+        status, text = await self._get(url)
+
+        if status != 200:
+            raise TrainException(f"Could not get timetable: {status}, {text}, url: {url}")
+
+        return await asyncio.get_running_loop().run_in_executor(self.executor, parseArrivals, text, dir_, self.parser)
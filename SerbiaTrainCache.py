@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import time
+import datetime
+import threading
+import concurrent.futures
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+class TimeTableCache:
+    def __init__(self, max_size: int = 1024, today_ttl: float = 60, future_ttl: float = 6 * 60 * 60, clock: Callable[[], float] = time.monotonic):
+        self.max_size = max_size
+        self.today_ttl = today_ttl
+        self.future_ttl = future_ttl
+        self.clock = clock
+
+        #key -> (expires at, value), oldest first
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        #key -> future of the one loader currently fetching it
+        self._inflight: dict[Hashable, concurrent.futures.Future] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def ttl(self, date: str) -> float:
+        #keys carry dates as dd.mm.yyyy, today changes with delays, other days hardly change
+        try:
+            day = datetime.datetime.strptime(date, "%d.%m.%Y").date()
+        except (TypeError, ValueError):
+            return self.today_ttl
+
+        return self.today_ttl if day == datetime.date.today() else self.future_ttl
+
+    def getOrLoad(self, key: tuple, loader: Callable[[], Any]) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                if entry[0] > self.clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+
+                del self._entries[key]
+                self.expirations += 1
+
+            future = self._inflight.get(key)
+            owner = future is None
+
+            if owner:
+                future = concurrent.futures.Future()
+                self._inflight[key] = future
+                self.misses += 1
+            else:
+                self.coalesced += 1
+
+        #someone else is already fetching this key, wait for their result
+        if not owner:
+            return future.result()
+
+        try:
+            value = loader()
+        except BaseException as e:
+            with self._lock:
+                del self._inflight[key]
+
+            future.set_exception(e)
+            raise
+
+        self.put(key, value)
+
+        with self._lock:
+            del self._inflight[key]
+
+        future.set_result(value)
+
+        return value
+
+    def put(self, key: tuple, value: Any):
+        with self._lock:
+            self._entries[key] = (self.clock() + self.ttl(key[1]), value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: tuple):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "evictions": self.evictions,
+                "expirations": self.expirations
+            }
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import datetime
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Iterable
+
+from SerbiaTrainApi import TrainApi, Station, TrainException, safeName, _newStation
+from SerbiaTrainStations import normalizeName, stationIndex
+
+DATA_MODULE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "SerbiaTrainStationData.py")
+
+_MEMBER_SEPARATORS = re.compile(r"[^A-Z0-9]+")
+
+def memberName(name: str) -> str:
+    #"LAPOVO RANŽ.STAJ." -> LAPOVO_RANZ_STAJ
+    member = _MEMBER_SEPARATORS.sub("_", safeName(name)).strip("_")
+    return f"_{member}" if member[:1].isdigit() else member
+
+def catalogue() -> list[dict]:
+    return [dict(station.value) for station in Station]
+
+@dataclass
+class CatalogueDiff:
+    Added: list[dict] = field(default_factory=list)
+    Removed: list[dict] = field(default_factory=list)
+    Renamed: list[tuple[dict, dict]] = field(default_factory=list) #(old, new)
+
+    def __bool__(self) -> bool:
+        return len(self.Added) + len(self.Removed) + len(self.Renamed) > 0
+
+def diffStations(old: Iterable[dict], new: Iterable[dict]) -> CatalogueDiff:
+    #stations are matched by id, a different name under the same id is a rename
+    old = {station["id"]: station for station in old}
+    new = {station["id"]: station for station in new}
+    diff = CatalogueDiff()
+
+    for id_, station in new.items():
+        previous = old.get(id_)
+
+        if previous is None:
+            diff.Added.append(station)
+        elif previous["name"] != station["name"]:
+            diff.Renamed.append((previous, station))
+
+    diff.Removed.extend(station for id_, station in old.items() if id_ not in new)
+
+    return diff
+
+def mergeStations(old: list[dict], new: list[dict], keep_removed: bool = True) -> list[tuple[str, dict]]:
+    #(member name, station) in catalogue order, new stations at the end.
+    #renamed stations keep their member name so code using Station.<NAME> keeps working
+    members = {station.value["id"]: station.name for station in Station}
+    live = {station["id"]: station for station in new}
+    merged = list()
+    taken = set()
+
+    for station in old:
+        if station["id"] in live or keep_removed:
+            member = members.get(station["id"]) or memberName(station["name"])
+            merged.append((member, live.get(station["id"], station)))
+            taken.add(member)
+
+    known = {station["id"] for station in old}
+
+    for station in new:
+        if station["id"] in known:
+            continue
+
+        member = memberName(station["name"])
+
+        if member in taken:
+            member = f"{member}_{station['id']}"
+
+        merged.append((member, station))
+        taken.add(member)
+
+    return merged
+
+def generateStationData(stations: list[tuple[str, dict]], source: str = "") -> str:
+    def table(name: str, values: Iterable[str]) -> str:
+        return f"{name} = (\n" + "".join(f"    {value!r},\n" for value in values) + ")\n"
+
+    header = [
+        "# generated station catalogue, one entry per Station member in parallel tuples",
+        "# do not edit by hand, regenerate with SerbiaTrainCatalogue.py"
+    ]
+
+    if source:
+        header.append(f"# synced from {source} on {datetime.date.today().isoformat()}")
+
+    members = "".join(f"    {member}: ClassVar[Station]\n" for member, _ in stations)
+
+    return "\n".join([
+        *header,
+        "",
+        "from __future__ import annotations",
+        "",
+        "from typing import TYPE_CHECKING, ClassVar",
+        "",
+        "if TYPE_CHECKING:",
+        "    from SerbiaTrainApi import Station",
+        "",
+        table("MEMBERS", (member for member, _ in stations)),
+        table("NAMES", (station["name"] for _, station in stations)),
+        table("IDS", (station["id"] for _, station in stations)),
+        table("SAFE_NAMES", (station["safe name"] for _, station in stations)),
+        "# search keys for SerbiaTrainStations, precomputed so the index builds without folding every name",
+        table("NORMALIZED_NAMES", (normalizeName(station["name"]) for _, station in stations)),
+        "class StationMembers:",
+        "    #every member declared for type checkers and IDEs, the values are set when SerbiaTrainApi builds Station",
+        "    __slots__ = ()",
+        "",
+        members
+    ])
+
+def writeStationData(stations: list[tuple[str, dict]], path: str = DATA_MODULE, source: str = ""):
+    #written next to the target and moved over it, a failed run never leaves half a module
+    tmp = f"{path}.tmp"
+
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(generateStationData(stations, source))
+
+    os.replace(tmp, path)
+
+class StationCatalogue:
+    #the live station list kept in a local file, fetched at most once per ttl
+    def __init__(self, api: TrainApi | None = None, path: str | None = "stations.json", ttl: float = 24 * 60 * 60, clock: Callable[[], float] = time.time):
+        self.api = api
+        self.path = path
+        self.ttl = ttl
+        self.clock = clock
+
+        self._stations: list[dict] | None = None
+        self._fetched_at = 0.0
+        self._by_id: dict[str, dict] = {}
+        self._by_name: dict[str, dict] = {}
+        #one Station per unknown id, so repeated lookups give the same object
+        self._unregistered: dict[str, Station] = {}
+        self._lock = threading.Lock()
+
+        self.fetches = 0
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        self._index(cached["stations"], cached["fetched_at"])
+
+    def _index(self, stations: list[dict], fetched_at: float):
+        self._stations = stations
+        self._fetched_at = fetched_at
+        self._by_id = {station["id"]: station for station in stations}
+        self._by_name = {}
+
+        for station in stations:
+            self._by_name.setdefault(normalizeName(station["name"]), station)
+
+    def _fetch(self):
+        if self.api is None:
+            self.api = TrainApi()
+
+        stations = self.api.getStations("")
+        self.fetches += 1
+        self._index(stations, self.clock())
+
+        if self.path is not None:
+            tmp = f"{self.path}.tmp"
+
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"fetched_at": self._fetched_at, "stations": stations}, f, ensure_ascii=False)
+
+            os.replace(tmp, self.path)
+
+    def live(self, refresh: bool = False) -> list[dict]:
+        with self._lock:
+            if self._stations is None and self.path is not None and not refresh:
+                self._load()
+
+            if refresh or self._stations is None or self.clock() - self._fetched_at >= self.ttl:
+                self._fetch()
+
+            return self._stations
+
+    def lookup(self, query: str) -> Station | None:
+        #catalogue first, the live list only for stations it does not know, by id or name.
+        #those come back as Stations outside the catalogue, usable with TrainApi but not in Station[...] or iteration
+        station = stationIndex().getById(query) or stationIndex().getByName(query)
+
+        if station is not None:
+            return station
+
+        self.live()
+
+        with self._lock:
+            value = self._by_id.get(query) or self._by_name.get(normalizeName(query))
+
+            if value is None:
+                return None
+
+            station = self._unregistered.get(value["id"])
+
+            if station is None:
+                station = self._unregistered[value["id"]] = _newStation(memberName(value["name"]), dict(value))
+
+            return station
+
+    def diff(self, refresh: bool = False) -> CatalogueDiff:
+        return diffStations(catalogue(), self.live(refresh))
+
+def printDiff(diff: CatalogueDiff, out=sys.stdout):
+    for station in diff.Added:
+        print(f"+ {station['id']} {station['name']}", file=out)
+
+    for old, new in diff.Renamed:
+        print(f"~ {old['id']} {old['name']} -> {new['name']}", file=out)
+
+    for station in diff.Removed:
+        print(f"- {station['id']} {station['name']}", file=out)
+
+    print(f"{len(diff.Added)} added, {len(diff.Renamed)} renamed, {len(diff.Removed)} removed", file=out)
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Compare the station catalogue with the live station list and regenerate it")
+    parser.add_argument("--cache", default="stations.json", help="local copy of the live list")
+    parser.add_argument("--ttl", type=float, default=24 * 60 * 60, help="seconds before the local copy is fetched again")
+    parser.add_argument("--refresh", action="store_true", help="fetch the live list even when the local copy is fresh")
+    parser.add_argument("--write", action="store_true", help="regenerate the station data module")
+    parser.add_argument("--allow-removals", action="store_true", help="drop stations missing from the live list, they are kept otherwise")
+    parser.add_argument("--output", default=DATA_MODULE)
+    args = parser.parse_args(argv)
+
+    with TrainApi() as api:
+        stations = StationCatalogue(api, args.cache, args.ttl)
+
+        try:
+            live = stations.live(args.refresh)
+        except TrainException as e:
+            print(e, file=sys.stderr)
+            sys.exit(1)
+
+    diff = diffStations(catalogue(), live)
+    printDiff(diff)
+
+    if args.write and diff:
+        writeStationData(mergeStations(catalogue(), live, keep_removed=not args.allow_removals), args.output, api.api_base_url)
+        print(f"wrote {args.output}")
+
+if __name__ == "__main__":
+    main()
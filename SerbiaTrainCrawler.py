@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import os
+import sys
+import time
+import random
+import argparse
+import datetime
+import threading
+import concurrent.futures
+from typing import Callable, Iterable, TextIO
+
+from SerbiaTrainApi import TrainApi, TrainTransport, TrainException, TrainDirection, Station, TimeTable, writeNDJSON, nowTimestamp
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: float | None = None, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.burst = max(1.0, rate) if burst is None else burst
+        self.clock = clock
+
+        self._tokens = self.burst
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1):
+        #blocks until enough tokens have been refilled
+        while True:
+            with self._lock:
+                now = self.clock()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+
+                wait = (tokens - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+def truncateTornLine(path: str, chunk_size: int = 64 * 1024):
+    #a killed crawl can leave half a line at the end, cut the file back to its last newline
+    #so appended lines never get glued onto it
+    if not os.path.exists(path):
+        return
+
+    with open(path, "rb+") as f:
+        end = f.seek(0, os.SEEK_END)
+        position = end
+
+        while position > 0:
+            start = max(0, position - chunk_size)
+            f.seek(start)
+            newline = f.read(position - start).rfind(b"\n")
+
+            if newline >= 0:
+                position = start + newline + 1
+                break
+
+            position = start
+
+        if position < end:
+            f.truncate(position)
+
+class Crawler:
+    def __init__(self, api: TrainApi, output: str, checkpoint: str, concurrency: int = 8, rate: float = 5, burst: float | None = None, retries: int = 3, backoff: float = 1, progress_interval: float = 10, report: Callable[[str], None] = print):
+        self.api = api
+        self.output = output
+        self.checkpoint = checkpoint
+        self.concurrency = concurrency
+        self.bucket = TokenBucket(rate, burst)
+        self.retries = retries
+        self.backoff = backoff
+        self.progress_interval = progress_interval
+        self.report = report
+
+        self._lock = threading.Lock()
+        self.pages = 0
+        self.rows = 0
+        self.failed = 0
+        self.skipped = 0
+
+    @staticmethod
+    def jobKey(station: Station, date: datetime.date, dir_: TrainDirection) -> str:
+        return f"{station.value.get('id')}\t{date.strftime('%d.%m.%Y')}\t{dir_.value}"
+
+    def completedJobs(self) -> set[str]:
+        if not os.path.exists(self.checkpoint):
+            return set()
+
+        with open(self.checkpoint, encoding="utf-8") as f:
+            return {line.rstrip("\n") for line in f if line.endswith("\n")}
+
+    def _fetch(self, station: Station, date: datetime.date, dir_: TrainDirection) -> TimeTable:
+        #the only retry layer, every attempt takes a token, so the api's transport should not retry itself
+        for attempt in range(self.retries + 1):
+            self.bucket.acquire()
+
+            try:
+                return self.api.getTimeTable(station, date, dir_)
+            except Exception:
+                if attempt >= self.retries:
+                    raise
+
+                #exponential backoff with full jitter
+                time.sleep(random.uniform(0, self.backoff * 2 ** attempt))
+
+    def _runJob(self, station: Station, date: datetime.date, dir_: TrainDirection, out: TextIO, checkpoint: TextIO):
+        timetable = self._fetch(station, date, dir_)
+
+        with self._lock:
+            rows = writeNDJSON([timetable], out)
+            out.flush()
+
+            #checkpoint only after the rows are written, a killed crawl redoes at most the jobs in flight
+            checkpoint.write(self.jobKey(station, date, dir_) + "\n")
+            checkpoint.flush()
+
+            self.pages += 1
+            self.rows += rows
+
+    def _progress(self, total: int, started: float):
+        elapsed = max(time.monotonic() - started, 1e-9)
+
+        with self._lock:
+            done = self.pages + self.failed + self.skipped
+            self.report(f"[{nowTimestamp()}] {done}/{total} jobs, {self.failed} failed, {self.pages / elapsed:.2f} pages/s, {self.rows / elapsed:.1f} rows/s")
+
+    def run(self, stations: Iterable[Station], dates: Iterable[datetime.date], directions: TrainDirection = TrainDirection.INBOUND | TrainDirection.OUTBOUND) -> dict:
+        truncateTornLine(self.output)
+        truncateTornLine(self.checkpoint)
+
+        completed = self.completedJobs()
+        jobs = list()
+        stations = list(stations)
+
+        #day by day, so the output can be consumed one day at a time (see SerbiaTrainGtfs)
+        for date in dates:
+            for station in stations:
+                for dir_ in directions:
+                    if self.jobKey(station, date, dir_) in completed:
+                        self.skipped += 1
+                    else:
+                        jobs.append((station, date, dir_))
+
+        total = len(jobs) + self.skipped
+        started = time.monotonic()
+        stop = threading.Event()
+
+        def reporter():
+            while not stop.wait(self.progress_interval):
+                self._progress(total, started)
+
+        threading.Thread(target=reporter, daemon=True).start()
+
+        with open(self.output, "a", encoding="utf-8") as out, open(self.checkpoint, "a", encoding="utf-8") as checkpoint:
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="Crawler")
+
+            try:
+                futures = {executor.submit(self._runJob, *job, out, checkpoint): job for job in jobs}
+
+                for future in concurrent.futures.as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        station, date, dir_ = futures[future]
+
+                        with self._lock:
+                            self.failed += 1
+
+                        self.report(f"failed {station.name} {date.strftime('%d.%m.%Y')} {dir_.name}: {e}")
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+                stop.set()
+
+        self._progress(total, started)
+
+        elapsed = time.monotonic() - started
+
+        return {
+            "jobs": total,
+            "pages": self.pages,
+            "rows": self.rows,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "seconds": elapsed,
+            "pages_per_second": self.pages / elapsed if elapsed > 0 else 0,
+            "rows_per_second": self.rows / elapsed if elapsed > 0 else 0
+        }
+
+def rollingDates(days: int, start: datetime.date | None = None) -> list[datetime.date]:
+    start = datetime.date.today() if start is None else start
+    return [start + datetime.timedelta(days=i) for i in range(days)]
+
+def resolveStations(names: list[str]) -> list[Station]:
+    from SerbiaTrainStations import stationIndex
+
+    stations = list()
+
+    for name in names:
+        station = stationIndex().getById(name) or stationIndex().getByName(name)
+
+        if station is None:
+            raise TrainException(f"Unknown station: {name}")
+
+        stations.append(station)
+
+    return stations
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Crawl timetables for every station over a rolling window of days")
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--start", help="first day as dd.mm.yyyy, today by default")
+    parser.add_argument("--station", action="append", default=[], help="station id or name, repeatable, all stations by default")
+    parser.add_argument("--direction", choices=["inbound", "outbound", "both"], default="both")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--rate", type=float, default=5, help="requests per second toward srbvoz.rs")
+    parser.add_argument("--burst", type=float, default=None)
+    parser.add_argument("--retries", type=int, default=3)
+    parser.add_argument("--backoff", type=float, default=1, help="base backoff in seconds")
+    parser.add_argument("--output", default="crawl.ndjson")
+    parser.add_argument("--checkpoint", default=None, help="defaults to <output>.checkpoint")
+    parser.add_argument("--progress-interval", type=float, default=10)
+    args = parser.parse_args(argv)
+
+    start = datetime.datetime.strptime(args.start, "%d.%m.%Y").date() if args.start else None
+    stations = resolveStations(args.station) if len(args.station) > 0 else list(Station)
+    directions = {
+        "inbound": TrainDirection.INBOUND,
+        "outbound": TrainDirection.OUTBOUND,
+        "both": TrainDirection.INBOUND | TrainDirection.OUTBOUND
+    }[args.direction]
+
+    with TrainApi(transport=TrainTransport(pool_size=args.concurrency, retries=0)) as api:
+        crawler = Crawler(
+            api,
+            output=args.output,
+            checkpoint=args.checkpoint or f"{args.output}.checkpoint",
+            concurrency=args.concurrency,
+            rate=args.rate,
+            burst=args.burst,
+            retries=args.retries,
+            backoff=args.backoff,
+            progress_interval=args.progress_interval,
+            report=lambda line: print(line, file=sys.stderr)
+        )
+
+        stats = crawler.run(stations, rollingDates(args.days, start), directions)
+
+    print(stats)
+
+    if stats["failed"] > 0:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import io
+import os
+import csv
+import sys
+import shutil
+import zipfile
+import argparse
+import tempfile
+from typing import BinaryIO, Iterable, TextIO
+
+from SerbiaTrainApi import Station, TrainType, TimeTable, TrainException, parseDate, formatDate, readNDJSON, writeNDJSON
+from SerbiaTrainTrips import TripIndex, Trip
+
+AGENCY_ID = "SRBVOZ"
+UNKNOWN_ROUTE = "UNKNOWN"
+#rail, the basic route type every GTFS consumer understands
+ROUTE_TYPE = 2
+
+ROUTES = {
+    TrainType.COMMUTER_TRAIN: "BG:VOZ",
+    TrainType.REGIONAL_TRAIN: "Regio",
+    TrainType.INTER_CITY: "InterCity",
+    None: "Unknown"
+}
+
+def gtfsTime(minutes: int) -> str:
+    #GTFS times keep counting past 24:00 for trips that run over midnight
+    return f"{minutes // 60:02d}:{minutes % 60:02d}:00"
+
+def routeId(train_type: TrainType | None) -> str:
+    return UNKNOWN_ROUTE if train_type is None else train_type.name
+
+def _stopTimes(trip: Trip) -> list[tuple[Station, int, int]]:
+    #stops with absolute arrival and departure, stops without any time are left out
+    stop_times = list()
+    offset = 0
+    last = None
+
+    for stop in trip.Stops:
+        arrival = stop.ArrivalTime if stop.ArrivalTime is not None else stop.DepartureTime
+        departure = stop.DepartureTime if stop.DepartureTime is not None else stop.ArrivalTime
+
+        if arrival is None:
+            continue
+
+        if last is not None and arrival + offset < last:
+            offset += 24 * 60
+
+        arrival += offset
+
+        if departure + offset < arrival:
+            departure += 24 * 60
+
+        departure += offset
+        last = departure
+
+        stop_times.append((stop.Station, arrival, departure))
+
+    return stop_times
+
+class GtfsWriter:
+    #stop_times.txt is streamed straight into the archive, the smaller files are spooled to disk and
+    #added on close, so only the days currently open (max_open_days) are kept in memory
+    def __init__(self, file: str | os.PathLike | BinaryIO, max_open_days: int = 2, agency_name: str = "Srbija Voz", agency_url: str = "https://www.srbvoz.rs", agency_timezone: str = "Europe/Belgrade", compression: int = zipfile.ZIP_DEFLATED):
+        self.max_open_days = max_open_days
+        self.agency = (AGENCY_ID, agency_name, agency_url, agency_timezone, "sr")
+
+        self.zip = zipfile.ZipFile(file, "w", compression)
+        self._stop_times_file = io.TextIOWrapper(self.zip.open("stop_times.txt", "w", force_zip64=True), encoding="utf-8", newline="")
+        self._stop_times = csv.writer(self._stop_times_file)
+        self._stop_times.writerow(("trip_id", "arrival_time", "departure_time", "stop_id", "stop_sequence"))
+
+        self._trips_file = tempfile.TemporaryFile("w+", encoding="utf-8", newline="")
+        self._trips = csv.writer(self._trips_file)
+        self._trips.writerow(("route_id", "service_id", "trip_id", "trip_short_name"))
+
+        self._calendar_file = tempfile.TemporaryFile("w+", encoding="utf-8", newline="")
+        self._calendar = csv.writer(self._calendar_file)
+        self._calendar.writerow(("service_id", "date", "exception_type"))
+
+        #dd.mm.yyyy -> trips of that day, oldest first
+        self._open: dict[str, TripIndex] = {}
+        self._written: set[str] = set()
+        self._routes: set[TrainType | None] = set()
+        #stations outside the catalogue that showed up in a timetable, by id
+        self._extra_stops: dict[str, Station] = {}
+        self._closed = False
+
+        self.trips = 0
+        self.stop_times = 0
+
+    def __enter__(self) -> GtfsWriter:
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def add(self, timetable: TimeTable):
+        if timetable.Date is None:
+            raise TrainException(f"Timetable for {timetable.Station.name} has no date")
+
+        date = formatDate(timetable.Date)
+        index = self._open.get(date)
+
+        if index is None:
+            if date in self._written:
+                raise TrainException(f"Timetables for {date} arrived after that day was written, sort the input by date or use exportGtfs")
+
+            if len(self._open) >= self.max_open_days:
+                self.flush(next(iter(self._open)))
+
+            index = self._open[date] = TripIndex()
+
+        index.add(timetable, date=date)
+
+        if Station._by_id.get(timetable.Station.value["id"]) is not timetable.Station:
+            self._extra_stops.setdefault(timetable.Station.value["id"], timetable.Station)
+
+    def extend(self, timetables: Iterable[TimeTable]):
+        for timetable in timetables:
+            self.add(timetable)
+
+    def flush(self, date: str | None = None):
+        #writes the trips of one day, or of every open day, nothing can be added for them afterwards
+        for day in list(self._open) if date is None else [formatDate(date)]:
+            index = self._open.pop(day, None)
+
+            if index is not None:
+                self._writeDay(day, index)
+                self._written.add(day)
+
+    def _writeDay(self, date: str, index: TripIndex):
+        service_id = parseDate(date).strftime("%Y%m%d")
+        trips = 0
+
+        for train_number in index.trains(date):
+            trip = index.getTrip(train_number, date)
+            stop_times = _stopTimes(trip)
+
+            #a single stop is not a trip
+            if len(stop_times) < 2:
+                continue
+
+            train_type = next((stop.TrainType for stop in trip.Stops if stop.TrainType is not None), None)
+            trip_id = f"{train_number}-{service_id}"
+
+            self._routes.add(train_type)
+            self._trips.writerow((routeId(train_type), service_id, trip_id, train_number))
+            self._stop_times.writerows(
+                (trip_id, gtfsTime(arrival), gtfsTime(departure), station.value["id"], sequence)
+                for sequence, (station, arrival, departure) in enumerate(stop_times, 1)
+            )
+
+            trips += 1
+            self.stop_times += len(stop_times)
+
+        if trips > 0:
+            self._calendar.writerow((service_id, service_id, 1))
+            self.trips += trips
+
+    def _writeCsv(self, name: str, header: tuple, rows: Iterable[tuple]):
+        with io.TextIOWrapper(self.zip.open(name, "w"), encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(rows)
+
+    def _copySpooled(self, name: str, spooled):
+        spooled.seek(0)
+
+        with io.TextIOWrapper(self.zip.open(name, "w", force_zip64=True), encoding="utf-8", newline="") as f:
+            shutil.copyfileobj(spooled, f)
+
+        spooled.close()
+
+    def close(self):
+        if self._closed:
+            return
+
+        self.flush()
+        self._stop_times_file.close()
+        self._closed = True
+
+        self._writeCsv("agency.txt", ("agency_id", "agency_name", "agency_url", "agency_timezone", "agency_lang"), [self.agency])
+        #the catalogue has no coordinates, the columns are there for consumers that expect them.
+        #stations from outside the catalogue come last, a catalogue id is never written twice
+        stops = [*Station, *(station for id_, station in self._extra_stops.items() if id_ not in Station._by_id)]
+        self._writeCsv("stops.txt", ("stop_id", "stop_name", "stop_lat", "stop_lon"), ((station.value["id"], station.value["name"], "", "") for station in stops))
+        self._writeCsv("routes.txt", ("route_id", "agency_id", "route_short_name", "route_type"), (
+            (routeId(train_type), AGENCY_ID, ROUTES[train_type], ROUTE_TYPE) for train_type in sorted(self._routes, key=routeId)
+        ))
+        self._copySpooled("trips.txt", self._trips_file)
+        self._copySpooled("calendar_dates.txt", self._calendar_file)
+
+        self.zip.close()
+
+def exportGtfs(timetables: Iterable[TimeTable], file: str | os.PathLike | BinaryIO, **kwargs) -> dict:
+    #the input may come in any order, e.g. a resumed crawl appends retried pages of earlier days.
+    #timetables are spilled to one temporary NDJSON file per day, then every day is read back and written once
+    with tempfile.TemporaryDirectory(prefix="gtfs") as directory:
+        days: dict[str, TextIO] = {}
+
+        try:
+            for timetable in timetables:
+                if timetable.Date is None:
+                    raise TrainException(f"Timetable for {timetable.Station.name} has no date")
+
+                date = formatDate(timetable.Date)
+                day = days.get(date)
+
+                if day is None:
+                    day = days[date] = open(os.path.join(directory, f"{parseDate(date):%Y%m%d}.ndjson"), "w+", encoding="utf-8")
+
+                writeNDJSON([timetable], day)
+
+            with GtfsWriter(file, max_open_days=1, **kwargs) as writer:
+                for date in sorted(days, key=parseDate):
+                    day = days[date]
+                    day.seek(0)
+
+                    writer.extend(readNDJSON(day))
+                    writer.flush(date)
+        finally:
+            for day in days.values():
+                day.close()
+
+    return {"trips": writer.trips, "stop_times": writer.stop_times}
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Export crawled NDJSON timetables as a GTFS feed")
+    parser.add_argument("input", nargs="+", help="NDJSON files written by SerbiaTrainCrawler, in any order")
+    parser.add_argument("--output", default="gtfs.zip")
+    args = parser.parse_args(argv)
+
+    def timetables():
+        for path in args.input:
+            with open(path, encoding="utf-8") as f:
+                yield from readNDJSON(f)
+
+    try:
+        stats = exportGtfs(timetables(), args.output)
+    except TrainException as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+
+    print(stats)
+
+if __name__ == "__main__":
+    main()
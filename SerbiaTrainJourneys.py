@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import bisect
+import datetime
+from array import array
+from dataclasses import dataclass
+from typing import Iterable
+
+from SerbiaTrainApi import Station, TimeTable, parseTime
+from SerbiaTrainTrips import TripIndex, Trip
+
+_INFINITY = 2 ** 31 - 1
+
+@dataclass
+class Leg:
+    TrainNumber: int
+    From: Station
+    To: Station
+    DepartureTime: int #minutes since midnight of the service day, can pass 24:00
+    ArrivalTime: int
+
+@dataclass
+class Journey:
+    Legs: list[Leg]
+    DepartureTime: int #when the first train leaves
+    ArrivalTime: int
+    QueryTime: int | None = None #the earliest departure that was asked for
+
+    @property
+    def Transfers(self) -> int:
+        return max(len(self.Legs) - 1, 0)
+
+def _tripConnections(trip: Trip) -> list[tuple[int, int, Station, Station]]:
+    #consecutive stops become elementary connections, times keep growing across midnight
+    connections = list()
+    offset = 0
+    last = None
+
+    def absolute(minutes: int) -> int:
+        nonlocal offset, last
+
+        if last is not None and minutes + offset < last:
+            offset += 24 * 60
+
+        last = minutes + offset
+        return last
+
+    previous = None
+
+    for stop in trip.Stops:
+        arrival = stop.ArrivalTime if stop.ArrivalTime is not None else stop.DepartureTime
+        departure = stop.DepartureTime if stop.DepartureTime is not None else stop.ArrivalTime
+
+        if arrival is None:
+            continue
+
+        arrival = absolute(arrival)
+        departure = absolute(departure)
+
+        if previous is not None:
+            connections.append((previous[0], arrival, previous[1], stop.Station))
+
+        previous = (departure, stop.Station)
+
+    return connections
+
+class JourneyPlanner:
+    def __init__(self, connections: Iterable[tuple[int, int, int, Station, Station]], min_transfer: int = 5, transfer_times: dict[Station, int] | None = None):
+        #connections are (train number, departure, arrival, from, to)
+        self.stations: list[Station] = []
+        self._station_ids: dict[Station, int] = {}
+
+        rows = sorted(
+            (departure, arrival, self._stationId(from_), self._stationId(to), train_number)
+            for train_number, departure, arrival, from_, to in connections
+        )
+
+        #connections sorted by departure, one compact array per column
+        self.departures = array("i", [r[0] for r in rows])
+        self.arrivals = array("i", [r[1] for r in rows])
+        self.from_stations = array("i", [r[2] for r in rows])
+        self.to_stations = array("i", [r[3] for r in rows])
+        self.train_numbers = array("l", [r[4] for r in rows])
+
+        #dense trip ids, each train runs at most once a service day
+        trips: dict[int, int] = {}
+        self.trips = array("i", [trips.setdefault(r[4], len(trips)) for r in rows])
+        self.trip_count = len(trips)
+
+        self.min_transfer = min_transfer
+        self.transfer_times = array("i", [min_transfer] * len(self.stations))
+
+        for station, minutes in (transfer_times or {}).items():
+            if station in self._station_ids:
+                self.transfer_times[self._station_ids[station]] = minutes
+
+    def _stationId(self, station: Station) -> int:
+        station_id = self._station_ids.get(station)
+
+        if station_id is None:
+            station_id = self._station_ids[station] = len(self.stations)
+            self.stations.append(station)
+
+        return station_id
+
+    def __len__(self) -> int:
+        return len(self.departures)
+
+    @staticmethod
+    def fromTripIndex(index: TripIndex, date: str | datetime.date, **kwargs) -> JourneyPlanner:
+        connections = list()
+
+        for train_number in index.trains(date):
+            trip = index.getTrip(train_number, date)
+
+            for departure, arrival, from_, to in _tripConnections(trip):
+                connections.append((train_number, departure, arrival, from_, to))
+
+        return JourneyPlanner(connections, **kwargs)
+
+    @staticmethod
+    def fromTimeTables(timetables: Iterable[TimeTable], date: str | datetime.date, **kwargs) -> JourneyPlanner:
+        return JourneyPlanner.fromTripIndex(TripIndex(timetables), date, **kwargs)
+
+    def query(self, origin: Station, destination: Station, departure: int | str = 0) -> Journey | None:
+        #earliest arrival Connection Scan, returns None when the destination can not be reached
+        if isinstance(departure, str):
+            departure = parseTime(departure)
+
+        source = self._station_ids.get(origin)
+        target = self._station_ids.get(destination)
+
+        if source is None or target is None or source == target:
+            return None
+
+        station_count = len(self.stations)
+        #earliest time a train can be boarded at each station, transfer time already added
+        ready = [_INFINITY] * station_count
+        arrived = [_INFINITY] * station_count
+        in_connection = [-1] * station_count
+        boarded = [-1] * self.trip_count
+
+        ready[source] = departure
+
+        departures = self.departures
+        arrivals = self.arrivals
+        from_stations = self.from_stations
+        to_stations = self.to_stations
+        trips = self.trips
+        transfer_times = self.transfer_times
+
+        for c in range(bisect.bisect_left(departures, departure), len(departures)):
+            #nothing departing later can improve the answer
+            if departures[c] >= arrived[target]:
+                break
+
+            trip = trips[c]
+
+            if boarded[trip] < 0:
+                if ready[from_stations[c]] > departures[c]:
+                    continue
+
+                boarded[trip] = c
+
+            to = to_stations[c]
+
+            if arrivals[c] < arrived[to]:
+                arrived[to] = arrivals[c]
+                in_connection[to] = c
+                ready[to] = min(ready[to], arrivals[c] + transfer_times[to])
+
+        if in_connection[target] < 0:
+            return None
+
+        legs = self._legs(source, target, in_connection, boarded)
+
+        return Journey(Legs=legs, DepartureTime=legs[0].DepartureTime, ArrivalTime=arrived[target], QueryTime=departure)
+
+    def _legs(self, source: int, target: int, in_connection: list[int], boarded: list[int]) -> list[Leg]:
+        legs = list()
+        station = target
+
+        while station != source:
+            last = in_connection[station]
+            first = boarded[self.trips[last]]
+
+            legs.append(Leg(
+                TrainNumber=self.train_numbers[last],
+                From=self.stations[self.from_stations[first]],
+                To=self.stations[self.to_stations[last]],
+                DepartureTime=self.departures[first],
+                ArrivalTime=self.arrivals[last]
+            ))
+
+            station = self.from_stations[first]
+
+        legs.reverse()
+
+        return legs
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import math
+import threading
+
+from SerbiaTrainApi import TrainObserver
+
+class Histogram:
+    def __init__(self, precision: float = 0.02, smallest: float = 1e-6):
+        #log buckets, every bucket is precision wider than the one before,
+        #so percentiles are off by at most that much relative error
+        self.smallest = smallest
+        self._growth = math.log1p(precision)
+        self._buckets: dict[int, int] = {}
+
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def _bucket(self, seconds: float) -> int:
+        if seconds <= self.smallest:
+            return 0
+
+        return 1 + int(math.log(seconds / self.smallest) / self._growth)
+
+    def _upper(self, bucket: int) -> float:
+        return self.smallest * math.exp(bucket * self._growth)
+
+    def record(self, seconds: float):
+        bucket = self._bucket(seconds)
+        self._buckets[bucket] = self._buckets.get(bucket, 0) + 1
+
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def percentile(self, p: float) -> float | None:
+        if self.count == 0:
+            return None
+
+        rank = max(1, math.ceil(p / 100 * self.count))
+        seen = 0
+
+        for bucket in sorted(self._buckets):
+            seen += self._buckets[bucket]
+
+            if seen >= rank:
+                return min(max(self._upper(bucket), self.min), self.max)
+
+        return self.max
+
+    def summary(self) -> dict:
+        if self.count == 0:
+            return {"count": 0}
+
+        return {
+            "count": self.count,
+            "total_ms": self.total * 1000,
+            "mean_ms": self.total / self.count * 1000,
+            "min_ms": self.min * 1000,
+            "p50_ms": self.percentile(50) * 1000,
+            "p95_ms": self.percentile(95) * 1000,
+            "p99_ms": self.percentile(99) * 1000,
+            "max_ms": self.max * 1000
+        }
+
+class PhaseTimings(TrainObserver):
+    #aggregates TrainApi phases into one histogram each, plus counters for rows, statuses and bytes
+    def __init__(self, precision: float = 0.02):
+        self.precision = precision
+
+        self._phases: dict[str, Histogram] = {}
+        self._counts: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def onPhase(self, phase: str, seconds: float, **info):
+        with self._lock:
+            histogram = self._phases.get(phase)
+
+            if histogram is None:
+                histogram = self._phases[phase] = Histogram(self.precision)
+
+            histogram.record(seconds)
+
+            if "status" in info:
+                key = f"{phase}.status.{info['status']}"
+                self._counts[key] = self._counts.get(key, 0) + 1
+
+            if "bytes" in info:
+                key = f"{phase}.bytes"
+                self._counts[key] = self._counts.get(key, 0) + info["bytes"]
+
+    def onCount(self, name: str, value: int = 1, **info):
+        with self._lock:
+            self._counts[name] = self._counts.get(name, 0) + value
+
+    def percentile(self, phase: str, p: float) -> float | None:
+        with self._lock:
+            histogram = self._phases.get(phase)
+            return None if histogram is None else histogram.percentile(p)
+
+    def counts(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+    def summary(self) -> dict:
+        with self._lock:
+            return {
+                "phases": {phase: histogram.summary() for phase, histogram in self._phases.items()},
+                "counts": dict(self._counts)
+            }
+
+    def reset(self):
+        with self._lock:
+            self._phases.clear()
+            self._counts.clear()
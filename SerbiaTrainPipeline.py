@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import os
+import asyncio
+import datetime
+import concurrent.futures
+from dataclasses import dataclass
+from typing import AsyncIterator, Iterable
+
+from SerbiaTrainApi import TrainDirection, Station, Arrival, parseArrivals, arrivalToRow, arrivalFromRow, formatDate
+from SerbiaTrainApiAsync import AsyncTrainApi
+
+def parseRows(body: bytes, charset: str | None, direction: int, parser: str = "lxml") -> list[tuple]:
+    #runs in a worker process, returns plain row tuples instead of parse trees or Arrival objects
+    text = body if charset is None else body.decode(charset, errors="replace")
+
+    return [arrivalToRow(arrival) for arrival in parseArrivals(text, TrainDirection(direction), parser)]
+
+@dataclass
+class PageResult:
+    Station: Station
+    Date: str
+    Direction: TrainDirection
+    Arrivals: list[Arrival] | None
+    Error: Exception | None = None
+
+class ParsePipeline:
+    def __init__(self, api: AsyncTrainApi, processes: int | None = None, concurrency: int = 8, max_pending: int | None = None, parser: str = "lxml", pool: concurrent.futures.Executor | None = None):
+        self.api = api
+        self.concurrency = concurrency
+        self.parser = parser
+
+        processes = processes or os.cpu_count() or 1
+
+        #pages submitted to the parse pool at once, fetchers holding a body wait for a free slot
+        self.max_pending = max_pending if max_pending is not None else 2 * processes
+
+        self.pool = pool if pool is not None else concurrent.futures.ProcessPoolExecutor(max_workers=processes)
+        self._owns_pool = pool is None
+
+    def close(self):
+        if self._owns_pool:
+            self.pool.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> ParsePipeline:
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    async def run(self, jobs: Iterable[tuple[Station, str | datetime.date, TrainDirection]]) -> AsyncIterator[PageResult]:
+        loop = asyncio.get_running_loop()
+        jobs = iter(jobs)
+        parse_slots = asyncio.Semaphore(self.max_pending)
+        results = asyncio.Queue(maxsize=self.max_pending)
+        done = object()
+
+        async def fetchAndParse(station: Station, date: str, dir_: TrainDirection) -> PageResult:
+            try:
+                #each worker holds at most one body, so memory is bounded by concurrency plus the result queue
+                body, charset = await self.api.getTimeTablePage(station, date, dir_)
+
+                async with parse_slots:
+                    rows = await loop.run_in_executor(self.pool, parseRows, body, charset, dir_.value, self.parser)
+
+                del body
+
+                return PageResult(Station=station, Date=date, Direction=dir_, Arrivals=[arrivalFromRow(row) for row in rows])
+            except Exception as e:
+                return PageResult(Station=station, Date=date, Direction=dir_, Arrivals=None, Error=e)
+
+        async def worker():
+            #jobs is shared between workers, safe since only one coroutine runs at a time
+            for station, date, dir_ in jobs:
+                await results.put(await fetchAndParse(station, formatDate(date), dir_))
+
+        async def runWorkers():
+            try:
+                await asyncio.gather(*[worker() for _ in range(self.concurrency)])
+            finally:
+                await results.put(done)
+
+        runner = asyncio.ensure_future(runWorkers())
+
+        try:
+            while True:
+                result = await results.get()
+
+                if result is done:
+                    break
+
+                yield result
+
+            await runner
+        finally:
+            runner.cancel()
@@ -0,0 +1,2406 @@
+# generated station catalogue, one entry per Station member in parallel tuples
+# do not edit by hand, regenerate with SerbiaTrainCatalogue.py
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar
+
+if TYPE_CHECKING:
+    from SerbiaTrainApi import Station
+
+MEMBERS = (
+    'KEMENDIN_ST',
+    'ALTINA_ST',
+    'DOLJEVAC',
+    'KOCANE',
+    'PUKOVAC',
+    'BRESTOVAC',
+    'LIPOVICA',
+    'PECENJEVCE',
+    'ZIVKOVO',
+    'LESKOVAC',
+    'SAJINOVAC',
+    'JASENICA',
+    'RECICA',
+    'PODINA',
+    'PROKUPLJE',
+    'LUKOMIR',
+    'TOPLICKI_BADNJEVAC',
+    'ZITORADJA_CENTAR',
+    'LESAK',
+    'DREN',
+    'LEPOSAVIC',
+    'SOCANICA',
+    'IBARSKA_SLATINA',
+    'BANJSKA',
+    'VALAC',
+    'ZVECAN',
+    'PLANDISTE',
+    'PRIDVORICA',
+    'KOSOVSKA_MITROVICA_SEVER',
+    'MATARUSKA_BANJA',
+    'PROGORELICA',
+    'BOGUTOVACKA_BANJA',
+    'POLUMIR',
+    'USCE',
+    'JOSANICKA_BANJA',
+    'PISKANJA',
+    'BRVENIK',
+    'RVATI',
+    'RASKA',
+    'KAZNOVICI',
+    'RUDNICA',
+    'JERINA_STAJ',
+    'LOZNO',
+    'PUSTO_POLJE',
+    'MRZENICA',
+    'DEDINA',
+    'KRUSEVAC',
+    'KOSEVI',
+    'STOPANJA',
+    'POCEKOVINA',
+    'TRSTENIK',
+    'VRNJACKA_BANJA',
+    'LIPOVA_STA',
+    'PODUNAVCI',
+    'VRBA_STAJ',
+    'RATINA',
+    'TOMINAC_STA',
+    'VRANESI_STAJ',
+    'CITLUK',
+    'GRAD_STALAC_STA',
+    'BELOTINCE',
+    'MALOSISTE',
+    'CAPLJINAC',
+    'BRALJINA',
+    'STARO_TRUBAREVO',
+    'DJUNIS',
+    'VITKOVAC_STAJ',
+    'DONJI_LJUBES',
+    'KORMAN',
+    'TRNJANI',
+    'ADROVAC',
+    'ALEKSINAC',
+    'LUZANE',
+    'TESICA',
+    'GREJAC',
+    'SUPOVACKI_MOST',
+    'MEZGRAJA',
+    'TRUPALE',
+    'CEROVO_RAZANJ',
+    'VRTISTE',
+    'GORNJI_LJUBES',
+    'NOZRINA',
+    'CRVENI_KRST',
+    'NIS',
+    'ADRANI',
+    'MRSAC',
+    'SAMAILA',
+    'GORICANI',
+    'MRSINCI',
+    'ZABLACE',
+    'PRIJEVOR',
+    'OVCAR_BANJA',
+    'DRAGACEVO',
+    'TRBUSANI',
+    'BORACKO',
+    'BALUGA',
+    'JELEN_DO',
+    'KUKICI',
+    'GUGALJ_STA',
+    'CACAK',
+    'BATOCINA',
+    'GRADAC',
+    'BADNJEVAC',
+    'RESNIK_KRAGUJEVACKI',
+    'MILATOVAC',
+    'JOVANOVAC',
+    'ZAVOD',
+    'GROSNICA',
+    'DRAGOBRACA',
+    'KNIC',
+    'GRUZA',
+    'GUBEREVAC',
+    'VITKOVAC',
+    'MILAVCICI',
+    'VITANOVAC',
+    'SUMARICE',
+    'SIRCA',
+    'TOMICA_BRDO',
+    'KRAGUJEVAC',
+    'KRALJEVO',
+    'BRZAN',
+    'MILOSEVO',
+    'BAGRDAN',
+    'LANISTE',
+    'BUKOVCE',
+    'GILJE',
+    'PARACIN',
+    'SIKIRICA_RATARI',
+    'DRENOVAC',
+    'CICEVAC',
+    'LUCINA',
+    'JAGODINA',
+    'CUPRIJA',
+    'STALAC',
+    'VELIKA_PLANA',
+    'STARO_SELO',
+    'NOVO_SELO',
+    'MARKOVAC',
+    'LAPOVO_VAROS',
+    'LAPOVO_RANZ_STAJ',
+    'LAPOVO',
+    'MALA_KRSNA',
+    'GODOMIN',
+    'RADINAC',
+    'VRANOVO',
+    'SMEDEREVO',
+    'KOVACEVAC',
+    'RABROVAC',
+    'KUSADAK',
+    'RATARE',
+    'GLIBOVAC',
+    'PALANKA',
+    'MALA_PLANA',
+    'MATEJEVAC',
+    'PANTELEJ',
+    'JASENOVIK',
+    'GRAMADA',
+    'HADZICEVO',
+    'SVRLJIG',
+    'NISEVAC',
+    'PALILULA',
+    'SVRLJISKI_MILJKOVAC',
+    'PODVIS',
+    'RGOSTE',
+    'KNJAZEVAC',
+    'GORNJE_ZUNICE',
+    'DONJE_ZUNICE',
+    'MINICEVO',
+    'SELACKA_REKA',
+    'MALI_IZVOR',
+    'VRATARNICA',
+    'GRLJAN',
+    'TIMOK',
+    'ZAJECAR',
+    'TRNAVAC',
+    'COKONJAR',
+    'TABAKOVAC',
+    'TABAKOVACKA_REKA',
+    'BRUSNIK',
+    'TAMNIC',
+    'CRNOMASNICA',
+    'RAJAC',
+    'ROGLJEVO',
+    'VELJKOVO',
+    'KOBISNICA',
+    'NEGOTIN',
+    'PRAHOVO',
+    'PRAHOVO_PRISTANISTE',
+    'VRAZOGRNAC',
+    'RGOTINA',
+    'ZAGRADJE',
+    'BOR_TERETNA',
+    'MAJDANPEK',
+    'LESKOVO',
+    'JASIKOVO',
+    'VLAOLE',
+    'CEROVO',
+    'KRIVELJSKI_POTOK',
+    'MALI_KRIVELJ',
+    'GORNJANE',
+    'KRIVELJSKI_MOST',
+    'DEBELI_LUG',
+    'VLAOLE_SELO',
+    'SUSULAJKA',
+    'BREZONIK',
+    'POZAREVAC',
+    'LJUBICEVSKI_MOST',
+    'LASTRA',
+    'SAMARI',
+    'DRENOVACKI_KIK',
+    'RAZANA',
+    'KOSJERIC',
+    'KALENIC',
+    'SEVOJNO',
+    'TUBICI',
+    'UZICI',
+    'RASNA',
+    'LESKOVICE',
+    'GLUMAC',
+    'ZLAKUSA',
+    'OTANJ',
+    'RACA',
+    'POZEGA',
+    'UZICE_TERETNA',
+    'UZICE',
+    'BELA_REKA',
+    'BARAJEVO',
+    'BARAJEVO_CENTAR',
+    'VELIKI_BORAK',
+    'LESKOVAC_KOLUBARSKI',
+    'STEPOJEVAC',
+    'LAZAREVAC',
+    'SLOVAC',
+    'MLADJEVO',
+    'DIVCI',
+    'IVERAK',
+    'VREOCI',
+    'VALJEVO',
+    'LAJKOVAC',
+    'RIPANJ',
+    'KLENJE',
+    'RIPANJ_TUNEL',
+    'RALJA',
+    'SOPOT_KOSMAJSKI',
+    'VLASKO_POLJE',
+    'RIPANJ_KOLONIJA',
+    'MLADENOVAC',
+    'RESNIK',
+    'STAPARI',
+    'SUSICA',
+    'BRANESCI',
+    'ZLATIBOR',
+    'RIBNICA_ZLATIBORSKA',
+    'JABLANICA',
+    'STRPCI',
+    'PRIBOJ',
+    'PRIBOJSKA_BANJA',
+    'BISTRICA_NA_LIMU',
+    'PRIJEPOLJE',
+    'PRIJEPOLJE_TERETNA',
+    'BRODAREVO',
+    'RISTANOVICA_POLJE',
+    'TRIPKOVA',
+    'DZUROVO',
+    'POLJICE',
+    'ZEMUN_POLJE',
+    'ZEMUN',
+    'NOVI_BEOGRAD',
+    'SEBES',
+    'OVCA',
+    'TOSIN_BUNAR',
+    'PANCEVACKI_MOST',
+    'PANCEVO_STRELISTE',
+    'KRNJACA',
+    'KRNJACA_MOST_STA',
+    'BEOGRAD_CENTAR',
+    'KARADJORDJEV_PARK',
+    'VUKOV_SPOMENIK',
+    'KIJEVO',
+    'KNEZEVAC',
+    'RAKOVICA',
+    'BATAJNICA',
+    'MAJUR_STAJ',
+    'PRNJAVOR_MACVANSKI',
+    'LESNICA',
+    'LOZNICA',
+    'KOVILJACA',
+    'BRASINA',
+    'DONJA_BORINA_STAJ',
+    'ZVORNIK',
+    'SABAC',
+    'NOVA_PAZOVA',
+    'STARA_PAZOVA',
+    'GOLUBINCI',
+    'PUTINCI',
+    'KRALJEVCI_STAJ',
+    'SREMSKA_MITROVICA',
+    'MARTINCI',
+    'KUKUJEVCI_ERDEVIK',
+    'SID',
+    'RUMA',
+    'BUDJANOVCI',
+    'NIKINCI',
+    'PLATICEVO',
+    'KLENAK',
+    'INDJIJA',
+    'BESKA',
+    'SREMSKI_KARLOVCI',
+    'PETROVARADIN',
+    'NOVI_SAD',
+    'NOVI_SAD_RANZIRNA',
+    'SZEGED',
+    'SZENTMIHALYTELEK',
+    'ROESZKE',
+    'PANCEVO_VAROS',
+    'BANATSKO_NOVO_SELO',
+    'VLADIMIROVAC',
+    'ALIBUNAR',
+    'BANATSKI_KARLOVAC',
+    'NIKOLINCI',
+    'ULJMA',
+    'VLAJKOVAC',
+    'VRSAC',
+    'PANCEVO_VOJLOVICA',
+    'PANCEVO_GLAVNA',
+    'KACAREVO',
+    'CREPAJA',
+    'DEBELJACA',
+    'KOVACICA',
+    'UZDIN',
+    'TOMASEVAC',
+    'ORLOVAT_STAJALISTE',
+    'LUKICEVO',
+    'ZRENJANIN_FABRIKA',
+    'ELEMIR',
+    'MELENCI',
+    'KUMANE',
+    'NOVI_BECEJ',
+    'BANAT_MILOSEVO_POLJE',
+    'BANATSKO_MILOSEVO',
+    'ZRENJANIN',
+    'BOCAR',
+    'PADEJ',
+    'OSTOJICEVO',
+    'COKA',
+    'KIKINDA',
+    'KISAC',
+    'STEPANOVICEVO',
+    'ZMAJEVO',
+    'VRBAS_NOVA',
+    'LOVCENAC_MALI_IDJOS',
+    'MALI_IDJOS_POLJE',
+    'BACKA_TOPOLA',
+    'ZEDNIK',
+    'NAUMOVICEVO',
+    'SUBOTICA',
+    'HORGOS',
+    'BACKI_VINOGRADI',
+    'HAJDUKOVO',
+    'PALIC',
+    'SUBOTICA_JAV_SKLADISTA',
+    'SENTA',
+    'GORNJI_BREG',
+    'BOGARAS',
+    'DOLINE',
+    'OROM',
+    'GABRIC',
+    'GAJDOBRA',
+    'FUTOG',
+    'PETROVAC_GLOZAN',
+    'BACKI_MAGLIC',
+    'SVETOZAR_MILETIC',
+    'ALEKSA_SANTIC',
+    'BAJMOK',
+    'TAVANKUT',
+    'LJUTOVO',
+    'SEBESIC',
+    'SUBOTICA_PREDGRADJE',
+    'PARAGE',
+    'RATKOVO',
+    'ODZACI',
+    'ODZACI_KALVARIJA',
+    'KARAVUKOVO',
+    'BOGOJEVO_SELO',
+    'BOGOJEVO',
+    'SONTA',
+    'PRIGREVICA',
+    'BUKOVACKI_SALASI',
+    'SOMBOR',
+    'PODGORICA',
+    'GOLUBOVCI',
+    'SUTOMORE',
+    'BAR',
+    'BIJELO_POLJE',
+    'MOJKOVAC',
+    'KOLASIN',
+)
+
+NAMES = (
+    'Kemendin st',
+    'Altina st',
+    'DOLJEVAC',
+    'KOCANE',
+    'PUKOVAC',
+    'BRESTOVAC',
+    'LIPOVICA',
+    'PEČENJEVCE',
+    'ŽIVKOVO',
+    'LESKOVAC',
+    'ŠAJINOVAC',
+    'JASENICA',
+    'REČICA',
+    'PODINA',
+    'PROKUPLJE',
+    'LUKOMIR',
+    'TOPLIČKI BADNJEVAC',
+    'ŽITORADJA CENTAR',
+    'LEŠAK',
+    'DREN',
+    'LEPOSAVIĆ',
+    'SOČANICA',
+    'IBARSKA SLATINA',
+    'BANJSKA',
+    'VALAČ',
+    'ZVEČAN',
+    'PLANDIŠTE',
+    'PRIDVORICA',
+    'KOSOVSKA MITROVICA SEVER',
+    'MATARUŠKA BANJA',
+    'PROGORELICA',
+    'BOGUTOVAČKA BANJA',
+    'POLUMIR',
+    'UŠĆE',
+    'JOŠANIČKA BANJA',
+    'PISKANJA',
+    'BRVENIK',
+    'RVATI',
+    'RAŠKA',
+    'KAZNOVIĆI',
+    'RUDNICA',
+    'JERINA STAJ',
+    'LOZNO',
+    'PUSTO POLJE',
+    'MRZENICA',
+    'DEDINA',
+    'KRUŠEVAC',
+    'KOŠEVI',
+    'STOPANJA',
+    'POCEKOVINA',
+    'TRSTENIK',
+    'VRNJAČKA BANJA',
+    'LIPOVA STA',
+    'PODUNAVCI',
+    'VRBA STAJ',
+    'RATINA',
+    'TOMINAC STA',
+    'VRANEŠI STAJ',
+    'ČITLUK',
+    'GRAD STALAĆ STA',
+    'BELOTINCE',
+    'MALOŠIŠTE',
+    'ČAPLJINAC',
+    'BRALJINA',
+    'STARO TRUBAREVO',
+    'ĐUNIS',
+    'VITKOVAC STAJ.',
+    'DONJI LJUBEŠ',
+    'KORMAN',
+    'TRNJANI',
+    'ADROVAC',
+    'ALEKSINAC',
+    'LUŽANE',
+    'TEŠICA',
+    'GREJAČ',
+    'SUPOVAČKI MOST',
+    'MEZGRAJA',
+    'TRUPALE',
+    'CEROVO RAŽANJ',
+    'VRTIŠTE',
+    'GORNJI LJUBEŠ',
+    'NOZRINA',
+    'CRVENI KRST',
+    'NIŠ',
+    'ADRANI',
+    'MRSAĆ',
+    'SAMAILA',
+    'GORIČANI',
+    'MRSINCI',
+    'ZABLAĆE',
+    'PRIJEVOR',
+    'OVČAR BANJA',
+    'DRAGAČEVO',
+    'TRBUŠANI',
+    'BORAČKO',
+    'BALUGA',
+    'JELEN DO',
+    'KUKIĆI',
+    'GUGALJ STA',
+    'ČAČAK',
+    'BATOČINA',
+    'GRADAC',
+    'BADNJEVAC',
+    'RESNIK KRAGUJEVAČKI',
+    'MILATOVAC',
+    'JOVANOVAC',
+    'ZAVOD',
+    'GROŠNICA',
+    'DRAGOBRAĆA',
+    'KNIĆ',
+    'GRUŽA',
+    'GUBEREVAC',
+    'VITKOVAC',
+    'MILAVČIĆI',
+    'VITANOVAC',
+    'ŠUMARICE',
+    'SIRČA',
+    'TOMIĆA BRDO',
+    'KRAGUJEVAC',
+    'KRALJEVO',
+    'BRZAN',
+    'MILOŠEVO',
+    'BAGRDAN',
+    'LANIŠTE',
+    'BUKOVČE',
+    'GILJE',
+    'PARAĆIN',
+    'SIKIRICA-RATARI',
+    'DRENOVAC',
+    'ĆIĆEVAC',
+    'LUČINA',
+    'JAGODINA',
+    'ĆUPRIJA',
+    'STALAĆ',
+    'VELIKA PLANA',
+    'STARO SELO',
+    'NOVO SELO',
+    'MARKOVAC',
+    'LAPOVO VAROŠ',
+    'LAPOVO RANŽ.STAJ.',
+    'LAPOVO',
+    'MALA KRSNA',
+    'GODOMIN',
+    'RADINAC',
+    'VRANOVO',
+    'SMEDEREVO',
+    'KOVAČEVAC',
+    'RABROVAC',
+    'KUSADAK',
+    'RATARE',
+    'GLIBOVAC',
+    'PALANKA',
+    'MALA PLANA',
+    'MATEJEVAC',
+    'PANTELEJ',
+    'JASENOVIK',
+    'GRAMADA',
+    'HADŽIĆEVO',
+    'SVRLJIG',
+    'NIŠEVAC',
+    'PALILULA',
+    'SVRLJIŠKI MILJKOVAC',
+    'PODVIS',
+    'RGOŠTE',
+    'KNJAŽEVAC',
+    'GORNJE ZUNIĆE',
+    'DONJE ZUNIĆE',
+    'MINIĆEVO',
+    'SELAČKA REKA',
+    'MALI IZVOR',
+    'VRATARNICA',
+    'GRLJAN',
+    'TIMOK',
+    'ZAJEČAR',
+    'TRNAVAC',
+    'ČOKONJAR',
+    'TABAKOVAC',
+    'TABAKOVAČKA REKA',
+    'BRUSNIK',
+    'TAMNIĆ',
+    'CRNOMASNICA',
+    'RAJAC',
+    'ROGLJEVO',
+    'VELJKOVO',
+    'KOBIŠNICA',
+    'NEGOTIN',
+    'PRAHOVO',
+    'PRAHOVO PRISTANIŠTE',
+    'VRAŽOGRNAC',
+    'RGOTINA',
+    'ZAGRAĐE',
+    'BOR TERETNA',
+    'MAJDANPEK',
+    'LESKOVO',
+    'JASIKOVO',
+    'VLAOLE',
+    'CEROVO',
+    'KRIVELJSKI POTOK',
+    'MALI KRIVELJ',
+    'GORNJANE',
+    'KRIVELJSKI MOST',
+    'DEBELI LUG',
+    'VLAOLE SELO',
+    'ŠUŠULAJKA',
+    'BREZONIK',
+    'POŽAREVAC',
+    'LJUBIČEVSKI MOST',
+    'LASTRA',
+    'SAMARI',
+    'DRENOVAČKI KIK',
+    'RAŽANA',
+    'KOSJERIĆ',
+    'KALENIĆ',
+    'SEVOJNO',
+    'TUBIĆI',
+    'UZIĆI',
+    'RASNA',
+    'LESKOVICE',
+    'GLUMAC',
+    'ZLAKUSA',
+    'OTANJ',
+    'RAČA',
+    'POŽEGA',
+    'UŽICE TERETNA',
+    'UŽICE',
+    'BELA REKA',
+    'BARAJEVO',
+    'BARAJEVO CENTAR',
+    'VELIKI BORAK',
+    'LESKOVAC KOLUBARSKI',
+    'STEPOJEVAC',
+    'LAZAREVAC',
+    'SLOVAC',
+    'MLAĐEVO',
+    'DIVCI',
+    'IVERAK',
+    'VREOCI',
+    'VALJEVO',
+    'LAJKOVAC',
+    'RIPANJ',
+    'KLENJE',
+    'RIPANJ TUNEL',
+    'RALJA',
+    'SOPOT KOSMAJSKI',
+    'VLAŠKO POLJE',
+    'RIPANJ KOLONIJA',
+    'MLADENOVAC',
+    'RESNIK',
+    'STAPARI',
+    'SUŠICA',
+    'BRANEŠCI',
+    'ZLATIBOR',
+    'RIBNICA ZLATIBORSKA',
+    'JABLANICA',
+    'ŠTRPCI',
+    'PRIBOJ',
+    'PRIBOJSKA BANJA',
+    'BISTRICA NA LIMU',
+    'PRIJEPOLJE',
+    'PRIJEPOLJE TERETNA',
+    'BRODAREVO',
+    'RISTANOVIĆA POLJE',
+    'TRIPKOVA',
+    'DŽUROVO',
+    'POLJICE',
+    'ZEMUN POLJE',
+    'ZEMUN',
+    'NOVI BEOGRAD',
+    'SEBEŠ',
+    'OVČA',
+    'TOŠIN BUNAR',
+    'PANČEVAČKI MOST',
+    'PANČEVO STRELIŠTE',
+    'KRNJAČA',
+    'KRNJAČA MOST STA',
+    'BEOGRAD CENTAR',
+    'KARAĐORĐEV PARK',
+    'VUKOV SPOMENIK',
+    'KIJEVO',
+    'KNEZEVAC',
+    'RAKOVICA',
+    'BATAJNICA',
+    'MAJUR STAJ',
+    'PRNJAVOR MAČVANSKI',
+    'LEŠNICA',
+    'LOZNICA',
+    'KOVILJAČA',
+    'BRASINA',
+    'DONJA BORINA STAJ',
+    'ZVORNIK',
+    'ŠABAC',
+    'NOVA PAZOVA',
+    'STARA PAZOVA',
+    'GOLUBINCI',
+    'PUTINCI',
+    'KRALJEVCI STAJ',
+    'SREMSKA MITROVICA',
+    'MARTINCI',
+    'KUKUJEVCI-ERDEVIK',
+    'ŠID',
+    'RUMA',
+    'BUĐANOVCI',
+    'NIKINCI',
+    'PLATIĆEVO',
+    'KLENAK',
+    'INĐIJA',
+    'BEŠKA',
+    'SREMSKI KARLOVCI',
+    'PETROVARADIN',
+    'NOVI SAD',
+    'NOVI SAD RANŽIRNA',
+    'SZEGED',
+    'SZENTMIHALYTELEK',
+    'ROESZKE',
+    'PANČEVO VAROŠ',
+    'BANATSKO NOVO SELO',
+    'VLADIMIROVAC',
+    'ALIBUNAR',
+    'BANATSKI KARLOVAC',
+    'NIKOLINCI',
+    'ULJMA',
+    'VLAJKOVAC',
+    'VRŠAC',
+    'PANČEVO VOJLOVICA',
+    'PANČEVO GLAVNA',
+    'KAČAREVO',
+    'CREPAJA',
+    'DEBELJAČA',
+    'KOVAČICA',
+    'UZDIN',
+    'TOMAŠEVAC',
+    'ORLOVAT STAJALIŠTE',
+    'LUKIĆEVO',
+    'ZRENJANIN FABRIKA',
+    'ELEMIR',
+    'MELENCI',
+    'KUMANE',
+    'NOVI BEČEJ',
+    'BANAT.MILOŠEVO POLJE',
+    'BANATSKO MILOŠEVO',
+    'ZRENJANIN',
+    'BOČAR',
+    'PADEJ',
+    'OSTOJIĆEVO',
+    'ČOKA',
+    'KIKINDA',
+    'KISAČ',
+    'STEPANOVIĆEVO',
+    'ZMAJEVO',
+    'VRBAS NOVA',
+    'Lovcenac Mali Idjos',
+    'MALI IĐOŠ POLJE',
+    'BAČKA TOPOLA',
+    'ŽEDNIK',
+    'NAUMOVIĆEVO',
+    'SUBOTICA',
+    'HORGOŠ',
+    'BAČKI VINOGRADI',
+    'HAJDUKOVO',
+    'PALIĆ',
+    'SUBOTICA JAV.SKLADIŠTA',
+    'SENTA',
+    'GORNJI BREG',
+    'BOGARAŠ',
+    'DOLINE',
+    'OROM',
+    'GABRIĆ',
+    'GAJDOBRA',
+    'FUTOG',
+    'PETROVAC-GLOŽAN',
+    'BAČKI MAGLIĆ',
+    'SVETOZAR MILETIĆ',
+    'ALEKSA ŠANTIĆ',
+    'BAJMOK',
+    'TAVANKUT',
+    'LJUTOVO',
+    'ŠEBEŠIĆ',
+    'SUBOTICA PREDGRAĐE',
+    'PARAGE',
+    'RATKOVO',
+    'ODŽACI',
+    'ODŽACI KALVARIJA',
+    'KARAVUKOVO',
+    'BOGOJEVO SELO',
+    'BOGOJEVO',
+    'SONTA',
+    'PRIGREVICA',
+    'BUKOVAČKI SALAŠI',
+    'SOMBOR',
+    'PODGORICA',
+    'GOLUBOVCI',
+    'SUTOMORE',
+    'BAR',
+    'BIJELO POLJE',
+    'MOJKOVAC',
+    'KOLAŠIN',
+)
+
+IDS = (
+    '01016',
+    '01017',
+    '11001',
+    '11002',
+    '11003',
+    '11004',
+    '11005',
+    '11006',
+    '11007',
+    '11050',
+    '11101',
+    '11102',
+    '11104',
+    '11105',
+    '11106',
+    '11119',
+    '11121',
+    '11129',
+    '12001',
+    '12002',
+    '12003',
+    '12004',
+    '12005',
+    '12006',
+    '12007',
+    '12008',
+    '12019',
+    '12021',
+    '12022',
+    '12101',
+    '12102',
+    '12103',
+    '12105',
+    '12106',
+    '12107',
+    '12108',
+    '12109',
+    '12110',
+    '12111',
+    '12112',
+    '12113',
+    '12114',
+    '12115',
+    '12116',
+    '12201',
+    '12203',
+    '12204',
+    '12205',
+    '12207',
+    '12208',
+    '12210',
+    '12211',
+    '12212',
+    '12213',
+    '12214',
+    '12215',
+    '12216',
+    '12217',
+    '12218',
+    '12219',
+    '12302',
+    '12303',
+    '12304',
+    '12502',
+    '12503',
+    '12504',
+    '12505',
+    '12506',
+    '12507',
+    '12508',
+    '12509',
+    '12510',
+    '12511',
+    '12512',
+    '12513',
+    '12514',
+    '12515',
+    '12516',
+    '12517',
+    '12518',
+    '12519',
+    '12520',
+    '12550',
+    '12551',
+    '13001',
+    '13002',
+    '13003',
+    '13004',
+    '13005',
+    '13006',
+    '13007',
+    '13008',
+    '13009',
+    '13010',
+    '13011',
+    '13012',
+    '13013',
+    '13014',
+    '13015',
+    '13060',
+    '13201',
+    '13202',
+    '13203',
+    '13204',
+    '13205',
+    '13207',
+    '13209',
+    '13210',
+    '13211',
+    '13213',
+    '13214',
+    '13215',
+    '13216',
+    '13217',
+    '13218',
+    '13219',
+    '13220',
+    '13221',
+    '13250',
+    '13251',
+    '13301',
+    '13302',
+    '13303',
+    '13304',
+    '13305',
+    '13307',
+    '13310',
+    '13311',
+    '13312',
+    '13313',
+    '13314',
+    '13350',
+    '13351',
+    '13352',
+    '13401',
+    '13402',
+    '13403',
+    '13404',
+    '13405',
+    '13406',
+    '13450',
+    '13551',
+    '13602',
+    '13603',
+    '13604',
+    '13670',
+    '13701',
+    '13702',
+    '13703',
+    '13704',
+    '13705',
+    '13706',
+    '13707',
+    '14001',
+    '14003',
+    '14004',
+    '14005',
+    '14006',
+    '14007',
+    '14008',
+    '14009',
+    '14010',
+    '14011',
+    '14012',
+    '14013',
+    '14014',
+    '14015',
+    '14016',
+    '14017',
+    '14018',
+    '14019',
+    '14021',
+    '14022',
+    '14060',
+    '14101',
+    '14102',
+    '14104',
+    '14105',
+    '14106',
+    '14107',
+    '14108',
+    '14109',
+    '14110',
+    '14111',
+    '14113',
+    '14114',
+    '14115',
+    '14170',
+    '14301',
+    '14302',
+    '14303',
+    '14305',
+    '14401',
+    '14402',
+    '14403',
+    '14404',
+    '14405',
+    '14406',
+    '14407',
+    '14408',
+    '14409',
+    '14410',
+    '14411',
+    '14412',
+    '14413',
+    '14550',
+    '14551',
+    '15102',
+    '15103',
+    '15104',
+    '15105',
+    '15106',
+    '15107',
+    '15108',
+    '15109',
+    '15110',
+    '15111',
+    '15112',
+    '15113',
+    '15114',
+    '15116',
+    '15118',
+    '15150',
+    '15151',
+    '15153',
+    '15201',
+    '15203',
+    '15204',
+    '15205',
+    '15206',
+    '15207',
+    '15209',
+    '15211',
+    '15212',
+    '15213',
+    '15215',
+    '15250',
+    '15251',
+    '15260',
+    '15402',
+    '15403',
+    '15404',
+    '15405',
+    '15406',
+    '15407',
+    '15408',
+    '15460',
+    '15501',
+    '15701',
+    '15702',
+    '15703',
+    '15704',
+    '15705',
+    '15706',
+    '15707',
+    '15708',
+    '15709',
+    '15710',
+    '15711',
+    '15712',
+    '15714',
+    '15716',
+    '15717',
+    '15718',
+    '15722',
+    '16001',
+    '16002',
+    '16003',
+    '16006',
+    '16007',
+    '16012',
+    '16013',
+    '16014',
+    '16015',
+    '16016',
+    '16052',
+    '16053',
+    '16054',
+    '16101',
+    '16102',
+    '16103',
+    '16204',
+    '16300',
+    '16305',
+    '16307',
+    '16310',
+    '16312',
+    '16314',
+    '16315',
+    '16317',
+    '16350',
+    '16501',
+    '16503',
+    '16505',
+    '16506',
+    '16507',
+    '16509',
+    '16511',
+    '16513',
+    '16516',
+    '16550',
+    '16601',
+    '16602',
+    '16603',
+    '16604',
+    '16801',
+    '16802',
+    '16806',
+    '16807',
+    '16808',
+    '16870',
+    '17228',
+    '17665',
+    '17673',
+    '21001',
+    '21002',
+    '21003',
+    '21004',
+    '21005',
+    '21006',
+    '21007',
+    '21008',
+    '21009',
+    '21101',
+    '22001',
+    '22003',
+    '22004',
+    '22005',
+    '22006',
+    '22201',
+    '22202',
+    '22203',
+    '22204',
+    '22501',
+    '22503',
+    '22504',
+    '22505',
+    '22506',
+    '22508',
+    '22509',
+    '22550',
+    '22601',
+    '22603',
+    '22604',
+    '22605',
+    '22850',
+    '23302',
+    '23303',
+    '23304',
+    '23305',
+    '23307',
+    '23403',
+    '23404',
+    '23407',
+    '23409',
+    '23450',
+    '23701',
+    '23702',
+    '23703',
+    '23704',
+    '23706',
+    '23801',
+    '23802',
+    '23803',
+    '23804',
+    '23805',
+    '23806',
+    '24001',
+    '24003',
+    '24004',
+    '24005',
+    '24401',
+    '24403',
+    '24404',
+    '24406',
+    '24407',
+    '24408',
+    '24409',
+    '25001',
+    '25002',
+    '25003',
+    '25401',
+    '25402',
+    '25403',
+    '25470',
+    '25501',
+    '25502',
+    '25503',
+    '25550',
+    '31001',
+    '31002',
+    '31008',
+    '31080',
+    '31302',
+    '31305',
+    '31307',
+)
+
+SAFE_NAMES = (
+    'KEMENDIN_ST',
+    'ALTINA_ST',
+    'DOLJEVAC',
+    'KOCANE',
+    'PUKOVAC',
+    'BRESTOVAC',
+    'LIPOVICA',
+    'PECENJEVCE',
+    'ZIVKOVO',
+    'LESKOVAC',
+    'SAJINOVAC',
+    'JASENICA',
+    'RECICA',
+    'PODINA',
+    'PROKUPLJE',
+    'LUKOMIR',
+    'TOPLICKI_BADNJEVAC',
+    'ZITORADJA_CENTAR',
+    'LESAK',
+    'DREN',
+    'LEPOSAVIC',
+    'SOCANICA',
+    'IBARSKA_SLATINA',
+    'BANJSKA',
+    'VALAC',
+    'ZVECAN',
+    'PLANDISTE',
+    'PRIDVORICA',
+    'KOSOVSKA_MITROVICA_SEVER',
+    'MATARUSKA_BANJA',
+    'PROGORELICA',
+    'BOGUTOVACKA_BANJA',
+    'POLUMIR',
+    'USCE',
+    'JOSANICKA_BANJA',
+    'PISKANJA',
+    'BRVENIK',
+    'RVATI',
+    'RASKA',
+    'KAZNOVICI',
+    'RUDNICA',
+    'JERINA_STAJ',
+    'LOZNO',
+    'PUSTO_POLJE',
+    'MRZENICA',
+    'DEDINA',
+    'KRUSEVAC',
+    'KOSEVI',
+    'STOPANJA',
+    'POCEKOVINA',
+    'TRSTENIK',
+    'VRNJACKA_BANJA',
+    'LIPOVA_STA',
+    'PODUNAVCI',
+    'VRBA_STAJ',
+    'RATINA',
+    'TOMINAC_STA',
+    'VRANESI_STAJ',
+    'CITLUK',
+    'GRAD_STALAC_STA',
+    'BELOTINCE',
+    'MALOSISTE',
+    'CAPLJINAC',
+    'BRALJINA',
+    'STARO_TRUBAREVO',
+    'DJUNIS',
+    'VITKOVAC_STAJ.',
+    'DONJI_LJUBES',
+    'KORMAN',
+    'TRNJANI',
+    'ADROVAC',
+    'ALEKSINAC',
+    'LUZANE',
+    'TESICA',
+    'GREJAC',
+    'SUPOVACKI_MOST',
+    'MEZGRAJA',
+    'TRUPALE',
+    'CEROVO_RAZANJ',
+    'VRTISTE',
+    'GORNJI_LJUBES',
+    'NOZRINA',
+    'CRVENI_KRST',
+    'NIS',
+    'ADRANI',
+    'MRSAC',
+    'SAMAILA',
+    'GORICANI',
+    'MRSINCI',
+    'ZABLACE',
+    'PRIJEVOR',
+    'OVCAR_BANJA',
+    'DRAGACEVO',
+    'TRBUSANI',
+    'BORACKO',
+    'BALUGA',
+    'JELEN_DO',
+    'KUKICI',
+    'GUGALJ_STA',
+    'CACAK',
+    'BATOCINA',
+    'GRADAC',
+    'BADNJEVAC',
+    'RESNIK_KRAGUJEVACKI',
+    'MILATOVAC',
+    'JOVANOVAC',
+    'ZAVOD',
+    'GROSNICA',
+    'DRAGOBRACA',
+    'KNIC',
+    'GRUZA',
+    'GUBEREVAC',
+    'VITKOVAC',
+    'MILAVCICI',
+    'VITANOVAC',
+    'SUMARICE',
+    'SIRCA',
+    'TOMICA_BRDO',
+    'KRAGUJEVAC',
+    'KRALJEVO',
+    'BRZAN',
+    'MILOSEVO',
+    'BAGRDAN',
+    'LANISTE',
+    'BUKOVCE',
+    'GILJE',
+    'PARACIN',
+    'SIKIRICA-RATARI',
+    'DRENOVAC',
+    'CICEVAC',
+    'LUCINA',
+    'JAGODINA',
+    'CUPRIJA',
+    'STALAC',
+    'VELIKA_PLANA',
+    'STARO_SELO',
+    'NOVO_SELO',
+    'MARKOVAC',
+    'LAPOVO_VAROS',
+    'LAPOVO_RANZ.STAJ.',
+    'LAPOVO',
+    'MALA_KRSNA',
+    'GODOMIN',
+    'RADINAC',
+    'VRANOVO',
+    'SMEDEREVO',
+    'KOVACEVAC',
+    'RABROVAC',
+    'KUSADAK',
+    'RATARE',
+    'GLIBOVAC',
+    'PALANKA',
+    'MALA_PLANA',
+    'MATEJEVAC',
+    'PANTELEJ',
+    'JASENOVIK',
+    'GRAMADA',
+    'HADZICEVO',
+    'SVRLJIG',
+    'NISEVAC',
+    'PALILULA',
+    'SVRLJISKI_MILJKOVAC',
+    'PODVIS',
+    'RGOSTE',
+    'KNJAZEVAC',
+    'GORNJE_ZUNICE',
+    'DONJE_ZUNICE',
+    'MINICEVO',
+    'SELACKA_REKA',
+    'MALI_IZVOR',
+    'VRATARNICA',
+    'GRLJAN',
+    'TIMOK',
+    'ZAJECAR',
+    'TRNAVAC',
+    'COKONJAR',
+    'TABAKOVAC',
+    'TABAKOVACKA_REKA',
+    'BRUSNIK',
+    'TAMNIC',
+    'CRNOMASNICA',
+    'RAJAC',
+    'ROGLJEVO',
+    'VELJKOVO',
+    'KOBISNICA',
+    'NEGOTIN',
+    'PRAHOVO',
+    'PRAHOVO_PRISTANISTE',
+    'VRAZOGRNAC',
+    'RGOTINA',
+    'ZAGRADJE',
+    'BOR_TERETNA',
+    'MAJDANPEK',
+    'LESKOVO',
+    'JASIKOVO',
+    'VLAOLE',
+    'CEROVO',
+    'KRIVELJSKI_POTOK',
+    'MALI_KRIVELJ',
+    'GORNJANE',
+    'KRIVELJSKI_MOST',
+    'DEBELI_LUG',
+    'VLAOLE_SELO',
+    'SUSULAJKA',
+    'BREZONIK',
+    'POZAREVAC',
+    'LJUBICEVSKI_MOST',
+    'LASTRA',
+    'SAMARI',
+    'DRENOVACKI_KIK',
+    'RAZANA',
+    'KOSJERIC',
+    'KALENIC',
+    'SEVOJNO',
+    'TUBICI',
+    'UZICI',
+    'RASNA',
+    'LESKOVICE',
+    'GLUMAC',
+    'ZLAKUSA',
+    'OTANJ',
+    'RACA',
+    'POZEGA',
+    'UZICE_TERETNA',
+    'UZICE',
+    'BELA_REKA',
+    'BARAJEVO',
+    'BARAJEVO_CENTAR',
+    'VELIKI_BORAK',
+    'LESKOVAC_KOLUBARSKI',
+    'STEPOJEVAC',
+    'LAZAREVAC',
+    'SLOVAC',
+    'MLADJEVO',
+    'DIVCI',
+    'IVERAK',
+    'VREOCI',
+    'VALJEVO',
+    'LAJKOVAC',
+    'RIPANJ',
+    'KLENJE',
+    'RIPANJ_TUNEL',
+    'RALJA',
+    'SOPOT_KOSMAJSKI',
+    'VLASKO_POLJE',
+    'RIPANJ_KOLONIJA',
+    'MLADENOVAC',
+    'RESNIK',
+    'STAPARI',
+    'SUSICA',
+    'BRANESCI',
+    'ZLATIBOR',
+    'RIBNICA_ZLATIBORSKA',
+    'JABLANICA',
+    'STRPCI',
+    'PRIBOJ',
+    'PRIBOJSKA_BANJA',
+    'BISTRICA_NA_LIMU',
+    'PRIJEPOLJE',
+    'PRIJEPOLJE_TERETNA',
+    'BRODAREVO',
+    'RISTANOVICA_POLJE',
+    'TRIPKOVA',
+    'DZUROVO',
+    'POLJICE',
+    'ZEMUN_POLJE',
+    'ZEMUN',
+    'NOVI_BEOGRAD',
+    'SEBES',
+    'OVCA',
+    'TOSIN_BUNAR',
+    'PANCEVACKI_MOST',
+    'PANCEVO_STRELISTE',
+    'KRNJACA',
+    'KRNJACA_MOST_STA',
+    'BEOGRAD_CENTAR',
+    'KARADJORDJEV_PARK',
+    'VUKOV_SPOMENIK',
+    'KIJEVO',
+    'KNEZEVAC',
+    'RAKOVICA',
+    'BATAJNICA',
+    'MAJUR_STAJ',
+    'PRNJAVOR_MACVANSKI',
+    'LESNICA',
+    'LOZNICA',
+    'KOVILJACA',
+    'BRASINA',
+    'DONJA_BORINA_STAJ',
+    'ZVORNIK',
+    'SABAC',
+    'NOVA_PAZOVA',
+    'STARA_PAZOVA',
+    'GOLUBINCI',
+    'PUTINCI',
+    'KRALJEVCI_STAJ',
+    'SREMSKA_MITROVICA',
+    'MARTINCI',
+    'KUKUJEVCI-ERDEVIK',
+    'SID',
+    'RUMA',
+    'BUDJANOVCI',
+    'NIKINCI',
+    'PLATICEVO',
+    'KLENAK',
+    'INDJIJA',
+    'BESKA',
+    'SREMSKI_KARLOVCI',
+    'PETROVARADIN',
+    'NOVI_SAD',
+    'NOVI_SAD_RANZIRNA',
+    'SZEGED',
+    'SZENTMIHALYTELEK',
+    'ROESZKE',
+    'PANCEVO_VAROS',
+    'BANATSKO_NOVO_SELO',
+    'VLADIMIROVAC',
+    'ALIBUNAR',
+    'BANATSKI_KARLOVAC',
+    'NIKOLINCI',
+    'ULJMA',
+    'VLAJKOVAC',
+    'VRSAC',
+    'PANCEVO_VOJLOVICA',
+    'PANCEVO_GLAVNA',
+    'KACAREVO',
+    'CREPAJA',
+    'DEBELJACA',
+    'KOVACICA',
+    'UZDIN',
+    'TOMASEVAC',
+    'ORLOVAT_STAJALISTE',
+    'LUKICEVO',
+    'ZRENJANIN_FABRIKA',
+    'ELEMIR',
+    'MELENCI',
+    'KUMANE',
+    'NOVI_BECEJ',
+    'BANAT.MILOSEVO_POLJE',
+    'BANATSKO_MILOSEVO',
+    'ZRENJANIN',
+    'BOCAR',
+    'PADEJ',
+    'OSTOJICEVO',
+    'COKA',
+    'KIKINDA',
+    'KISAC',
+    'STEPANOVICEVO',
+    'ZMAJEVO',
+    'VRBAS_NOVA',
+    'LOVCENAC_MALI_IDJOS',
+    'MALI_IDJOS_POLJE',
+    'BACKA_TOPOLA',
+    'ZEDNIK',
+    'NAUMOVICEVO',
+    'SUBOTICA',
+    'HORGOS',
+    'BACKI_VINOGRADI',
+    'HAJDUKOVO',
+    'PALIC',
+    'SUBOTICA_JAV.SKLADISTA',
+    'SENTA',
+    'GORNJI_BREG',
+    'BOGARAS',
+    'DOLINE',
+    'OROM',
+    'GABRIC',
+    'GAJDOBRA',
+    'FUTOG',
+    'PETROVAC-GLOZAN',
+    'BACKI_MAGLIC',
+    'SVETOZAR_MILETIC',
+    'ALEKSA_SANTIC',
+    'BAJMOK',
+    'TAVANKUT',
+    'LJUTOVO',
+    'SEBESIC',
+    'SUBOTICA_PREDGRADJE',
+    'PARAGE',
+    'RATKOVO',
+    'ODZACI',
+    'ODZACI_KALVARIJA',
+    'KARAVUKOVO',
+    'BOGOJEVO_SELO',
+    'BOGOJEVO',
+    'SONTA',
+    'PRIGREVICA',
+    'BUKOVACKI_SALASI',
+    'SOMBOR',
+    'PODGORICA',
+    'GOLUBOVCI',
+    'SUTOMORE',
+    'BAR',
+    'BIJELO_POLJE',
+    'MOJKOVAC',
+    'KOLASIN',
+)
+
+# search keys for SerbiaTrainStations, precomputed so the index builds without folding every name
+NORMALIZED_NAMES = (
+    'KEMENDIN ST',
+    'ALTINA ST',
+    'DOLJEVAC',
+    'KOCANE',
+    'PUKOVAC',
+    'BRESTOVAC',
+    'LIPOVICA',
+    'PECENJEVCE',
+    'ZIVKOVO',
+    'LESKOVAC',
+    'SAJINOVAC',
+    'JASENICA',
+    'RECICA',
+    'PODINA',
+    'PROKUPLJE',
+    'LUKOMIR',
+    'TOPLICKI BADNJEVAC',
+    'ZITORADJA CENTAR',
+    'LESAK',
+    'DREN',
+    'LEPOSAVIC',
+    'SOCANICA',
+    'IBARSKA SLATINA',
+    'BANJSKA',
+    'VALAC',
+    'ZVECAN',
+    'PLANDISTE',
+    'PRIDVORICA',
+    'KOSOVSKA MITROVICA SEVER',
+    'MATARUSKA BANJA',
+    'PROGORELICA',
+    'BOGUTOVACKA BANJA',
+    'POLUMIR',
+    'USCE',
+    'JOSANICKA BANJA',
+    'PISKANJA',
+    'BRVENIK',
+    'RVATI',
+    'RASKA',
+    'KAZNOVICI',
+    'RUDNICA',
+    'JERINA STAJ',
+    'LOZNO',
+    'PUSTO POLJE',
+    'MRZENICA',
+    'DEDINA',
+    'KRUSEVAC',
+    'KOSEVI',
+    'STOPANJA',
+    'POCEKOVINA',
+    'TRSTENIK',
+    'VRNJACKA BANJA',
+    'LIPOVA STA',
+    'PODUNAVCI',
+    'VRBA STAJ',
+    'RATINA',
+    'TOMINAC STA',
+    'VRANESI STAJ',
+    'CITLUK',
+    'GRAD STALAC STA',
+    'BELOTINCE',
+    'MALOSISTE',
+    'CAPLJINAC',
+    'BRALJINA',
+    'STARO TRUBAREVO',
+    'DJUNIS',
+    'VITKOVAC STAJ',
+    'DONJI LJUBES',
+    'KORMAN',
+    'TRNJANI',
+    'ADROVAC',
+    'ALEKSINAC',
+    'LUZANE',
+    'TESICA',
+    'GREJAC',
+    'SUPOVACKI MOST',
+    'MEZGRAJA',
+    'TRUPALE',
+    'CEROVO RAZANJ',
+    'VRTISTE',
+    'GORNJI LJUBES',
+    'NOZRINA',
+    'CRVENI KRST',
+    'NIS',
+    'ADRANI',
+    'MRSAC',
+    'SAMAILA',
+    'GORICANI',
+    'MRSINCI',
+    'ZABLACE',
+    'PRIJEVOR',
+    'OVCAR BANJA',
+    'DRAGACEVO',
+    'TRBUSANI',
+    'BORACKO',
+    'BALUGA',
+    'JELEN DO',
+    'KUKICI',
+    'GUGALJ STA',
+    'CACAK',
+    'BATOCINA',
+    'GRADAC',
+    'BADNJEVAC',
+    'RESNIK KRAGUJEVACKI',
+    'MILATOVAC',
+    'JOVANOVAC',
+    'ZAVOD',
+    'GROSNICA',
+    'DRAGOBRACA',
+    'KNIC',
+    'GRUZA',
+    'GUBEREVAC',
+    'VITKOVAC',
+    'MILAVCICI',
+    'VITANOVAC',
+    'SUMARICE',
+    'SIRCA',
+    'TOMICA BRDO',
+    'KRAGUJEVAC',
+    'KRALJEVO',
+    'BRZAN',
+    'MILOSEVO',
+    'BAGRDAN',
+    'LANISTE',
+    'BUKOVCE',
+    'GILJE',
+    'PARACIN',
+    'SIKIRICA RATARI',
+    'DRENOVAC',
+    'CICEVAC',
+    'LUCINA',
+    'JAGODINA',
+    'CUPRIJA',
+    'STALAC',
+    'VELIKA PLANA',
+    'STARO SELO',
+    'NOVO SELO',
+    'MARKOVAC',
+    'LAPOVO VAROS',
+    'LAPOVO RANZ STAJ',
+    'LAPOVO',
+    'MALA KRSNA',
+    'GODOMIN',
+    'RADINAC',
+    'VRANOVO',
+    'SMEDEREVO',
+    'KOVACEVAC',
+    'RABROVAC',
+    'KUSADAK',
+    'RATARE',
+    'GLIBOVAC',
+    'PALANKA',
+    'MALA PLANA',
+    'MATEJEVAC',
+    'PANTELEJ',
+    'JASENOVIK',
+    'GRAMADA',
+    'HADZICEVO',
+    'SVRLJIG',
+    'NISEVAC',
+    'PALILULA',
+    'SVRLJISKI MILJKOVAC',
+    'PODVIS',
+    'RGOSTE',
+    'KNJAZEVAC',
+    'GORNJE ZUNICE',
+    'DONJE ZUNICE',
+    'MINICEVO',
+    'SELACKA REKA',
+    'MALI IZVOR',
+    'VRATARNICA',
+    'GRLJAN',
+    'TIMOK',
+    'ZAJECAR',
+    'TRNAVAC',
+    'COKONJAR',
+    'TABAKOVAC',
+    'TABAKOVACKA REKA',
+    'BRUSNIK',
+    'TAMNIC',
+    'CRNOMASNICA',
+    'RAJAC',
+    'ROGLJEVO',
+    'VELJKOVO',
+    'KOBISNICA',
+    'NEGOTIN',
+    'PRAHOVO',
+    'PRAHOVO PRISTANISTE',
+    'VRAZOGRNAC',
+    'RGOTINA',
+    'ZAGRADJE',
+    'BOR TERETNA',
+    'MAJDANPEK',
+    'LESKOVO',
+    'JASIKOVO',
+    'VLAOLE',
+    'CEROVO',
+    'KRIVELJSKI POTOK',
+    'MALI KRIVELJ',
+    'GORNJANE',
+    'KRIVELJSKI MOST',
+    'DEBELI LUG',
+    'VLAOLE SELO',
+    'SUSULAJKA',
+    'BREZONIK',
+    'POZAREVAC',
+    'LJUBICEVSKI MOST',
+    'LASTRA',
+    'SAMARI',
+    'DRENOVACKI KIK',
+    'RAZANA',
+    'KOSJERIC',
+    'KALENIC',
+    'SEVOJNO',
+    'TUBICI',
+    'UZICI',
+    'RASNA',
+    'LESKOVICE',
+    'GLUMAC',
+    'ZLAKUSA',
+    'OTANJ',
+    'RACA',
+    'POZEGA',
+    'UZICE TERETNA',
+    'UZICE',
+    'BELA REKA',
+    'BARAJEVO',
+    'BARAJEVO CENTAR',
+    'VELIKI BORAK',
+    'LESKOVAC KOLUBARSKI',
+    'STEPOJEVAC',
+    'LAZAREVAC',
+    'SLOVAC',
+    'MLADJEVO',
+    'DIVCI',
+    'IVERAK',
+    'VREOCI',
+    'VALJEVO',
+    'LAJKOVAC',
+    'RIPANJ',
+    'KLENJE',
+    'RIPANJ TUNEL',
+    'RALJA',
+    'SOPOT KOSMAJSKI',
+    'VLASKO POLJE',
+    'RIPANJ KOLONIJA',
+    'MLADENOVAC',
+    'RESNIK',
+    'STAPARI',
+    'SUSICA',
+    'BRANESCI',
+    'ZLATIBOR',
+    'RIBNICA ZLATIBORSKA',
+    'JABLANICA',
+    'STRPCI',
+    'PRIBOJ',
+    'PRIBOJSKA BANJA',
+    'BISTRICA NA LIMU',
+    'PRIJEPOLJE',
+    'PRIJEPOLJE TERETNA',
+    'BRODAREVO',
+    'RISTANOVICA POLJE',
+    'TRIPKOVA',
+    'DZUROVO',
+    'POLJICE',
+    'ZEMUN POLJE',
+    'ZEMUN',
+    'NOVI BEOGRAD',
+    'SEBES',
+    'OVCA',
+    'TOSIN BUNAR',
+    'PANCEVACKI MOST',
+    'PANCEVO STRELISTE',
+    'KRNJACA',
+    'KRNJACA MOST STA',
+    'BEOGRAD CENTAR',
+    'KARADJORDJEV PARK',
+    'VUKOV SPOMENIK',
+    'KIJEVO',
+    'KNEZEVAC',
+    'RAKOVICA',
+    'BATAJNICA',
+    'MAJUR STAJ',
+    'PRNJAVOR MACVANSKI',
+    'LESNICA',
+    'LOZNICA',
+    'KOVILJACA',
+    'BRASINA',
+    'DONJA BORINA STAJ',
+    'ZVORNIK',
+    'SABAC',
+    'NOVA PAZOVA',
+    'STARA PAZOVA',
+    'GOLUBINCI',
+    'PUTINCI',
+    'KRALJEVCI STAJ',
+    'SREMSKA MITROVICA',
+    'MARTINCI',
+    'KUKUJEVCI ERDEVIK',
+    'SID',
+    'RUMA',
+    'BUDJANOVCI',
+    'NIKINCI',
+    'PLATICEVO',
+    'KLENAK',
+    'INDJIJA',
+    'BESKA',
+    'SREMSKI KARLOVCI',
+    'PETROVARADIN',
+    'NOVI SAD',
+    'NOVI SAD RANZIRNA',
+    'SZEGED',
+    'SZENTMIHALYTELEK',
+    'ROESZKE',
+    'PANCEVO VAROS',
+    'BANATSKO NOVO SELO',
+    'VLADIMIROVAC',
+    'ALIBUNAR',
+    'BANATSKI KARLOVAC',
+    'NIKOLINCI',
+    'ULJMA',
+    'VLAJKOVAC',
+    'VRSAC',
+    'PANCEVO VOJLOVICA',
+    'PANCEVO GLAVNA',
+    'KACAREVO',
+    'CREPAJA',
+    'DEBELJACA',
+    'KOVACICA',
+    'UZDIN',
+    'TOMASEVAC',
+    'ORLOVAT STAJALISTE',
+    'LUKICEVO',
+    'ZRENJANIN FABRIKA',
+    'ELEMIR',
+    'MELENCI',
+    'KUMANE',
+    'NOVI BECEJ',
+    'BANAT MILOSEVO POLJE',
+    'BANATSKO MILOSEVO',
+    'ZRENJANIN',
+    'BOCAR',
+    'PADEJ',
+    'OSTOJICEVO',
+    'COKA',
+    'KIKINDA',
+    'KISAC',
+    'STEPANOVICEVO',
+    'ZMAJEVO',
+    'VRBAS NOVA',
+    'LOVCENAC MALI IDJOS',
+    'MALI IDJOS POLJE',
+    'BACKA TOPOLA',
+    'ZEDNIK',
+    'NAUMOVICEVO',
+    'SUBOTICA',
+    'HORGOS',
+    'BACKI VINOGRADI',
+    'HAJDUKOVO',
+    'PALIC',
+    'SUBOTICA JAV SKLADISTA',
+    'SENTA',
+    'GORNJI BREG',
+    'BOGARAS',
+    'DOLINE',
+    'OROM',
+    'GABRIC',
+    'GAJDOBRA',
+    'FUTOG',
+    'PETROVAC GLOZAN',
+    'BACKI MAGLIC',
+    'SVETOZAR MILETIC',
+    'ALEKSA SANTIC',
+    'BAJMOK',
+    'TAVANKUT',
+    'LJUTOVO',
+    'SEBESIC',
+    'SUBOTICA PREDGRADJE',
+    'PARAGE',
+    'RATKOVO',
+    'ODZACI',
+    'ODZACI KALVARIJA',
+    'KARAVUKOVO',
+    'BOGOJEVO SELO',
+    'BOGOJEVO',
+    'SONTA',
+    'PRIGREVICA',
+    'BUKOVACKI SALASI',
+    'SOMBOR',
+    'PODGORICA',
+    'GOLUBOVCI',
+    'SUTOMORE',
+    'BAR',
+    'BIJELO POLJE',
+    'MOJKOVAC',
+    'KOLASIN',
+)
+
+class StationMembers:
+    #every member declared for type checkers and IDEs, the values are set when SerbiaTrainApi builds Station
+    __slots__ = ()
+
+    KEMENDIN_ST: ClassVar[Station]
+    ALTINA_ST: ClassVar[Station]
+    DOLJEVAC: ClassVar[Station]
+    KOCANE: ClassVar[Station]
+    PUKOVAC: ClassVar[Station]
+    BRESTOVAC: ClassVar[Station]
+    LIPOVICA: ClassVar[Station]
+    PECENJEVCE: ClassVar[Station]
+    ZIVKOVO: ClassVar[Station]
+    LESKOVAC: ClassVar[Station]
+    SAJINOVAC: ClassVar[Station]
+    JASENICA: ClassVar[Station]
+    RECICA: ClassVar[Station]
+    PODINA: ClassVar[Station]
+    PROKUPLJE: ClassVar[Station]
+    LUKOMIR: ClassVar[Station]
+    TOPLICKI_BADNJEVAC: ClassVar[Station]
+    ZITORADJA_CENTAR: ClassVar[Station]
+    LESAK: ClassVar[Station]
+    DREN: ClassVar[Station]
+    LEPOSAVIC: ClassVar[Station]
+    SOCANICA: ClassVar[Station]
+    IBARSKA_SLATINA: ClassVar[Station]
+    BANJSKA: ClassVar[Station]
+    VALAC: ClassVar[Station]
+    ZVECAN: ClassVar[Station]
+    PLANDISTE: ClassVar[Station]
+    PRIDVORICA: ClassVar[Station]
+    KOSOVSKA_MITROVICA_SEVER: ClassVar[Station]
+    MATARUSKA_BANJA: ClassVar[Station]
+    PROGORELICA: ClassVar[Station]
+    BOGUTOVACKA_BANJA: ClassVar[Station]
+    POLUMIR: ClassVar[Station]
+    USCE: ClassVar[Station]
+    JOSANICKA_BANJA: ClassVar[Station]
+    PISKANJA: ClassVar[Station]
+    BRVENIK: ClassVar[Station]
+    RVATI: ClassVar[Station]
+    RASKA: ClassVar[Station]
+    KAZNOVICI: ClassVar[Station]
+    RUDNICA: ClassVar[Station]
+    JERINA_STAJ: ClassVar[Station]
+    LOZNO: ClassVar[Station]
+    PUSTO_POLJE: ClassVar[Station]
+    MRZENICA: ClassVar[Station]
+    DEDINA: ClassVar[Station]
+    KRUSEVAC: ClassVar[Station]
+    KOSEVI: ClassVar[Station]
+    STOPANJA: ClassVar[Station]
+    POCEKOVINA: ClassVar[Station]
+    TRSTENIK: ClassVar[Station]
+    VRNJACKA_BANJA: ClassVar[Station]
+    LIPOVA_STA: ClassVar[Station]
+    PODUNAVCI: ClassVar[Station]
+    VRBA_STAJ: ClassVar[Station]
+    RATINA: ClassVar[Station]
+    TOMINAC_STA: ClassVar[Station]
+    VRANESI_STAJ: ClassVar[Station]
+    CITLUK: ClassVar[Station]
+    GRAD_STALAC_STA: ClassVar[Station]
+    BELOTINCE: ClassVar[Station]
+    MALOSISTE: ClassVar[Station]
+    CAPLJINAC: ClassVar[Station]
+    BRALJINA: ClassVar[Station]
+    STARO_TRUBAREVO: ClassVar[Station]
+    DJUNIS: ClassVar[Station]
+    VITKOVAC_STAJ: ClassVar[Station]
+    DONJI_LJUBES: ClassVar[Station]
+    KORMAN: ClassVar[Station]
+    TRNJANI: ClassVar[Station]
+    ADROVAC: ClassVar[Station]
+    ALEKSINAC: ClassVar[Station]
+    LUZANE: ClassVar[Station]
+    TESICA: ClassVar[Station]
+    GREJAC: ClassVar[Station]
+    SUPOVACKI_MOST: ClassVar[Station]
+    MEZGRAJA: ClassVar[Station]
+    TRUPALE: ClassVar[Station]
+    CEROVO_RAZANJ: ClassVar[Station]
+    VRTISTE: ClassVar[Station]
+    GORNJI_LJUBES: ClassVar[Station]
+    NOZRINA: ClassVar[Station]
+    CRVENI_KRST: ClassVar[Station]
+    NIS: ClassVar[Station]
+    ADRANI: ClassVar[Station]
+    MRSAC: ClassVar[Station]
+    SAMAILA: ClassVar[Station]
+    GORICANI: ClassVar[Station]
+    MRSINCI: ClassVar[Station]
+    ZABLACE: ClassVar[Station]
+    PRIJEVOR: ClassVar[Station]
+    OVCAR_BANJA: ClassVar[Station]
+    DRAGACEVO: ClassVar[Station]
+    TRBUSANI: ClassVar[Station]
+    BORACKO: ClassVar[Station]
+    BALUGA: ClassVar[Station]
+    JELEN_DO: ClassVar[Station]
+    KUKICI: ClassVar[Station]
+    GUGALJ_STA: ClassVar[Station]
+    CACAK: ClassVar[Station]
+    BATOCINA: ClassVar[Station]
+    GRADAC: ClassVar[Station]
+    BADNJEVAC: ClassVar[Station]
+    RESNIK_KRAGUJEVACKI: ClassVar[Station]
+    MILATOVAC: ClassVar[Station]
+    JOVANOVAC: ClassVar[Station]
+    ZAVOD: ClassVar[Station]
+    GROSNICA: ClassVar[Station]
+    DRAGOBRACA: ClassVar[Station]
+    KNIC: ClassVar[Station]
+    GRUZA: ClassVar[Station]
+    GUBEREVAC: ClassVar[Station]
+    VITKOVAC: ClassVar[Station]
+    MILAVCICI: ClassVar[Station]
+    VITANOVAC: ClassVar[Station]
+    SUMARICE: ClassVar[Station]
+    SIRCA: ClassVar[Station]
+    TOMICA_BRDO: ClassVar[Station]
+    KRAGUJEVAC: ClassVar[Station]
+    KRALJEVO: ClassVar[Station]
+    BRZAN: ClassVar[Station]
+    MILOSEVO: ClassVar[Station]
+    BAGRDAN: ClassVar[Station]
+    LANISTE: ClassVar[Station]
+    BUKOVCE: ClassVar[Station]
+    GILJE: ClassVar[Station]
+    PARACIN: ClassVar[Station]
+    SIKIRICA_RATARI: ClassVar[Station]
+    DRENOVAC: ClassVar[Station]
+    CICEVAC: ClassVar[Station]
+    LUCINA: ClassVar[Station]
+    JAGODINA: ClassVar[Station]
+    CUPRIJA: ClassVar[Station]
+    STALAC: ClassVar[Station]
+    VELIKA_PLANA: ClassVar[Station]
+    STARO_SELO: ClassVar[Station]
+    NOVO_SELO: ClassVar[Station]
+    MARKOVAC: ClassVar[Station]
+    LAPOVO_VAROS: ClassVar[Station]
+    LAPOVO_RANZ_STAJ: ClassVar[Station]
+    LAPOVO: ClassVar[Station]
+    MALA_KRSNA: ClassVar[Station]
+    GODOMIN: ClassVar[Station]
+    RADINAC: ClassVar[Station]
+    VRANOVO: ClassVar[Station]
+    SMEDEREVO: ClassVar[Station]
+    KOVACEVAC: ClassVar[Station]
+    RABROVAC: ClassVar[Station]
+    KUSADAK: ClassVar[Station]
+    RATARE: ClassVar[Station]
+    GLIBOVAC: ClassVar[Station]
+    PALANKA: ClassVar[Station]
+    MALA_PLANA: ClassVar[Station]
+    MATEJEVAC: ClassVar[Station]
+    PANTELEJ: ClassVar[Station]
+    JASENOVIK: ClassVar[Station]
+    GRAMADA: ClassVar[Station]
+    HADZICEVO: ClassVar[Station]
+    SVRLJIG: ClassVar[Station]
+    NISEVAC: ClassVar[Station]
+    PALILULA: ClassVar[Station]
+    SVRLJISKI_MILJKOVAC: ClassVar[Station]
+    PODVIS: ClassVar[Station]
+    RGOSTE: ClassVar[Station]
+    KNJAZEVAC: ClassVar[Station]
+    GORNJE_ZUNICE: ClassVar[Station]
+    DONJE_ZUNICE: ClassVar[Station]
+    MINICEVO: ClassVar[Station]
+    SELACKA_REKA: ClassVar[Station]
+    MALI_IZVOR: ClassVar[Station]
+    VRATARNICA: ClassVar[Station]
+    GRLJAN: ClassVar[Station]
+    TIMOK: ClassVar[Station]
+    ZAJECAR: ClassVar[Station]
+    TRNAVAC: ClassVar[Station]
+    COKONJAR: ClassVar[Station]
+    TABAKOVAC: ClassVar[Station]
+    TABAKOVACKA_REKA: ClassVar[Station]
+    BRUSNIK: ClassVar[Station]
+    TAMNIC: ClassVar[Station]
+    CRNOMASNICA: ClassVar[Station]
+    RAJAC: ClassVar[Station]
+    ROGLJEVO: ClassVar[Station]
+    VELJKOVO: ClassVar[Station]
+    KOBISNICA: ClassVar[Station]
+    NEGOTIN: ClassVar[Station]
+    PRAHOVO: ClassVar[Station]
+    PRAHOVO_PRISTANISTE: ClassVar[Station]
+    VRAZOGRNAC: ClassVar[Station]
+    RGOTINA: ClassVar[Station]
+    ZAGRADJE: ClassVar[Station]
+    BOR_TERETNA: ClassVar[Station]
+    MAJDANPEK: ClassVar[Station]
+    LESKOVO: ClassVar[Station]
+    JASIKOVO: ClassVar[Station]
+    VLAOLE: ClassVar[Station]
+    CEROVO: ClassVar[Station]
+    KRIVELJSKI_POTOK: ClassVar[Station]
+    MALI_KRIVELJ: ClassVar[Station]
+    GORNJANE: ClassVar[Station]
+    KRIVELJSKI_MOST: ClassVar[Station]
+    DEBELI_LUG: ClassVar[Station]
+    VLAOLE_SELO: ClassVar[Station]
+    SUSULAJKA: ClassVar[Station]
+    BREZONIK: ClassVar[Station]
+    POZAREVAC: ClassVar[Station]
+    LJUBICEVSKI_MOST: ClassVar[Station]
+    LASTRA: ClassVar[Station]
+    SAMARI: ClassVar[Station]
+    DRENOVACKI_KIK: ClassVar[Station]
+    RAZANA: ClassVar[Station]
+    KOSJERIC: ClassVar[Station]
+    KALENIC: ClassVar[Station]
+    SEVOJNO: ClassVar[Station]
+    TUBICI: ClassVar[Station]
+    UZICI: ClassVar[Station]
+    RASNA: ClassVar[Station]
+    LESKOVICE: ClassVar[Station]
+    GLUMAC: ClassVar[Station]
+    ZLAKUSA: ClassVar[Station]
+    OTANJ: ClassVar[Station]
+    RACA: ClassVar[Station]
+    POZEGA: ClassVar[Station]
+    UZICE_TERETNA: ClassVar[Station]
+    UZICE: ClassVar[Station]
+    BELA_REKA: ClassVar[Station]
+    BARAJEVO: ClassVar[Station]
+    BARAJEVO_CENTAR: ClassVar[Station]
+    VELIKI_BORAK: ClassVar[Station]
+    LESKOVAC_KOLUBARSKI: ClassVar[Station]
+    STEPOJEVAC: ClassVar[Station]
+    LAZAREVAC: ClassVar[Station]
+    SLOVAC: ClassVar[Station]
+    MLADJEVO: ClassVar[Station]
+    DIVCI: ClassVar[Station]
+    IVERAK: ClassVar[Station]
+    VREOCI: ClassVar[Station]
+    VALJEVO: ClassVar[Station]
+    LAJKOVAC: ClassVar[Station]
+    RIPANJ: ClassVar[Station]
+    KLENJE: ClassVar[Station]
+    RIPANJ_TUNEL: ClassVar[Station]
+    RALJA: ClassVar[Station]
+    SOPOT_KOSMAJSKI: ClassVar[Station]
+    VLASKO_POLJE: ClassVar[Station]
+    RIPANJ_KOLONIJA: ClassVar[Station]
+    MLADENOVAC: ClassVar[Station]
+    RESNIK: ClassVar[Station]
+    STAPARI: ClassVar[Station]
+    SUSICA: ClassVar[Station]
+    BRANESCI: ClassVar[Station]
+    ZLATIBOR: ClassVar[Station]
+    RIBNICA_ZLATIBORSKA: ClassVar[Station]
+    JABLANICA: ClassVar[Station]
+    STRPCI: ClassVar[Station]
+    PRIBOJ: ClassVar[Station]
+    PRIBOJSKA_BANJA: ClassVar[Station]
+    BISTRICA_NA_LIMU: ClassVar[Station]
+    PRIJEPOLJE: ClassVar[Station]
+    PRIJEPOLJE_TERETNA: ClassVar[Station]
+    BRODAREVO: ClassVar[Station]
+    RISTANOVICA_POLJE: ClassVar[Station]
+    TRIPKOVA: ClassVar[Station]
+    DZUROVO: ClassVar[Station]
+    POLJICE: ClassVar[Station]
+    ZEMUN_POLJE: ClassVar[Station]
+    ZEMUN: ClassVar[Station]
+    NOVI_BEOGRAD: ClassVar[Station]
+    SEBES: ClassVar[Station]
+    OVCA: ClassVar[Station]
+    TOSIN_BUNAR: ClassVar[Station]
+    PANCEVACKI_MOST: ClassVar[Station]
+    PANCEVO_STRELISTE: ClassVar[Station]
+    KRNJACA: ClassVar[Station]
+    KRNJACA_MOST_STA: ClassVar[Station]
+    BEOGRAD_CENTAR: ClassVar[Station]
+    KARADJORDJEV_PARK: ClassVar[Station]
+    VUKOV_SPOMENIK: ClassVar[Station]
+    KIJEVO: ClassVar[Station]
+    KNEZEVAC: ClassVar[Station]
+    RAKOVICA: ClassVar[Station]
+    BATAJNICA: ClassVar[Station]
+    MAJUR_STAJ: ClassVar[Station]
+    PRNJAVOR_MACVANSKI: ClassVar[Station]
+    LESNICA: ClassVar[Station]
+    LOZNICA: ClassVar[Station]
+    KOVILJACA: ClassVar[Station]
+    BRASINA: ClassVar[Station]
+    DONJA_BORINA_STAJ: ClassVar[Station]
+    ZVORNIK: ClassVar[Station]
+    SABAC: ClassVar[Station]
+    NOVA_PAZOVA: ClassVar[Station]
+    STARA_PAZOVA: ClassVar[Station]
+    GOLUBINCI: ClassVar[Station]
+    PUTINCI: ClassVar[Station]
+    KRALJEVCI_STAJ: ClassVar[Station]
+    SREMSKA_MITROVICA: ClassVar[Station]
+    MARTINCI: ClassVar[Station]
+    KUKUJEVCI_ERDEVIK: ClassVar[Station]
+    SID: ClassVar[Station]
+    RUMA: ClassVar[Station]
+    BUDJANOVCI: ClassVar[Station]
+    NIKINCI: ClassVar[Station]
+    PLATICEVO: ClassVar[Station]
+    KLENAK: ClassVar[Station]
+    INDJIJA: ClassVar[Station]
+    BESKA: ClassVar[Station]
+    SREMSKI_KARLOVCI: ClassVar[Station]
+    PETROVARADIN: ClassVar[Station]
+    NOVI_SAD: ClassVar[Station]
+    NOVI_SAD_RANZIRNA: ClassVar[Station]
+    SZEGED: ClassVar[Station]
+    SZENTMIHALYTELEK: ClassVar[Station]
+    ROESZKE: ClassVar[Station]
+    PANCEVO_VAROS: ClassVar[Station]
+    BANATSKO_NOVO_SELO: ClassVar[Station]
+    VLADIMIROVAC: ClassVar[Station]
+    ALIBUNAR: ClassVar[Station]
+    BANATSKI_KARLOVAC: ClassVar[Station]
+    NIKOLINCI: ClassVar[Station]
+    ULJMA: ClassVar[Station]
+    VLAJKOVAC: ClassVar[Station]
+    VRSAC: ClassVar[Station]
+    PANCEVO_VOJLOVICA: ClassVar[Station]
+    PANCEVO_GLAVNA: ClassVar[Station]
+    KACAREVO: ClassVar[Station]
+    CREPAJA: ClassVar[Station]
+    DEBELJACA: ClassVar[Station]
+    KOVACICA: ClassVar[Station]
+    UZDIN: ClassVar[Station]
+    TOMASEVAC: ClassVar[Station]
+    ORLOVAT_STAJALISTE: ClassVar[Station]
+    LUKICEVO: ClassVar[Station]
+    ZRENJANIN_FABRIKA: ClassVar[Station]
+    ELEMIR: ClassVar[Station]
+    MELENCI: ClassVar[Station]
+    KUMANE: ClassVar[Station]
+    NOVI_BECEJ: ClassVar[Station]
+    BANAT_MILOSEVO_POLJE: ClassVar[Station]
+    BANATSKO_MILOSEVO: ClassVar[Station]
+    ZRENJANIN: ClassVar[Station]
+    BOCAR: ClassVar[Station]
+    PADEJ: ClassVar[Station]
+    OSTOJICEVO: ClassVar[Station]
+    COKA: ClassVar[Station]
+    KIKINDA: ClassVar[Station]
+    KISAC: ClassVar[Station]
+    STEPANOVICEVO: ClassVar[Station]
+    ZMAJEVO: ClassVar[Station]
+    VRBAS_NOVA: ClassVar[Station]
+    LOVCENAC_MALI_IDJOS: ClassVar[Station]
+    MALI_IDJOS_POLJE: ClassVar[Station]
+    BACKA_TOPOLA: ClassVar[Station]
+    ZEDNIK: ClassVar[Station]
+    NAUMOVICEVO: ClassVar[Station]
+    SUBOTICA: ClassVar[Station]
+    HORGOS: ClassVar[Station]
+    BACKI_VINOGRADI: ClassVar[Station]
+    HAJDUKOVO: ClassVar[Station]
+    PALIC: ClassVar[Station]
+    SUBOTICA_JAV_SKLADISTA: ClassVar[Station]
+    SENTA: ClassVar[Station]
+    GORNJI_BREG: ClassVar[Station]
+    BOGARAS: ClassVar[Station]
+    DOLINE: ClassVar[Station]
+    OROM: ClassVar[Station]
+    GABRIC: ClassVar[Station]
+    GAJDOBRA: ClassVar[Station]
+    FUTOG: ClassVar[Station]
+    PETROVAC_GLOZAN: ClassVar[Station]
+    BACKI_MAGLIC: ClassVar[Station]
+    SVETOZAR_MILETIC: ClassVar[Station]
+    ALEKSA_SANTIC: ClassVar[Station]
+    BAJMOK: ClassVar[Station]
+    TAVANKUT: ClassVar[Station]
+    LJUTOVO: ClassVar[Station]
+    SEBESIC: ClassVar[Station]
+    SUBOTICA_PREDGRADJE: ClassVar[Station]
+    PARAGE: ClassVar[Station]
+    RATKOVO: ClassVar[Station]
+    ODZACI: ClassVar[Station]
+    ODZACI_KALVARIJA: ClassVar[Station]
+    KARAVUKOVO: ClassVar[Station]
+    BOGOJEVO_SELO: ClassVar[Station]
+    BOGOJEVO: ClassVar[Station]
+    SONTA: ClassVar[Station]
+    PRIGREVICA: ClassVar[Station]
+    BUKOVACKI_SALASI: ClassVar[Station]
+    SOMBOR: ClassVar[Station]
+    PODGORICA: ClassVar[Station]
+    GOLUBOVCI: ClassVar[Station]
+    SUTOMORE: ClassVar[Station]
+    BAR: ClassVar[Station]
+    BIJELO_POLJE: ClassVar[Station]
+    MOJKOVAC: ClassVar[Station]
+    KOLASIN: ClassVar[Station]
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import re
+import bisect
+from functools import lru_cache
+from typing import Iterable
+
+import SerbiaTrainStationData
+from SerbiaTrainApi import Station, safeName
+
+_SEPARATORS = re.compile(r"[^A-Z0-9]+")
+
+def normalizeName(name: str) -> str:
+    #fold diacritics the same way as the "safe name", then ignore case and punctuation
+    return _SEPARATORS.sub(" ", safeName(name)).strip()
+
+def _trigrams(text: str) -> set[str]:
+    text = f"  {text} "
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+def _prefixDistance(query: str, key: str, limit: int) -> int:
+    #optimal string alignment distance between query and the closest prefix of key,
+    #gives up once every cell in a row is over the limit
+    key = key[:len(query) + limit]
+
+    prev2 = None
+    prev = list(range(len(key) + 1))
+
+    for i in range(1, len(query) + 1):
+        cur = [i] + [0] * len(key)
+
+        for j in range(1, len(key) + 1):
+            cost = 0 if query[i - 1] == key[j - 1] else 1
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+
+            if prev2 is not None and j > 1 and query[i - 1] == key[j - 2] and query[i - 2] == key[j - 1]:
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+
+        if min(cur) > limit:
+            return limit + 1
+
+        prev2, prev = prev, cur
+
+    return min(prev[max(0, len(query) - limit):])
+
+class StationIndex:
+    def __init__(self, stations: Iterable[Station] = Station):
+        self.stations = list(stations)
+        #the generated catalogue carries its folded names, any other list is folded here
+        names = SerbiaTrainStationData.NORMALIZED_NAMES if stations is Station else [normalizeName(station.value.get("name")) for station in self.stations]
+
+        self._by_id: dict[str, Station] = {}
+        self._by_name: dict[str, Station] = {}
+        self._trigrams: dict[str, set[int]] = {}
+        #every station is reachable from each word of its name, "CENTAR" finds "BEOGRAD CENTAR"
+        keys: list[tuple[str, int]] = []
+
+        for i, station in enumerate(self.stations):
+            name = names[i]
+
+            self._by_id[station.value.get("id")] = station
+            self._by_name.setdefault(name, station)
+            self._by_name.setdefault(station.value.get("safe name"), station)
+            self._by_name.setdefault(station.name, station)
+
+            words = name.split(" ")
+
+            for w in range(len(words)):
+                keys.append((" ".join(words[w:]), i))
+
+            for gram in _trigrams(name):
+                self._trigrams.setdefault(gram, set()).add(i)
+
+        keys.sort()
+
+        self._keys = [k for k, _ in keys]
+        self._key_stations = [i for _, i in keys]
+        self._names = list(names)
+
+    def getById(self, id_: str) -> Station | None:
+        return self._by_id.get(id_)
+
+    def getByName(self, name: str) -> Station | None:
+        station = self._by_name.get(name)
+
+        return station if station is not None else self._by_name.get(normalizeName(name))
+
+    def searchPrefix(self, query: str, limit: int = 10) -> list[Station]:
+        query = normalizeName(query)
+
+        if len(query) == 0:
+            return self.stations[:limit]
+
+        found = {}
+        start = bisect.bisect_left(self._keys, query)
+
+        for k in range(start, len(self._keys)):
+            key = self._keys[k]
+
+            if not key.startswith(query):
+                break
+
+            i = self._key_stations[k]
+            name = self._names[i]
+            #whole name matches rank above word matches, then shorter names first
+            rank = (0 if name.startswith(query) else 1, len(name), name)
+
+            if i not in found or rank < found[i]:
+                found[i] = rank
+
+        return [self.stations[i] for i in sorted(found, key=found.get)[:limit]]
+
+    def searchFuzzy(self, query: str, limit: int = 10, max_distance: int | None = None) -> list[Station]:
+        query = normalizeName(query)
+
+        if len(query) == 0:
+            return []
+
+        if max_distance is None:
+            max_distance = max(1, len(query) // 4)
+
+        grams = _trigrams(query)
+        shared = {}
+
+        #only stations sharing a trigram with the query are scored
+        for gram in grams:
+            for i in self._trigrams.get(gram, ()):
+                shared[i] = shared.get(i, 0) + 1
+
+        #each edit breaks at most 3 trigrams, partial input and word matches lose the padded ones
+        min_overlap = max(1, len(grams) - 3 * max_distance - 3)
+        ranked = []
+
+        for i, overlap in shared.items():
+            if overlap < min_overlap:
+                continue
+
+            name = self._names[i]
+            words = name.split(" ")
+            #compare against the start of the name or of any word so partial input still matches
+            distance = min(_prefixDistance(query, " ".join(words[w:]), max_distance) for w in range(len(words)))
+
+            if distance <= max_distance:
+                ranked.append((distance, -overlap, len(name), name, i))
+
+        ranked.sort()
+
+        return [self.stations[r[-1]] for r in ranked[:limit]]
+
+    def search(self, query: str, limit: int = 10) -> list[Station]:
+        stations = self.searchPrefix(query, limit)
+
+        if len(stations) < limit:
+            for station in self.searchFuzzy(query, limit):
+                if station not in stations:
+                    stations.append(station)
+
+                if len(stations) >= limit:
+                    break
+
+        return stations
+
+@lru_cache(maxsize=1)
+def stationIndex() -> StationIndex:
+    return StationIndex()
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import time
+import sqlite3
+import hashlib
+import datetime
+import threading
+
+from SerbiaTrainApi import Arrival, TrainDirection, TrainType
+
+#bump when the tables change, older stores are dropped and refetched
+SCHEMA_VERSION = 2
+
+class TimeTableStore:
+    def __init__(self, path: str = "timetables.sqlite3", today_max_age: float = 5 * 60, future_max_age: float = 24 * 60 * 60):
+        self.path = path
+        self.today_max_age = today_max_age
+        self.future_max_age = future_max_age
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+
+        with self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+
+            if self._db.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                self._db.execute("DROP TABLE IF EXISTS timetables")
+                self._db.execute("DROP TABLE IF EXISTS arrivals")
+                self._db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+            self._db.execute("""
+                CREATE TABLE IF NOT EXISTS timetables (
+                    station_id TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    direction INTEGER NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    PRIMARY KEY (station_id, date, direction)
+                )
+            """)
+            self._db.execute("""
+                CREATE TABLE IF NOT EXISTS arrivals (
+                    station_id TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    direction INTEGER NOT NULL,
+                    position INTEGER NOT NULL,
+                    train_number INTEGER,
+                    arrival_time INTEGER,
+                    departure_time INTEGER,
+                    note TEXT,
+                    is_late INTEGER,
+                    train_type TEXT,
+                    PRIMARY KEY (station_id, date, direction, position)
+                )
+            """)
+            self._db.execute("CREATE INDEX IF NOT EXISTS timetables_fetched_at ON timetables (fetched_at)")
+
+    def __enter__(self) -> TimeTableStore:
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def maxAge(self, date: str) -> float:
+        try:
+            day = datetime.datetime.strptime(date, "%d.%m.%Y").date()
+        except (TypeError, ValueError):
+            return self.today_max_age
+
+        return self.today_max_age if day == datetime.date.today() else self.future_max_age
+
+    def isStale(self, date: str, fetched_at: float) -> bool:
+        return time.time() - fetched_at > self.maxAge(date)
+
+    def get(self, station_id: str, date: str, dir_: TrainDirection) -> tuple[list[Arrival], float] | None:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT fetched_at FROM timetables WHERE station_id = ? AND date = ? AND direction = ?",
+                (station_id, date, dir_.value)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            rows = self._db.execute(
+                "SELECT train_number, arrival_time, departure_time, note, is_late, train_type FROM arrivals "
+                "WHERE station_id = ? AND date = ? AND direction = ? ORDER BY position",
+                (station_id, date, dir_.value)
+            ).fetchall()
+
+        arrivals = [Arrival(
+            TrainNumber=r[0],
+            ArrivalTime=r[1],
+            DepartureTime=r[2],
+            Direction=dir_,
+            Note=r[3],
+            IsLate=bool(r[4]),
+            TrainType=TrainType[r[5]] if r[5] is not None else None
+        ) for r in rows]
+
+        return arrivals, row[0]
+
+    def put(self, station_id: str, date: str, dir_: TrainDirection, arrivals: list[Arrival], fetched_at: float | None = None) -> bool:
+        #returns True when the content actually changed
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        rows = [(
+            station_id, date, dir_.value, i,
+            a.TrainNumber, a.ArrivalTime, a.DepartureTime, a.Note, int(a.IsLate),
+            a.TrainType.name if a.TrainType is not None else None
+        ) for i, a in enumerate(arrivals)]
+        content_hash = hashlib.sha256(repr([r[4:] for r in rows]).encode()).hexdigest()
+
+        with self._lock, self._db:
+            row = self._db.execute(
+                "SELECT content_hash FROM timetables WHERE station_id = ? AND date = ? AND direction = ?",
+                (station_id, date, dir_.value)
+            ).fetchone()
+
+            self._db.execute(
+                "INSERT OR REPLACE INTO timetables (station_id, date, direction, fetched_at, content_hash) VALUES (?, ?, ?, ?, ?)",
+                (station_id, date, dir_.value, fetched_at, content_hash)
+            )
+
+            #same rows as before, only the fetch time moves
+            if row is not None and row[0] == content_hash:
+                return False
+
+            self._db.execute("DELETE FROM arrivals WHERE station_id = ? AND date = ? AND direction = ?", (station_id, date, dir_.value))
+            self._db.executemany("INSERT INTO arrivals VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+        return True
+
+    def staleEntries(self) -> list[tuple[str, str, TrainDirection]]:
+        with self._lock:
+            rows = self._db.execute("SELECT station_id, date, direction, fetched_at FROM timetables ORDER BY fetched_at").fetchall()
+
+        return [(r[0], r[1], TrainDirection(r[2])) for r in rows if self.isStale(r[1], r[3])]
+
+    def delete(self, station_id: str, date: str, dir_: TrainDirection):
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM timetables WHERE station_id = ? AND date = ? AND direction = ?", (station_id, date, dir_.value))
+            self._db.execute("DELETE FROM arrivals WHERE station_id = ? AND date = ? AND direction = ?", (station_id, date, dir_.value))
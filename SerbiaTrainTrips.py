@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import bisect
+import datetime
+import threading
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from SerbiaTrainApi import Station, TrainDirection, TrainType, TimeTable, Arrival
+
+@dataclass(slots=True)
+class TripStop:
+    Station: Station
+    ArrivalTime: int | None #minutes since midnight
+    DepartureTime: int | None #minutes since midnight
+    IsLate: bool
+    Note: str
+    TrainType: TrainType | None
+
+@dataclass
+class Trip:
+    TrainNumber: int
+    Date: str
+    Stops: list[TripStop]
+
+@dataclass
+class _TripStops:
+    #station id -> the row each direction's page currently has for this train, oldest first
+    rows: dict[str, dict[TrainDirection, Arrival]] = field(default_factory=dict)
+    #station id -> stop built from those rows, and (time, station id) kept sorted so reads never sort
+    stops: dict[str, TripStop] = field(default_factory=dict)
+    order: list[tuple[int, str]] = field(default_factory=list)
+
+    def _unlink(self, station_id: str):
+        stop = self.stops.pop(station_id)
+        self.order.pop(bisect.bisect_left(self.order, (_stopTime(stop), station_id)))
+
+    def _rebuild(self, station_id: str, station: Station):
+        if station_id in self.stops:
+            self._unlink(station_id)
+
+        rows = self.rows.get(station_id)
+
+        if not rows:
+            self.rows.pop(station_id, None)
+            return
+
+        stop = _stopFromRows(station, list(rows.values())[::-1])
+        self.stops[station_id] = stop
+        bisect.insort(self.order, (_stopTime(stop), station_id))
+
+    def put(self, station_id: str, station: Station, arrival: Arrival, source: TrainDirection):
+        rows = self.rows.setdefault(station_id, {})
+        #re-inserted so the latest page comes last
+        rows.pop(source, None)
+        rows[source] = arrival
+
+        self._rebuild(station_id, station)
+
+    def drop(self, station_id: str, source: TrainDirection):
+        rows = self.rows.get(station_id)
+
+        if rows is None or source not in rows:
+            return
+
+        del rows[source]
+        self._rebuild(station_id, self.stops[station_id].Station)
+
+def _dateKey(date: str | datetime.date) -> str:
+    #timetable dates are already dd.mm.yyyy
+    return date.strftime("%d.%m.%Y") if isinstance(date, datetime.date) else date
+
+def _stopTime(stop: TripStop) -> int:
+    if stop.ArrivalTime is not None:
+        return stop.ArrivalTime
+
+    return stop.DepartureTime if stop.DepartureTime is not None else 0
+
+def _stopFromRows(station: Station, rows: list[Arrival]) -> TripStop:
+    #the arrivals page and the departures page both list the train. the latest row decides,
+    #the other page only fills in what the latest one leaves empty
+    latest = rows[0]
+
+    def first(values):
+        return next((value for value in values if value is not None), None)
+
+    return TripStop(
+        Station=station,
+        ArrivalTime=first(row.ArrivalTime for row in rows),
+        DepartureTime=first(row.DepartureTime for row in rows),
+        IsLate=latest.IsLate,
+        Note=next((row.Note for row in rows if row.Note), latest.Note),
+        TrainType=first(row.TrainType for row in rows)
+    )
+
+class TripIndex:
+    def __init__(self, timetables: Iterable[TimeTable] = ()):
+        #(train number, date) -> stops of that train
+        self._trips: dict[tuple[int, str], _TripStops] = {}
+        #(station id, date, direction) -> train numbers seen on that page the last time
+        self._pages: dict[tuple[str, str, TrainDirection], set[int]] = {}
+        self._lock = threading.Lock()
+
+        for timetable in timetables:
+            self.add(timetable)
+
+    def __len__(self) -> int:
+        return len(self._trips)
+
+    def add(self, timetable: TimeTable, directions: TrainDirection | None = None, date: str | datetime.date | None = None):
+        #replaces whatever an earlier scrape of the same station page contributed,
+        #directions default to the ones present in the arrivals
+        date = _dateKey(date if date is not None else timetable.Date)
+        station = timetable.Station
+        station_id = station.value.get("id")
+
+        by_direction: dict[TrainDirection, list[Arrival]] = {}
+
+        for arrival in timetable.Arrivals:
+            if arrival.TrainNumber is not None:
+                by_direction.setdefault(arrival.Direction, []).append(arrival)
+
+        if directions is not None:
+            for dir_ in directions:
+                by_direction.setdefault(dir_, [])
+
+        with self._lock:
+            for dir_, arrivals in by_direction.items():
+                seen = {arrival.TrainNumber for arrival in arrivals}
+
+                #trains that dropped off this page lose the stop it gave them
+                for train_number in self._pages.get((station_id, date, dir_), set()) - seen:
+                    self._dropSource(train_number, date, station_id, dir_)
+
+                self._pages[(station_id, date, dir_)] = seen
+
+                for arrival in arrivals:
+                    trip = self._trips.setdefault((arrival.TrainNumber, date), _TripStops())
+                    trip.put(station_id, station, arrival, dir_)
+
+    def _dropSource(self, train_number: int, date: str, station_id: str, dir_: TrainDirection):
+        trip = self._trips.get((train_number, date))
+
+        if trip is None:
+            return
+
+        trip.drop(station_id, dir_)
+
+        if len(trip.stops) == 0:
+            del self._trips[(train_number, date)]
+
+    def getTrip(self, train_number: int, date: str | datetime.date) -> Trip | None:
+        date = _dateKey(date)
+
+        with self._lock:
+            trip = self._trips.get((train_number, date))
+
+            if trip is None:
+                return None
+
+            order = list(trip.order)
+            stops = trip.stops
+
+            #trains running past midnight wrap around, the sequence starts after the biggest gap in the day
+            start = 0
+
+            if len(order) > 1:
+                gaps = [(order[i][0] - order[i - 1][0]) % (24 * 60) for i in range(len(order))]
+                start = max(range(len(order)), key=gaps.__getitem__)
+
+            return Trip(TrainNumber=train_number, Date=date, Stops=[stops[station_id] for _, station_id in order[start:] + order[:start]])
+
+    def trains(self, date: str | datetime.date) -> list[int]:
+        date = _dateKey(date)
+
+        with self._lock:
+            return sorted(number for number, day in self._trips if day == date)
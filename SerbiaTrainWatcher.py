@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import time
+import hashlib
+import datetime
+import threading
+from dataclasses import dataclass, field
+from typing import Callable
+
+from SerbiaTrainApi import TrainApi, TrainDirection, Station, Arrival, parseArrivals, formatDate, parseDate
+
+@dataclass
+class TimeTableDiff:
+    Station: Station
+    Date: str
+    Direction: TrainDirection
+    Added: list[Arrival] = field(default_factory=list)
+    Removed: list[Arrival] = field(default_factory=list)
+    Changed: list[tuple[Arrival, Arrival]] = field(default_factory=list) #(old, new)
+
+    def __bool__(self) -> bool:
+        return len(self.Added) + len(self.Removed) + len(self.Changed) > 0
+
+@dataclass
+class _PageState:
+    content_hash: bytes | None = None
+    rows: dict[tuple[int | None, TrainDirection], Arrival] = field(default_factory=dict)
+
+@dataclass
+class _Watch:
+    station: Station
+    date: str | None #None follows the current day
+    directions: TrainDirection
+    interval: float
+    due: float
+
+def _contentHash(body: bytes) -> bytes:
+    #only the results table counts, anything else on the page may change on every request
+    start = body.find(b'id="rezultati"')
+
+    if start >= 0:
+        end = body.find(b"</table>", start)
+        body = body[start:] if end < 0 else body[start:end]
+
+    return hashlib.blake2b(body, digest_size=16).digest()
+
+def diffArrivals(old: dict[tuple[int | None, TrainDirection], Arrival], new: dict[tuple[int | None, TrainDirection], Arrival], diff: TimeTableDiff) -> TimeTableDiff:
+    for key, arrival in new.items():
+        previous = old.get(key)
+
+        if previous is None:
+            diff.Added.append(arrival)
+        elif previous != arrival:
+            diff.Changed.append((previous, arrival))
+
+    diff.Removed.extend(arrival for key, arrival in old.items() if key not in new)
+
+    return diff
+
+class TimeTableWatcher:
+    def __init__(self, api: TrainApi, min_interval: float = 30, max_interval: float = 15 * 60, initial_interval: float = 60, backoff: float = 1.5, clock: Callable[[], float] = time.monotonic):
+        self.api = api
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.initial_interval = initial_interval
+        self.backoff = backoff
+        self.clock = clock
+
+        self._watches: dict[tuple[str, str | None], _Watch] = {}
+        self._pages: dict[tuple[str, str, TrainDirection], _PageState] = {}
+        #the day watches without a date last followed, their pages of earlier days are dropped when it changes
+        self._today: str | None = None
+        self._lock = threading.Lock()
+
+        self.polls = 0
+        self.parses = 0
+        self.skipped = 0
+
+    def watch(self, station: Station, date: str | datetime.date | None = None, directions: TrainDirection = TrainDirection.INBOUND | TrainDirection.OUTBOUND):
+        date = None if date is None else formatDate(date)
+
+        with self._lock:
+            self._watches[(station.value.get("id"), date)] = _Watch(station, date, directions, self.initial_interval, self.clock())
+
+    def unwatch(self, station: Station, date: str | datetime.date | None = None):
+        date = None if date is None else formatDate(date)
+
+        with self._lock:
+            self._watches.pop((station.value.get("id"), date), None)
+            self._dropPages(station.value.get("id"), formatDate(datetime.date.today()) if date is None else date)
+
+    def _watched(self, station_id: str, date: str) -> bool:
+        return (station_id, date) in self._watches or (date == self._today and (station_id, None) in self._watches)
+
+    def _dropPages(self, station_id: str, date: str):
+        #pages still polled by another watch of the same station and day are kept
+        if self._watched(station_id, date):
+            return
+
+        for dir_ in TrainDirection:
+            self._pages.pop((station_id, date, dir_), None)
+
+    def _rollDay(self, today: str):
+        #pages of days gone by are only kept for watches pinned to those days
+        with self._lock:
+            if today == self._today:
+                return
+
+            self._today = today
+            current = parseDate(today)
+
+            for key in [key for key in self._pages if parseDate(key[1]) < current and not self._watched(key[0], key[1])]:
+                del self._pages[key]
+
+    def interval(self, station: Station, date: str | datetime.date | None = None) -> float | None:
+        watch = self._watches.get((station.value.get("id"), None if date is None else formatDate(date)))
+        return None if watch is None else watch.interval
+
+    def pollPage(self, station: Station, date: str, dir_: TrainDirection) -> TimeTableDiff | None:
+        #None when the page body did not change, parsing is skipped entirely then
+        body, encoding = self.api.getTimeTablePage(station, date, dir_)
+        content_hash = _contentHash(body)
+        key = (station.value.get("id"), date, dir_)
+
+        with self._lock:
+            state = self._pages.setdefault(key, _PageState())
+            self.polls += 1
+
+            if state.content_hash == content_hash:
+                self.skipped += 1
+                return None
+
+        text = body if encoding is None else body.decode(encoding, errors="replace")
+        rows = {(arrival.TrainNumber, arrival.Direction): arrival for arrival in parseArrivals(text, dir_, self.api.parser, self.api.observer)}
+
+        with self._lock:
+            self.parses += 1
+            diff = diffArrivals(state.rows, rows, TimeTableDiff(Station=station, Date=date, Direction=dir_))
+            state.content_hash = content_hash
+            state.rows = rows
+
+        return diff
+
+    def poll(self, station: Station, date: str | datetime.date | None = None, directions: TrainDirection = TrainDirection.INBOUND | TrainDirection.OUTBOUND) -> list[TimeTableDiff]:
+        if date is None:
+            date = formatDate(datetime.date.today())
+            self._rollDay(date)
+        else:
+            date = formatDate(date)
+
+        diffs = list()
+
+        for dir_ in directions:
+            diff = self.pollPage(station, date, dir_)
+
+            if diff:
+                diffs.append(diff)
+
+        return diffs
+
+    def pollDue(self, on_error: Callable[[Exception], None] | None = None) -> list[TimeTableDiff]:
+        #a failing watch backs off like a quiet one and never keeps the others from being polled,
+        #its error goes to on_error, or is raised once its next poll is scheduled when there is none
+        now = self.clock()
+
+        with self._lock:
+            due = [watch for watch in self._watches.values() if watch.due <= now]
+
+        diffs = list()
+
+        for watch in due:
+            changes = []
+
+            try:
+                changes = self.poll(watch.station, watch.date, watch.directions)
+            except Exception as e:
+                if on_error is None:
+                    raise
+
+                on_error(e)
+            finally:
+                #stations that change get polled more often, quiet and failing ones back off
+                if len(changes) > 0:
+                    watch.interval = max(self.min_interval, watch.interval / self.backoff)
+                else:
+                    watch.interval = min(self.max_interval, watch.interval * self.backoff)
+
+                watch.due = self.clock() + watch.interval
+
+            diffs.extend(changes)
+
+        return diffs
+
+    def nextDue(self) -> float | None:
+        with self._lock:
+            return min((watch.due for watch in self._watches.values()), default=None)
+
+    def run(self, callback: Callable[[TimeTableDiff], None], stop: threading.Event | None = None, on_error: Callable[[Exception], None] | None = None):
+        stop = threading.Event() if stop is None else stop
+
+        while not stop.is_set():
+            try:
+                for diff in self.pollDue(on_error):
+                    callback(diff)
+            except Exception as e:
+                if on_error is None:
+                    raise
+
+                on_error(e)
+
+            due = self.nextDue()
+            stop.wait(self.min_interval if due is None else max(0, due - self.clock()))
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "watches": len(self._watches),
+                "polls": self.polls,
+                "parses": self.parses,
+                "skipped": self.skipped
+            }
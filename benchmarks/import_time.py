@@ -0,0 +1,61 @@
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+#modules that should only load on first use
+LAZY_MODULES = ("requests", "bs4", "lxml", "dateutil", "concurrent.futures")
+
+def measure(module: str) -> tuple[float, list[str]]:
+    #fresh interpreter each time so nothing is cached in sys.modules
+    code = (
+        "import sys, time, json\n"
+        "t = time.perf_counter()\n"
+        f"import {module}\n"
+        "t = time.perf_counter() - t\n"
+        f"print(json.dumps([t, [m for m in {LAZY_MODULES!r} if m in sys.modules]]))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True).stdout
+    seconds, loaded = json.loads(out)
+
+    return seconds * 1000, loaded
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold import time of SerbiaTrainApi")
+    parser.add_argument("--module", default="SerbiaTrainApi")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--max-ms", type=float, default=None, help="fail when the median import time is above this")
+    args = parser.parse_args()
+
+    times = list()
+    loaded = set()
+
+    for _ in range(args.runs):
+        ms, modules = measure(args.module)
+        times.append(ms)
+        loaded.update(modules)
+
+    result = {
+        "benchmark": "import_time",
+        "module": args.module,
+        "runs": args.runs,
+        "median_ms": statistics.median(times),
+        "min_ms": min(times),
+        "max_ms": max(times),
+        "eager_heavy_modules": sorted(loaded)
+    }
+
+    print(json.dumps(result))
+
+    if len(loaded) > 0:
+        sys.exit(f"heavy modules imported eagerly: {', '.join(sorted(loaded))}")
+
+    if args.max_ms is not None and result["median_ms"] > args.max_ms:
+        sys.exit(f"median import time {result['median_ms']:.1f}ms is above {args.max_ms}ms")
+
+if __name__ == "__main__":
+    main()
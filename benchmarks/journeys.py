@@ -0,0 +1,84 @@
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SerbiaTrainApi import Station
+from SerbiaTrainJourneys import JourneyPlanner
+
+def syntheticConnections(lines: int, trains_per_line: int, stops_per_line: int, seed: int = 0) -> list[tuple]:
+    #lines share stations so journeys need transfers, trains run both ways through the day
+    rng = random.Random(seed)
+    stations = list(Station)
+    hubs = rng.sample(stations, max(2, len(stations) // 20))
+    connections = list()
+    train_number = 1000
+
+    for _ in range(lines):
+        route = rng.sample(stations, stops_per_line - 2)
+        route.insert(rng.randrange(len(route) + 1), rng.choice(hubs))
+        route.insert(rng.randrange(len(route) + 1), rng.choice(hubs))
+        hops = [rng.randint(3, 15) for _ in range(len(route) - 1)]
+
+        for direction in (route, route[::-1]):
+            steps = hops if direction is route else hops[::-1]
+
+            for _ in range(trains_per_line):
+                t = rng.randrange(4 * 60, 23 * 60)
+                train_number += 1
+
+                for i in range(len(direction) - 1):
+                    connections.append((train_number, t, t + steps[i], direction[i], direction[i + 1]))
+                    t += steps[i] + 1
+
+    return connections
+
+def main():
+    parser = argparse.ArgumentParser(description="Connection Scan query latency over a synthetic day of the network")
+    parser.add_argument("--lines", type=int, default=60)
+    parser.add_argument("--trains-per-line", type=int, default=16)
+    parser.add_argument("--stops-per-line", type=int, default=15)
+    parser.add_argument("--queries", type=int, default=500)
+    args = parser.parse_args()
+
+    connections = syntheticConnections(args.lines, args.trains_per_line, args.stops_per_line)
+
+    started = time.perf_counter()
+    planner = JourneyPlanner(connections)
+    build = time.perf_counter() - started
+
+    rng = random.Random(1)
+    times = list()
+    found = 0
+
+    for _ in range(args.queries):
+        origin, destination = rng.sample(planner.stations, 2)
+        departure = rng.randrange(5 * 60, 20 * 60)
+
+        started = time.perf_counter()
+        journey = planner.query(origin, destination, departure)
+        times.append((time.perf_counter() - started) * 1000)
+
+        found += journey is not None
+
+    times.sort()
+
+    print(json.dumps({
+        "benchmark": "journeys",
+        "connections": len(planner),
+        "stations": len(planner.stations),
+        "build_ms": build * 1000,
+        "queries": args.queries,
+        "found": found,
+        "p50_ms": statistics.median(times),
+        "p95_ms": times[int(len(times) * 0.95) - 1],
+        "max_ms": times[-1]
+    }))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+import os
+import sys
+import json
+import time
+import argparse
+import concurrent.futures
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SerbiaTrainApi import TrainDirection
+from SerbiaTrainPipeline import parseRows
+from synthetic import timetablePage
+
+def main():
+    parser = argparse.ArgumentParser(description="Parse throughput of the process parse pool by worker count")
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--rows", type=int, default=300)
+    parser.add_argument("--max-processes", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--parser", default="lxml")
+    args = parser.parse_args()
+
+    bodies = [timetablePage(args.rows, seed).encode("utf-8") for seed in range(args.pages)]
+    results = list()
+
+    for processes in range(1, args.max_processes + 1):
+        with concurrent.futures.ProcessPoolExecutor(max_workers=processes) as pool:
+            #warm the workers so process start up is not measured
+            list(pool.map(parseRows, bodies[:processes], ["utf-8"] * processes, [TrainDirection.INBOUND.value] * processes))
+
+            started = time.perf_counter()
+            rows = sum(map(len, pool.map(parseRows, bodies, ["utf-8"] * len(bodies), [TrainDirection.INBOUND.value] * len(bodies), [args.parser] * len(bodies), chunksize=4)))
+            elapsed = time.perf_counter() - started
+
+        results.append({"processes": processes, "seconds": elapsed, "pages_per_second": len(bodies) / elapsed, "rows_per_second": rows / elapsed})
+
+    for result in results:
+        result["speedup"] = result["pages_per_second"] / results[0]["pages_per_second"]
+
+    print(json.dumps({"benchmark": "parse_pool", "pages": args.pages, "rows_per_page": args.rows, "parser": args.parser, "results": results}))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+import os
+import sys
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SerbiaTrainApi import TrainApi, TrainDirection
+from synthetic import timetablePage
+from stub_server import PAGES_DIR
+
+#row counts of the synthetic pages, from a quiet halt up to the 999 row limit of the url
+SYNTHETIC_SIZES = {"small": 10, "medium": 80, "large": 300, "xlarge": 999}
+
+def main():
+    parser = argparse.ArgumentParser(description="Record timetable pages for the offline benchmarks")
+    parser.add_argument("--station", action="append", default=[], help="station id or name to record from the live site, repeatable")
+    parser.add_argument("--date", default=None, help="dd.mm.yyyy, today by default")
+    parser.add_argument("--synthetic", action="store_true", help="write synthetic pages instead of recording")
+    parser.add_argument("--output", default=PAGES_DIR)
+    args = parser.parse_args()
+
+    os.makedirs(args.output, exist_ok=True)
+
+    if args.synthetic:
+        for name, rows in SYNTHETIC_SIZES.items():
+            with open(os.path.join(args.output, f"synthetic_{name}.html"), "w", encoding="utf-8") as f:
+                f.write(timetablePage(rows, seed=rows))
+
+        return
+
+    import datetime
+    from SerbiaTrainCrawler import resolveStations
+
+    date = args.date or datetime.date.today().strftime("%d.%m.%Y")
+
+    with TrainApi() as api:
+        for station in resolveStations(args.station):
+            for dir_ in TrainDirection:
+                body, _ = api.getTimeTablePage(station, date, dir_)
+
+                with open(os.path.join(args.output, f"{station.name.lower()}_{dir_.name.lower()}.html"), "wb") as f:
+                    f.write(body)
+
+if __name__ == "__main__":
+    main()
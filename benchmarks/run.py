@@ -0,0 +1,226 @@
+import io
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import platform
+import datetime
+import statistics
+import subprocess
+import tracemalloc
+import concurrent.futures
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SerbiaTrainApi import TrainApi, TrainTransport, TrainException, TrainDirection, Station, TimeTable, ColumnarArrivals, DataclassJSONEncoder, PARSERS, parseArrivals, writeNDJSON
+from SerbiaTrainMetrics import PhaseTimings
+from stub_server import StubServer, loadPages
+
+DATE = "01.06.2025"
+
+def timed(fn, repeat: int) -> list[float]:
+    times = list()
+
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - started)
+
+    return times
+
+def percentile(values: list[float], p: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))]
+
+def benchParse(pages: dict[str, bytes], repeat: int) -> list[dict]:
+    results = list()
+
+    for name, body in pages.items():
+        text = body.decode("utf-8")
+        rows = len(parseArrivals(text, TrainDirection.INBOUND))
+
+        for parser in PARSERS:
+            seconds = statistics.median(timed(lambda: parseArrivals(text, TrainDirection.INBOUND, parser), repeat))
+            results.append({"page": name, "parser": parser, "rows": rows, "bytes": len(body), "ms": seconds * 1000, "us_per_row": seconds * 1e6 / max(rows, 1)})
+
+    return results
+
+def benchLatency(stub: StubServer, repeat: int) -> dict:
+    with TrainApi(web_base_url=stub.url, api_base_url=stub.url) as api:
+        api.getTimeTable(Station.BEOGRAD_CENTAR, DATE)
+        times = timed(lambda: api.getTimeTable(Station.BEOGRAD_CENTAR, DATE), repeat)
+        transport = api.transport.stats()
+
+    #separate instrumented run so the timings above are not affected by the observer
+    phases = PhaseTimings()
+
+    with TrainApi(web_base_url=stub.url, api_base_url=stub.url, observer=phases) as api:
+        for _ in range(repeat):
+            api.getTimeTable(Station.BEOGRAD_CENTAR, DATE)
+
+    return {"requests": repeat, "p50_ms": percentile(times, 50) * 1000, "p95_ms": percentile(times, 95) * 1000, "max_ms": max(times) * 1000, "transport": transport, "phases": phases.summary()}
+
+def benchThroughput(stub: StubServer, levels: list[int], stations: int) -> list[dict]:
+    jobs = list(Station)[:stations]
+    results = list()
+
+    for level in levels:
+        with TrainApi(transport=TrainTransport(pool_size=level), web_base_url=stub.url, api_base_url=stub.url, max_workers=level) as api:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=level) as executor:
+                started = time.perf_counter()
+                rows = sum(len(t.Arrivals) for t in executor.map(lambda s: api.getTimeTable(s, DATE), jobs))
+                elapsed = time.perf_counter() - started
+
+        results.append({"client": "threads", "concurrency": level, "timetables": len(jobs), "seconds": elapsed, "timetables_per_second": len(jobs) / elapsed, "rows_per_second": rows / elapsed})
+
+    try:
+        from SerbiaTrainApiAsync import AsyncTrainApi
+    except ImportError:
+        return results
+
+    async def runAsync(level: int) -> tuple[int, float]:
+        async with AsyncTrainApi(web_base_url=stub.url, api_base_url=stub.url, pool_size=level, concurrency=level) as api:
+            started = time.perf_counter()
+            rows = 0
+
+            async for timetable in api.getTimeTables(jobs, [DATE]):
+                rows += len(timetable.Arrivals)
+
+            return rows, time.perf_counter() - started
+
+    for level in levels:
+        rows, elapsed = asyncio.run(runAsync(level))
+        results.append({"client": "asyncio", "concurrency": level, "timetables": len(jobs), "seconds": elapsed, "timetables_per_second": len(jobs) / elapsed, "rows_per_second": rows / elapsed})
+
+    return results
+
+def benchFaults(pages: dict[str, bytes], requests: int, latency: float) -> list[dict]:
+    #same seeded faults for every client, so only the transport settings differ
+    clients = {
+        "plain": dict(retries=0),
+        "retries": dict(retries=2, backoff=0.01),
+        "retries_hedged": dict(retries=2, backoff=0.01, hedge=True, hedge_delay=latency * 5)
+    }
+    results = list()
+
+    for name, settings in clients.items():
+        with StubServer(pages=pages, latency=latency, error_rate=0.05, stall_rate=0.05, stall=0.5, seed=1) as stub:
+            with TrainApi(transport=TrainTransport(**settings), web_base_url=stub.url, api_base_url=stub.url) as api:
+                times = list()
+                failures = 0
+
+                for _ in range(requests):
+                    started = time.perf_counter()
+
+                    try:
+                        api.getTimeTable(Station.BEOGRAD_CENTAR, DATE, TrainDirection.INBOUND)
+                    except TrainException:
+                        failures += 1
+
+                    times.append(time.perf_counter() - started)
+
+                transport = api.transport.stats()
+
+            results.append({"client": name, "requests": requests, "failures": failures, "p50_ms": percentile(times, 50) * 1000, "p95_ms": percentile(times, 95) * 1000, "p99_ms": percentile(times, 99) * 1000, "faults": dict(stub.faults), "transport": transport})
+
+    return results
+
+def benchMemory(pages: dict[str, bytes]) -> list[dict]:
+    results = list()
+
+    for name, body in pages.items():
+        arrivals = parseArrivals(body.decode("utf-8"), TrainDirection.INBOUND)
+
+        for layout in ("list", "columnar"):
+            #copies so only the new timetable is measured, not the parse
+            tracemalloc.start()
+
+            if layout == "list":
+                timetable = TimeTable(LastUpdated="", Arrivals=[a.__class__(a.TrainNumber, a.ArrivalTime, a.DepartureTime, a.Direction, a.Note, a.IsLate, a.TrainType) for a in arrivals], Station=Station.BEOGRAD_CENTAR)
+            else:
+                timetable = TimeTable(LastUpdated="", Arrivals=ColumnarArrivals.fromArrivals(arrivals), Station=Station.BEOGRAD_CENTAR)
+
+            size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+
+            results.append({"page": name, "layout": layout, "rows": len(timetable.Arrivals), "bytes": size, "bytes_per_row": size / max(len(arrivals), 1)})
+
+    return results
+
+def benchJSON(pages: dict[str, bytes], repeat: int) -> list[dict]:
+    results = list()
+
+    for name, body in pages.items():
+        timetable = TimeTable(LastUpdated="", Arrivals=parseArrivals(body.decode("utf-8"), TrainDirection.INBOUND), Station=Station.BEOGRAD_CENTAR, Date=DATE)
+
+        cases = {
+            "asdict_encoder": lambda: json.dumps(timetable, cls=DataclassJSONEncoder),
+            "toJSON": lambda: timetable.toJSON(),
+            "toJSON_compact": lambda: timetable.toJSON(compact=True),
+            "ndjson": lambda: writeNDJSON([timetable], io.StringIO())
+        }
+
+        for case, fn in cases.items():
+            results.append({"page": name, "case": case, "rows": len(timetable.Arrivals), "ms": statistics.median(timed(fn, repeat)) * 1000})
+
+    return results
+
+def version() -> str:
+    try:
+        return subprocess.run(["git", "describe", "--always", "--dirty"], cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline benchmark suite, no network needed")
+    parser.add_argument("--output", default=None, help="write results as JSON here, stdout by default")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.02, help="simulated upstream latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--stations", type=int, default=64, help="timetables per throughput run")
+    parser.add_argument("--only", nargs="+", choices=["parse", "latency", "throughput", "memory", "json", "faults"], default=None)
+    args = parser.parse_args()
+
+    selected = set(args.only or ["parse", "latency", "throughput", "memory", "json", "faults"])
+    pages = loadPages()
+    results = {
+        "version": version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "config": vars(args)
+    }
+
+    if "parse" in selected:
+        results["parse"] = benchParse(pages, args.repeat)
+
+    if "memory" in selected:
+        results["memory"] = benchMemory(pages)
+
+    if "json" in selected:
+        results["json"] = benchJSON(pages, args.repeat)
+
+    if "faults" in selected:
+        results["faults"] = benchFaults(pages, args.repeat * 10, args.latency)
+
+    if selected & {"latency", "throughput"}:
+        with StubServer(pages=pages, latency=args.latency, jitter=args.jitter) as stub:
+            if "latency" in selected:
+                results["latency"] = benchLatency(stub, args.repeat)
+
+            if "throughput" in selected:
+                results["throughput"] = benchThroughput(stub, args.concurrency, args.stations)
+
+    out = json.dumps(results, indent=1)
+
+    if args.output is None:
+        print(out)
+    else:
+        with open(args.output, "w") as f:
+            f.write(out)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+import os
+import sys
+import gzip
+import json
+import time
+import random
+import argparse
+import threading
+import http.server
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+PAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pages")
+
+def loadPages(directory: str = PAGES_DIR) -> dict[str, bytes]:
+    pages = dict()
+
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".html"):
+            with open(os.path.join(directory, name), "rb") as f:
+                pages[name[:-len(".html")]] = f.read()
+
+    return pages
+
+FAULTS = ("error", "stall", "drop")
+
+class StubServer:
+    #local stand-in for w3.srbvoz.rs, serves recorded pages with configurable latency and injected faults
+    def __init__(self, pages: dict[str, bytes] | None = None, page: str | None = None, latency: float = 0, jitter: float = 0, host: str = "127.0.0.1", port: int = 0, error_rate: float = 0, error_status: int = 503, stall_rate: float = 0, stall: float = 1, drop_rate: float = 0, seed: int | None = None):
+        self.pages = loadPages() if pages is None else pages
+        #serve this page for every timetable url, otherwise one is picked per station id
+        self.page = page
+        self.latency = latency
+        self.jitter = jitter
+        self.requests = 0
+        self._lock = threading.Lock()
+
+        #error answers with error_status, stall adds stall seconds before answering, drop closes the connection without an answer
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.stall_rate = stall_rate
+        self.stall = stall
+        self.drop_rate = drop_rate
+        self.random = random.Random(seed)
+        self.faults = dict.fromkeys(FAULTS, 0)
+        self._scripted: list[str | None] = []
+
+        stub = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            #headers and body go out in separate writes, with Nagle on each response waits for a delayed ACK
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                stub._handle(self)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = http.server.ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubServer":
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def inject(self, *faults: str | None):
+        #the next requests get these faults in order before any random ones, None lets one through
+        for fault in faults:
+            if fault is not None and fault not in FAULTS:
+                raise ValueError(f"Unknown fault: {fault}, expected one of {', '.join(FAULTS)}")
+
+        with self._lock:
+            self._scripted.extend(faults)
+
+    def _nextFault(self) -> str | None:
+        with self._lock:
+            self.requests += 1
+
+            if len(self._scripted) > 0:
+                fault = self._scripted.pop(0)
+            else:
+                roll = self.random.random()
+                fault = None
+
+                for name, rate in (("error", self.error_rate), ("stall", self.stall_rate), ("drop", self.drop_rate)):
+                    if roll < rate:
+                        fault = name
+                        break
+
+                    roll -= rate
+
+            if fault is not None:
+                self.faults[fault] += 1
+
+            return fault
+
+    def pageFor(self, path: str) -> bytes:
+        if self.page is not None:
+            return self.pages[self.page]
+
+        names = sorted(self.pages)
+        #/stanicni/<safe name>/<id>/<date>/0000/<dolazak|polazak>/999/sr
+        parts = [p for p in path.split("/") if p]
+        station_id = parts[parts.index("stanicni") + 2] if "stanicni" in parts and len(parts) > parts.index("stanicni") + 2 else path
+
+        return self.pages[names[sum(map(ord, station_id)) % len(names)]]
+
+    def respond(self, handler: http.server.BaseHTTPRequestHandler, status: int, body: bytes, content_type: str):
+        if "gzip" in handler.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body, compresslevel=5)
+            encoding = "gzip"
+        else:
+            encoding = None
+
+        handler.send_response(status)
+        handler.send_header("Content-Type", content_type)
+        handler.send_header("Content-Length", str(len(body)))
+
+        if encoding is not None:
+            handler.send_header("Content-Encoding", encoding)
+
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def _handle(self, handler: http.server.BaseHTTPRequestHandler):
+        fault = self._nextFault()
+        delay = self.latency + (random.uniform(0, self.jitter) if self.jitter > 0 else 0)
+
+        if fault == "stall":
+            delay += self.stall
+
+        if delay > 0:
+            time.sleep(delay)
+
+        if fault == "drop":
+            handler.close_connection = True
+            return
+
+        if fault == "error":
+            self.respond(handler, self.error_status, b"injected failure", "text/plain; charset=utf-8")
+            return
+
+        if "/stanica/" in handler.path:
+            from SerbiaTrainApi import Station
+
+            body = json.dumps([{"naziv": s.value["name"], "sifra": s.value["id"]} for s in Station]).encode("utf-8")
+            self.respond(handler, 200, body, "application/json; charset=utf-8")
+        elif "/stanicni/" in handler.path:
+            self.respond(handler, 200, self.pageFor(handler.path), "text/html; charset=utf-8")
+        else:
+            self.respond(handler, 404, b"not found", "text/plain; charset=utf-8")
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve recorded timetable pages locally")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0, help="seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0, help="up to this many extra seconds per response")
+    parser.add_argument("--page", default=None, help="always serve this recorded page")
+    parser.add_argument("--error-rate", type=float, default=0, help="share of requests answered with --error-status")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--stall-rate", type=float, default=0, help="share of requests delayed by --stall seconds")
+    parser.add_argument("--stall", type=float, default=1)
+    parser.add_argument("--drop-rate", type=float, default=0, help="share of connections closed without an answer")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    stub = StubServer(page=args.page, latency=args.latency, jitter=args.jitter, port=args.port, error_rate=args.error_rate, error_status=args.error_status, stall_rate=args.stall_rate, stall=args.stall, drop_rate=args.drop_rate, seed=args.seed)
+    print(f"serving {len(stub.pages)} pages on {stub.url}")
+
+    try:
+        stub.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
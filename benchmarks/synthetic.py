@@ -0,0 +1,36 @@
+import random
+
+#column layout of the "stanicni" results table
+HEADERS = ("Broj voza", "Rang", "Vreme dolaska", "Vreme polaska", "Kasni", "Napomena", "")
+RANGS = ("BG:VOZ", "REGIO VOZ", "BRZI VOZ", "REGIO EXPRES")
+
+def timetablePage(rows: int, seed: int = 0) -> str:
+    #synthetic page shaped like w3.srbvoz.rs/redvoznje/stanicni results
+    rng = random.Random(seed)
+    out = [
+        '<!DOCTYPE html><html><head><meta charset="utf-8"><title>Red vožnje</title></head><body>',
+        '<div id="rezultati"><table>',
+        '<tr class="tsmall">' + "".join(f"<th>{h}</th>" for h in HEADERS) + "</tr>"
+    ]
+
+    for i in range(rows):
+        arrival = rng.randrange(24 * 60)
+        departure = (arrival + rng.randint(0, 5)) % (24 * 60)
+        late = rng.choice(("", "", "", f"{rng.randint(1, 40)} min"))
+        note = rng.choice(("", "Saobraća radnim danima", "Ne saobraća nedeljom", "Voz za Niš"))
+
+        out.append(
+            '<tr class="tsmall">'
+            f"<td>{rng.randint(100, 9999)}</td>"
+            f'<td><img src="/img/rang.png" title="{rng.choice(RANGS)}"></td>'
+            f"<td>{arrival // 60:02d}:{arrival % 60:02d}</td>"
+            f"<td>{departure // 60:02d}:{departure % 60:02d}</td>"
+            f"<td>{late}</td>"
+            f"<td>{note}</td>"
+            '<td><a href="#">Detalji</a></td>'
+            "</tr>"
+        )
+
+    out.append("</table></div></body></html>")
+
+    return "".join(out)